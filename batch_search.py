@@ -0,0 +1,146 @@
+import argparse
+import itertools
+import queue
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from job_store import open_store
+from linkedin_job_tracker import LinkedInJobTracker
+
+class BatchSearch:
+    """Search every title x location x job type combination, fetching each unique posting once
+
+    All queries share one HTTP session, one detail worker pool and one dedup set (the primary
+    tracker's), so overlapping searches like "ML Engineer" and "Machine Learning" only cost a
+    search request per page plus one detail request per unique job.
+    """
+    def __init__(self, titles, locations, job_types=(None,), max_parallel_searches=4, **tracker_kwargs):
+        self.queries = list(itertools.product(titles, locations, job_types or (None,)))
+        self.max_parallel_searches = max_parallel_searches
+        self.tracker = LinkedInJobTracker(*self.queries[0], **tracker_kwargs)
+
+        # The per-query trackers only run searches; they reuse the primary tracker's HTTP session
+        search_kwargs = {key: value for key, value in tracker_kwargs.items()
+                         if key not in ('http_client', 'response_cache', 'request_budget')}
+        self.search_trackers = [LinkedInJobTracker(*query, http_client=self.tracker.http, **search_kwargs)
+                                for query in self.queries]
+        for tracker in self.search_trackers:
+            tracker.fetcher.shutdown(wait=False)  # Details go through the primary tracker's pool
+        self.found = defaultdict(int)    # query -> job IDs its search returned
+        self.matches = defaultdict(list)  # job ID -> labels of the queries that found it
+
+    @property
+    def job_list(self):
+        return self.tracker.job_list
+
+    @property
+    def seen_stats(self):
+        return self.tracker.seen_stats
+
+    @staticmethod
+    def label(query):
+        title, location, job_type = query
+        return " / ".join(part for part in (title, location, job_type) if part)
+
+    def iter_search_pages(self, num_pages=3, max_age_days=None):
+        """Yield (query, page_ids) for each results page of every query as pages arrive"""
+        pages = queue.Queue()
+
+        def search(query, tracker):
+            try:
+                for page_ids in tracker.iter_search_pages(num_pages, max_age_days):
+                    pages.put((query, page_ids))
+            finally:
+                pages.put(None)
+
+        with ThreadPoolExecutor(max_workers=self.max_parallel_searches) as executor:
+            for query, tracker in zip(self.queries, self.search_trackers):
+                executor.submit(search, query, tracker)
+
+            finished = 0
+            while finished < len(self.queries):
+                item = pages.get()
+                if item is None:
+                    finished += 1
+                else:
+                    yield item
+
+    def _page_ids(self, num_pages, max_age_days):
+        for query, page_ids in self.iter_search_pages(num_pages, max_age_days):
+            self.found[query] += len(page_ids)
+            for job_id in page_ids:
+                self.matches[job_id].append(self.label(query))
+            yield page_ids
+
+    def iter_jobs(self, num_pages=3, max_age_days=None, on_page=None):
+        """Search all queries and extract each unique job once, yielding jobs as they are parsed"""
+        return self.tracker.iter_jobs(num_pages, max_age_days, on_page=on_page,
+                                      pages=self._page_ids(num_pages, max_age_days))
+
+    def cancel(self):
+        for tracker in [self.tracker] + self.search_trackers:
+            tracker.cancel()
+
+    def pause(self):
+        for tracker in [self.tracker] + self.search_trackers:
+            tracker.pause()
+
+    def resume(self):
+        for tracker in [self.tracker] + self.search_trackers:
+            tracker.resume()
+
+    @property
+    def cancelled(self):
+        return self.tracker.cancelled
+
+    @property
+    def paused(self):
+        return self.tracker.paused
+
+    def print_report(self):
+        """Per-query result counts and how many detail fetches deduplication saved"""
+        print(f"\nBatch search over {len(self.queries)} queries:")
+        for query in self.queries:
+            print(f"  {self.label(query)}: {self.found[query]} job IDs")
+        total = sum(self.found.values())
+        print(f"{total} job IDs found, {len(self.matches)} unique, {len(self.job_list)} fetched")
+        self.tracker.print_seen_stats()
+        self.tracker.http.print_stats()
+
+    def save_to_store(self, store=None):
+        return self.tracker.save_to_store(store)
+
+    def save_to_csv(self, filename=None):
+        """Export the merged results to one CSV, noting which queries found each job"""
+        for job in self.job_list:
+            job['matched_queries'] = "; ".join(dict.fromkeys(self.matches.get(job['job_id'], [])))
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        return self.tracker.save_to_csv(filename or f"job_tracker/data/batch_{timestamp}.csv")
+
+    def run(self, num_pages=3, max_age_days=None, store=None, export_csv=False):
+        """Run every search, fetch the unique jobs and save them in one upsert"""
+        if store is not None:
+            self.tracker.store = store
+        for _ in self.iter_jobs(num_pages, max_age_days):
+            pass
+        self.print_report()
+        if export_csv:
+            self.save_to_csv()
+        return self.save_to_store(self.tracker.store)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Search LinkedIn for several titles, locations and job types at once")
+    parser.add_argument("--titles", nargs="+", required=True)
+    parser.add_argument("--locations", nargs="+", required=True)
+    parser.add_argument("--types", nargs="*", default=[None],
+                        help="LinkedIn job type codes: F (full-time), P, C, I; default any")
+    parser.add_argument("--pages", type=int, default=3, help="Maximum result pages per query")
+    parser.add_argument("--max-age-days", type=int, default=None)
+    parser.add_argument("--csv", action="store_true", help="Also export the merged results to one CSV")
+    args = parser.parse_args()
+
+    batch = BatchSearch(args.titles, args.locations, args.types or [None])
+    result = batch.run(num_pages=args.pages, max_age_days=args.max_age_days, store=open_store(),
+                       export_csv=args.csv)
+    if result:
+        print(f"Saved {result['inserted']} new and {result['updated']} refreshed jobs")
@@ -0,0 +1,82 @@
+"""Compare loading a year of job history from CSV and from the typed Parquet export.
+
+Run from the repository root:
+    python -m benchmarks.bench_archive
+"""
+import os
+import random
+import tempfile
+import time
+from datetime import date, timedelta
+import pandas as pd
+from job_archive import export_parquet, load_parquet
+from job_store import JobStore
+
+STATUSES = ['Not Applied'] * 6 + ['Applied', 'Interview Scheduled', 'Rejected', 'Offer Received']
+
+def make_jobs(count, seed=5):
+    rng = random.Random(seed)
+    start = date(2025, 1, 1)
+    jobs = []
+    for i in range(count):
+        posted = start + timedelta(days=rng.randint(0, 364))
+        status = rng.choice(STATUSES)
+        jobs.append({
+            'job_id': str(4200000000 + i),
+            'company': f"Company {rng.randint(1, 3000)}",
+            'job_title': rng.choice(['Data Analyst', 'Data Scientist', 'ML Engineer', 'Python Developer']),
+            'type': rng.choice(['Full-time', 'Contract', 'Part-time']),
+            'location': rng.choice(['Toronto, Ontario, Canada', 'Vancouver, British Columbia, Canada', 'Remote']),
+            'email': f"jobs{i}@example.com" if rng.random() < 0.3 else None,
+            'time_posted': f"{rng.randint(1, 30)} days ago",
+            'posting_date': posted.isoformat(),
+            'num_applicants': f"{rng.randint(1, 200)} applicants",
+            'work_mode': rng.choice(['Hybrid', 'Remote', None]),
+            'status': status,
+            'date_applied': (posted + timedelta(days=2)).isoformat() if status != 'Not Applied' else None,
+        })
+    return jobs
+
+def measure(func, repeat=3):
+    best = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        df = func()
+        seconds = time.perf_counter() - started
+        best = seconds if best is None else min(best, seconds)
+    return df, best
+
+def run(count=100000):
+    with tempfile.TemporaryDirectory() as tmp:
+        store = JobStore(os.path.join(tmp, "jobs.db"))
+        store.upsert_jobs(make_jobs(count))
+        csv_path = os.path.join(tmp, "jobs.csv")
+        store.load_dataframe().to_csv(csv_path, index=False)
+        parquet_path = export_parquet(store, os.path.join(tmp, "jobs.parquet"))
+
+        print(f"\n{count} jobs: CSV {os.path.getsize(csv_path) / 1e6:.1f} MB, "
+              f"Parquet {os.path.getsize(parquet_path) / 1e6:.1f} MB\n")
+        print(f"{'read':>40} {'ms':>8} {'rows':>7} {'memory MB':>10}")
+
+        since = date(2025, 12, 1)
+        cases = [
+            ("CSV, all columns", lambda: pd.read_csv(csv_path)),
+            ("Parquet, all columns", lambda: load_parquet(parquet_path)),
+            ("CSV, 4 columns", lambda: pd.read_csv(
+                csv_path, usecols=['job_id', 'company', 'status', 'posting_date'])),
+            ("Parquet, 4 columns", lambda: load_parquet(
+                parquet_path, columns=['job_id', 'company', 'status', 'posting_date'])),
+            ("CSV, status == Applied", lambda: (lambda df: df[df['status'] == 'Applied'])(pd.read_csv(csv_path))),
+            ("Parquet, status == Applied (pushdown)", lambda: load_parquet(parquet_path, status='Applied')),
+            ("CSV, posted since Dec 1", lambda: (lambda df: df[pd.to_datetime(df['posting_date']) >= pd.Timestamp(since)])(
+                pd.read_csv(csv_path))),
+            ("Parquet, posted since Dec 1 (pushdown)", lambda: load_parquet(parquet_path, posted_since=since)),
+        ]
+        for name, func in cases:
+            df, seconds = measure(func)
+            memory = df.memory_usage(deep=True).sum() / 1e6
+            print(f"{name:>40} {1000 * seconds:>8.1f} {len(df):>7} {memory:>10.1f}")
+        store.close()
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,47 @@
+"""Compare one tracker per query with a batch search that shares its pool and dedup set.
+
+Run from the repository root:
+    python -m benchmarks.bench_batch_search
+"""
+import contextlib
+import io
+import time
+from batch_search import BatchSearch
+from benchmarks.stub_server import StubLinkedInServer
+from linkedin_job_tracker import LinkedInJobTracker
+
+TITLES = ["ML Engineer", "Machine Learning", "ML AI Data Science"]
+LOCATIONS = ["Toronto", "Canada"]
+SETTINGS = dict(max_workers=8, requests_per_second=1000, per_host_limit=8, page_delay=(0.1, 0.1))
+
+def separate_trackers(base_url, num_pages):
+    """What running the CLI or GUI once per query does"""
+    jobs = []
+    for title in TITLES:
+        for location in LOCATIONS:
+            tracker = LinkedInJobTracker(title, location, base_url=base_url, **SETTINGS)
+            jobs.extend(tracker.iter_jobs(num_pages))
+    return len(jobs), len({job['job_id'] for job in jobs})
+
+def batch(base_url, num_pages):
+    search = BatchSearch(TITLES, LOCATIONS, base_url=base_url, **SETTINGS)
+    jobs = list(search.iter_jobs(num_pages))
+    return len(jobs), len({job['job_id'] for job in jobs})
+
+def run(num_pages=3):
+    queries = len(TITLES) * len(LOCATIONS)
+    print(f"{queries} queries, {num_pages} pages each\n")
+    print(f"{'query results':>15} {'mode':>18} {'fetched':>8} {'unique':>7} {'requests':>9} {'seconds':>8}")
+    for label, vary in (("identical", False), ("disjoint", True)):
+        with StubLinkedInServer(latency=0.03, total_jobs=num_pages * 25, vary_by_query=vary) as server:
+            for name, func in (("tracker per query", separate_trackers), ("batch search", batch)):
+                requests_before = server.request_count
+                started = time.perf_counter()
+                with contextlib.redirect_stdout(io.StringIO()):
+                    fetched, unique = func(server.base_url, num_pages)
+                seconds = time.perf_counter() - started
+                print(f"{label:>15} {name:>18} {fetched:>8} {unique:>7} "
+                      f"{server.request_count - requests_before:>9} {seconds:>8.2f}")
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,148 @@
+"""Prompt tokens of the notebook's whole-page text vs. the posting body trimmed to a token budget.
+
+"correct" is the share of pages where the stub model extracts the same skills and experience
+as from the bare posting.
+
+Pages are the fixture postings padded with what real LinkedIn pages carry around and inside the
+description: a sign-in modal, a company blurb, benefits, an EEO statement and more similar jobs.
+Stored descriptions (the bare postings, as ExtractionPipeline trims them) must not lose text to
+the page markers even when they mention "Sign in", "Easy Apply" or "30+ days ago", and must keep
+their section breaks when the page's markup was minified.
+
+Run from the repository root:
+    python -m benchmarks.bench_description_trim
+"""
+import glob
+import json
+import os
+import random
+import re
+import statistics
+import time
+from benchmarks.stub_llm import StubChatModel
+from description_trim import _html_text, estimate_tokens, trim_description
+from job_extraction import EXTRACTION_PROMPT, parse_extraction
+from posting_parser import parse_job_posting
+
+FIXTURE_DIR = os.path.join(os.path.dirname(__file__), "fixtures")
+
+SIGN_IN_MODAL = """
+<div class="sign-up-modal">
+  <h2>Join or sign in to find your next job</h2>
+  <p>Join to apply for this role. Not you? Remove photo. First name Last name Email Password (8+ characters)</p>
+  <p>By clicking Agree &amp; Join, you agree to the LinkedIn User Agreement, Privacy Policy and Cookie Policy.</p>
+  <p>Continue. Agree &amp; Join or Apply on company website. Security verification. Already on LinkedIn? Sign in</p>
+  <p>Save this job with your existing LinkedIn profile, or create a new one. Your job seeking activity is only
+  visible to you. Email Continue Welcome back. Forgot password? Sign in. You may also apply directly on company
+  website.</p>
+</div>
+"""
+
+BLURB = ("<br><br><strong>About {company}</strong><br>{company} has served customers across Canada for over "
+         "{years} years. Our {size} employees share a commitment to innovation, sustainability and community. "
+         "We have been recognized as one of Canada's Top Employers {awards} years in a row and are proud of our "
+         "award-winning culture, our leadership in responsible technology and our many partnerships. ")
+BENEFITS = ["Comprehensive health, dental and vision coverage from day one", "RRSP matching up to 6%",
+            "Four weeks of paid vacation plus personal days", "Annual learning and development budget",
+            "Hybrid work with a home-office stipend", "Employee share purchase plan", "Parental leave top-up",
+            "Wellness and fitness reimbursement", "Employee discounts across our brands"]
+EEO = ("<br><br>{company} is an equal opportunity employer. All qualified applicants will receive consideration "
+       "for employment regardless of race, colour, religion, gender, sexual orientation, age or disability. "
+       "We provide reasonable accommodations throughout the hiring process; contact our talent team to request "
+       "one. By applying you consent to our candidate privacy notice.")
+# Posting text that looks like page chrome but isn't
+CHROME_LIKE = ("Responsibilities: Own the Sign in and Easy Apply flows of our careers site. Show more "
+               "listings to returning candidates and flag postings from 30+ days ago. Set the Seniority level "
+               "of each role in the ATS.")
+
+# Requirements under a heading that looks like a company blurb
+ABOUT_YOU = ("About the role\nWe build data pipelines for retail.\nAbout You\n- 5 years of Python\n"
+             "- Spark and Airflow\nAbout Acme Corp\nAcme has stores across Canada.")
+
+SIMILAR_JOB = ('<li><div class="base-card"><h3>{title}</h3><h4>{company}</h4><span>Toronto, ON</span>'
+               '<time>{days} days ago</time></div></li>')
+
+def make_pages(count, seed=5):
+    """Padded pages, each with the unpadded description of the fixture it came from"""
+    rng = random.Random(seed)
+    fixtures = [open(path, encoding="utf-8").read()
+                for path in sorted(glob.glob(os.path.join(FIXTURE_DIR, "job_posting_*.html")))]
+    pages = []
+    for n in range(count):
+        html = rng.choice(fixtures)
+        description = parse_job_posting(html).description
+        company = f"Company {n}"
+        extra = BLURB.format(company=company, years=rng.randint(20, 120), size=f"{rng.randint(2, 120)},000",
+                             awards=rng.randint(2, 9))
+        extra += "<br><br><strong>Benefits</strong><ul>" + "".join(
+            f"<li>{benefit}</li>" for benefit in rng.sample(BENEFITS, rng.randint(4, 8))) + "</ul>"
+        extra += EEO.format(company=company)
+        similar = "".join(SIMILAR_JOB.format(title=rng.choice(["Data Engineer", "ML Engineer", "Analyst"]),
+                                             company=f"Company {rng.randint(1, 999)}", days=rng.randint(1, 30))
+                          for _ in range(rng.randint(6, 15)))
+        html = re.sub(r"(\s*</div>\s*<button class=\"show-more-less-html__button)", lambda m: extra + m.group(1),
+                      html, count=1)
+        html = html.replace('<section class="core-section-container my-3 description">',
+                            SIGN_IN_MODAL + '<section class="core-section-container my-3 description">', 1)
+        html = html.replace('<ul class="similar-jobs__list">', '<ul class="similar-jobs__list">' + similar, 1)
+        pages.append((html, description))
+    return pages
+
+def minify(html):
+    """The same page without the whitespace between tags"""
+    return re.sub(r">\s+<", "><", html)
+
+def notebook_text(html):
+    """What WebBaseLoader plus the notebook's whitespace cleanup sends: all visible page text"""
+    return re.sub(r"\s+", " ", _html_text(html)).strip()
+
+def extraction(llm, text):
+    """Stub model reply (and its simulated seconds) for the extraction prompt over a text"""
+    message, seconds = llm._reply(EXTRACTION_PROMPT.format(page_data=text))
+    return parse_extraction(message.content), seconds
+
+def run(count=300):
+    pages, descriptions = zip(*make_pages(count))
+    texts = [notebook_text(page) for page in pages]
+    minified = [parse_job_posting(minify(page)).description for page in pages]
+    llm = StubChatModel()
+    # What the model finds in the bare posting is the reference answer
+    reference = [extraction(llm, description)[0] for description in descriptions]
+    baseline_tokens = [estimate_tokens(text) for text in texts]
+    print(f"{count} padded LinkedIn job pages, {statistics.mean(baseline_tokens):.0f} tokens of page text on average\n")
+    print(f"{'input':>32} {'avg tokens':>11} {'p95':>6} {'saved':>6} {'ms/page':>8} {'stub s/call':>12} "
+          f"{'correct':>8}")
+
+    def row(label, outputs, seconds):
+        tokens = [estimate_tokens(text) for text in outputs]
+        results = [extraction(llm, text) for text in outputs]
+        correct = sum(set(got['skills']) == set(want['skills']) and got['experience'] == want['experience']
+                      for (got, _), want in zip(results, reference)) / count
+        print(f"{label:>32} {statistics.mean(tokens):>11.0f} {sorted(tokens)[int(0.95 * count)]:>6} "
+              f"{1 - sum(tokens) / sum(baseline_tokens):>6.0%} {1000 * seconds / count:>8.3f} "
+              f"{statistics.mean(s for _, s in results):>12.3f} {correct:>8.0%}")
+
+    row("whole page text (notebook)", texts, 0)
+    for label, inputs, budget, is_page in (
+            ("page text, no budget", texts, None, True), ("page text, 600-token budget", texts, 600, True),
+            ("page HTML, 600-token budget", pages, 600, True), ("page HTML, 200-token budget", pages, 200, True),
+            ("stored description, 600 budget", descriptions, 600, False),
+            ("stored from minified HTML, 600", minified, 600, False)):
+        started = time.perf_counter()
+        trimmed = [trim_description(text, budget, page=is_page) for text in inputs]
+        row(label, [t.text for t in trimmed], time.perf_counter() - started)
+
+    kept = trim_description(CHROME_LIKE).text
+    print(f"\nStored description mentioning page chrome kept whole: {kept == CHROME_LIKE}")
+    about_you = trim_description(ABOUT_YOU)
+    print(f"\"About You\" requirements kept: {'About You' in about_you.kept} (dropped {about_you.dropped})")
+    sections = sum(len(trim_description(text).kept) > 1 for text in minified) / count
+    print(f"Descriptions stored from minified HTML with their sections found: {sections:.0%}")
+
+    sample = trim_description(pages[0])
+    print(f"First page: {sample.tokens_before} -> {sample.tokens_after} tokens, kept {sample.kept}, "
+          f"dropped {sample.dropped}")
+    print(json.dumps(sample.text)[:400])
+
+if __name__ == "__main__":
+    run()
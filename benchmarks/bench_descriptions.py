@@ -0,0 +1,95 @@
+"""Measure storage size and read speed of job descriptions kept inline vs. in the compressed table.
+
+Run from the repository root:
+    python -m benchmarks.bench_descriptions
+"""
+import os
+import random
+import sqlite3
+import tempfile
+import time
+import pandas as pd
+import job_store
+from benchmarks.bench_extraction import make_descriptions
+from job_store import JobStore
+
+METADATA_COLUMNS = ['job_id', 'company', 'job_title', 'status', 'posting_date']
+
+def make_jobs(count, seed=3):
+    rng = random.Random(seed)
+    descriptions = make_descriptions(count, seed=seed)
+    return [{
+        'job_id': str(4100000000 + i),
+        'company': f"Company {rng.randint(1, 2000)}",
+        'job_title': "Data Scientist",
+        'status': 'Not Applied',
+        'posting_date': f"2025-{rng.randint(1, 6):02d}-{rng.randint(1, 28):02d}",
+        'description': descriptions[i],
+    } for i in range(count)]
+
+def db_size(path, conn):
+    conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+    return sum(os.path.getsize(p) for p in (path, path + "-wal") if os.path.exists(p))
+
+def timed(func, repeat=1):
+    started = time.perf_counter()
+    for _ in range(repeat):
+        result = func()
+    return result, (time.perf_counter() - started) / repeat
+
+def run(count=20000, lookups=500):
+    jobs = make_jobs(count)
+    raw_mb = sum(len(job['description'].encode('utf-8')) for job in jobs) / 1e6
+    sample = [job['job_id'] for job in random.Random(1).sample(jobs, lookups)]
+    print(f"{count} jobs, {raw_mb:.1f} MB of description text\n")
+    print(f"{'storage':>26} {'file MB':>8} {'text MB':>8} {'metadata load ms':>17} {'description ms':>15}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        # CSV with the description column kept
+        path = os.path.join(tmp, "jobs.csv")
+        pd.DataFrame(jobs).to_csv(path, index=False)
+        _, load = timed(lambda: pd.read_csv(path, usecols=METADATA_COLUMNS))
+        df = pd.read_csv(path, dtype=str).set_index('job_id')
+        _, lookup = timed(lambda: [df.at[job_id, 'description'] for job_id in sample])
+        print(f"{'CSV with descriptions':>26} {os.path.getsize(path) / 1e6:>8.1f} {raw_mb:>8.1f} {1000 * load:>17.1f} "
+              f"{1000 * lookup / lookups:>15.4f}")
+
+        # Uncompressed TEXT column in the jobs table
+        path = os.path.join(tmp, "inline.db")
+        conn = sqlite3.connect(path)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("CREATE TABLE jobs (job_id TEXT PRIMARY KEY, company TEXT, job_title TEXT, status TEXT, "
+                     "posting_date TEXT, description TEXT)")
+        conn.executemany("INSERT INTO jobs VALUES (?, ?, ?, ?, ?, ?)",
+                         [(j['job_id'], j['company'], j['job_title'], j['status'], j['posting_date'], j['description'])
+                          for j in jobs])
+        conn.commit()
+        _, load = timed(lambda: pd.read_sql_query(
+            f"SELECT {', '.join(METADATA_COLUMNS)} FROM jobs ORDER BY posting_date DESC, job_id", conn), 3)
+        _, lookup = timed(lambda: [conn.execute("SELECT description FROM jobs WHERE job_id = ?", (job_id,)).fetchone()
+                                   for job_id in sample])
+        print(f"{'SQLite inline TEXT':>26} {db_size(path, conn) / 1e6:>8.1f} {raw_mb:>8.1f} {1000 * load:>17.1f} "
+              f"{1000 * lookup / lookups:>15.4f}")
+        conn.close()
+
+        # The job store's compressed description table, with each available codec
+        codecs = [('zlib', None)] + ([('zstd', job_store.zstandard)] if job_store.zstandard else [])
+        installed = job_store.zstandard
+        for codec, module in codecs:
+            job_store.zstandard = module
+            path = os.path.join(tmp, f"{codec}.db")
+            store = JobStore(path)
+            store.upsert_jobs(jobs)
+            _, load = timed(lambda: store.load_dataframe(columns=METADATA_COLUMNS), 3)
+            stored_mb = store.description_stats()['stored_bytes'] / 1e6
+            _, lookup = timed(lambda: [store.get_description(job_id) for job_id in sample])
+            print(f"{'job store, ' + codec + ' blobs':>26} {db_size(path, store.conn) / 1e6:>8.1f} {stored_mb:>8.1f} "
+                  f"{1000 * load:>17.1f} {1000 * lookup / lookups:>15.4f}")
+            store.close()
+        job_store.zstandard = installed
+
+    print("\n(the job store files also hold its other tables and indexes; text MB is the description payload;"
+          "\n description ms is one lookup by job ID)")
+
+if __name__ == "__main__":
+    run()
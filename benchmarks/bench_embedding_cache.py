@@ -0,0 +1,67 @@
+"""Measure model calls and time saved by the persistent embedding cache.
+
+Run from the repository root:
+    python -m benchmarks.bench_embedding_cache
+"""
+import random
+import tempfile
+import time
+import numpy as np
+from benchmarks.bench_portfolio_index import TECHNOLOGIES, make_portfolio
+from benchmarks.stub_embeddings import StubEmbeddingFunction
+from embedding_cache import EmbeddingCache
+
+SKILL_TEMPLATES = ["{}", "Experience with {}", "Strong knowledge of {}", "{} in production", "Hands-on {} skills"]
+
+def make_job_skills(jobs, seed=21):
+    """Skill lists drawn from a skewed vocabulary, so common skills repeat across jobs as in real postings"""
+    rng = random.Random(seed)
+    vocabulary = [template.format(tech) for tech in TECHNOLOGIES for template in SKILL_TEMPLATES]
+    weights = [1 / (rank + 1) for rank in range(len(vocabulary))]
+    return [rng.choices(vocabulary, weights, k=rng.randint(4, 10)) for _ in range(jobs)]
+
+def timed(func):
+    started = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - started
+
+def row(name, seconds, model):
+    print(f"{name:>44} {seconds:>8.2f} {model.calls:>12} {model.texts:>14}")
+
+def run(portfolio_rows=2000, jobs=500):
+    documents = list(make_portfolio(portfolio_rows)['Techstack'])
+    job_skills = make_job_skills(jobs)
+    skills = [skill for job in job_skills for skill in job]
+    print(f"{portfolio_rows} portfolio rows ({len(set(documents))} distinct), {jobs} jobs with "
+          f"{len(skills)} skills ({len(set(skills))} distinct)\n")
+    print(f"{'workload':>44} {'s':>8} {'model calls':>12} {'texts embedded':>14}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        # Portfolio re-index: the collection embeds every document in batches of 64, every time
+        model = StubEmbeddingFunction()
+        expected, seconds = timed(lambda: np.vstack([model(documents[i:i + 64])
+                                                     for i in range(0, len(documents), 64)]))
+        row("re-index, no cache", seconds, model)
+        for label in ("re-index, cold cache", "re-index, warm cache (new process)"):
+            model = StubEmbeddingFunction()
+            vectors, seconds = timed(lambda: EmbeddingCache(model, directory=tmp).embed(documents))
+            row(label, seconds, model)
+            assert np.allclose(vectors, expected)
+
+        # Skill queries: the notebook embeds each skill's query text separately
+        model = StubEmbeddingFunction()
+        _, seconds = timed(lambda: [model([skill]) for skill in skills])
+        row("skill queries, one embedding per query", seconds, model)
+        model = StubEmbeddingFunction()
+        cache = EmbeddingCache(model, directory=tmp)
+        _, seconds = timed(lambda: [cache([skill]) for skill in skills])
+        row("skill queries, cached per query", seconds, model)
+        model = StubEmbeddingFunction()
+        _, seconds = timed(lambda: EmbeddingCache(model, directory=tmp).embed(skills))
+        row("skill queries, warm cache, one batch", seconds, model)
+
+        print()
+        cache.print_stats()
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,98 @@
+"""Compare the combined description scanner with the previous per-pattern regex helpers.
+
+Run from the repository root:
+    python -m benchmarks.bench_extraction
+"""
+import glob
+import os
+import random
+import re
+import time
+from posting_parser import parse_job_posting
+from text_extraction import extract_description_fields
+
+FIXTURE_DIR = os.path.join(os.path.dirname(__file__), "fixtures")
+
+EXTRA_SENTENCES = [
+    "Please contact Alex Chen at careers{n}@example.com for details.",
+    "Apply by July {d}, 2025 through our careers portal.",
+    "Closing date: August {d}, 2025.",
+    "Salary: ${lo},000 - ${hi},000 per year.",
+    "This position is fully remote within Canada.",
+    "We offer a hybrid schedule with two office days.",
+    "Send your resume to Maria Gomez before the end of the month.",
+    "Our team values collaboration, ownership and continuous learning.",
+    "You will partner with product managers to ship features every sprint.",
+]
+
+def legacy_extract(text):
+    """The regex work _extract_email, _extract_deadline and _extract_contact_info used to do"""
+    email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
+    emails = re.findall(email_pattern, text)
+
+    deadline = None
+    for pattern in [
+        r'application deadline[:\s]*([A-Za-z]+\s+\d{1,2}(?:st|nd|rd|th)?[\s,]+\d{4})',
+        r'apply by[:\s]*([A-Za-z]+\s+\d{1,2}(?:st|nd|rd|th)?[\s,]+\d{4})',
+        r'closing date[:\s]*([A-Za-z]+\s+\d{1,2}(?:st|nd|rd|th)?[\s,]+\d{4})',
+        r'applications close[:\s]*([A-Za-z]+\s+\d{1,2}(?:st|nd|rd|th)?[\s,]+\d{4})',
+        r'deadline[:\s]*([A-Za-z]+\s+\d{1,2}(?:st|nd|rd|th)?[\s,]+\d{4})',
+        r'applications due[:\s]*([A-Za-z]+\s+\d{1,2}(?:st|nd|rd|th)?[\s,]+\d{4})'
+    ]:
+        match = re.search(pattern, text, re.IGNORECASE)
+        if match:
+            deadline = match.group(1)
+            break
+
+    emails_again = re.findall(email_pattern, text)
+    contact = None
+    for pattern in [
+        r'contact\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+){1,2})',
+        r'reach out to\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+){1,2})',
+        r'email\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+){1,2})',
+        r'send.*resume.*to\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+){1,2})'
+    ]:
+        match = re.search(pattern, text, re.IGNORECASE)
+        if match:
+            contact = match.group(1)
+            break
+
+    return deadline, contact, emails or emails_again
+
+def make_descriptions(count, seed=7):
+    """Build a corpus of descriptions from the fixtures plus random extra sentences"""
+    rng = random.Random(seed)
+    bases = []
+    for path in sorted(glob.glob(os.path.join(FIXTURE_DIR, "job_posting_*.html"))):
+        with open(path, encoding="utf-8") as f:
+            bases.append(parse_job_posting(f.read()).description)
+
+    descriptions = []
+    for n in range(count):
+        extras = rng.sample(EXTRA_SENTENCES, 3)
+        extras = [s.format(n=n, d=rng.randint(1, 28), lo=rng.randint(60, 90), hi=rng.randint(95, 150)) for s in extras]
+        descriptions.append(" ".join([rng.choice(bases)] + extras))
+    return descriptions
+
+def run(count=5000):
+    descriptions = make_descriptions(count)
+    total_mb = sum(len(d) for d in descriptions) / 1e6
+    print(f"{count} descriptions, {total_mb:.1f} MB of text\n")
+
+    started = time.perf_counter()
+    for text in descriptions:
+        legacy_extract(text)
+    legacy = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for text in descriptions:
+        extract_description_fields(text)
+    combined = time.perf_counter() - started
+
+    print(f"{'extractor':>26} {'seconds':>8} {'docs/s':>9}")
+    print(f"{'legacy (10 patterns)':>26} {legacy:>8.2f} {count / legacy:>9.0f}")
+    print(f"{'combined single scan':>26} {combined:>8.2f} {count / combined:>9.0f}")
+    print("\n(the combined scan also returns salary and remote/hybrid flags)")
+
+if __name__ == "__main__":
+    run()
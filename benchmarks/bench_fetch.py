@@ -0,0 +1,34 @@
+"""Measure job detail throughput against a local stub server as the worker count grows.
+
+Run from the repository root:
+    python -m benchmarks.bench_fetch
+"""
+import time
+from benchmarks.stub_server import StubLinkedInServer
+from linkedin_job_tracker import LinkedInJobTracker
+
+def run(worker_counts=(1, 2, 4, 8, 16), num_jobs=80, latency=0.05):
+    job_ids = [str(1000000 + i) for i in range(num_jobs)]
+
+    with StubLinkedInServer(latency=latency) as server:
+        print(f"Fetching {num_jobs} jobs, {latency * 1000:.0f} ms simulated latency per request\n")
+        print(f"{'workers':>8} {'seconds':>10} {'jobs/s':>10}")
+
+        for workers in worker_counts:
+            tracker = LinkedInJobTracker(
+                "Python Developer", "Toronto",
+                max_workers=workers,
+                requests_per_second=1000,
+                per_host_limit=workers,
+                base_url=server.base_url
+            )
+            started = time.perf_counter()
+            tracker.extract_job_details(job_ids)
+            elapsed = time.perf_counter() - started
+            tracker.fetcher.shutdown()
+
+            assert [job['job_id'] for job in tracker.job_list] == job_ids, "result order changed"
+            print(f"{workers:>8} {elapsed:>10.2f} {num_jobs / elapsed:>10.1f}")
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,41 @@
+"""Compare per-request connections with the pooled HttpClient and exercise retries.
+
+Run from the repository root:
+    python -m benchmarks.bench_http
+"""
+import time
+import requests
+from benchmarks.stub_server import StubLinkedInServer
+from http_client import HttpClient
+
+def run(num_requests=200):
+    with StubLinkedInServer(latency=0.0) as server:
+        urls = [f"{server.base_url}/jobs-guest/jobs/api/jobPosting/{1000000 + i}" for i in range(num_requests)]
+
+        started = time.perf_counter()
+        for url in urls:
+            requests.get(url)
+        fresh = time.perf_counter() - started
+
+        client = HttpClient()
+        started = time.perf_counter()
+        for url in urls:
+            client.get(url)
+        pooled = time.perf_counter() - started
+
+        print(f"{num_requests} sequential requests")
+        print(f"  new connection per request: {fresh:.2f}s ({1000 * fresh / num_requests:.2f} ms/request)")
+        print(f"  pooled keep-alive session:  {pooled:.2f}s ({1000 * pooled / num_requests:.2f} ms/request)")
+        client.print_stats()
+
+    # Every 5th request is throttled with Retry-After: 0; all requests should still succeed
+    with StubLinkedInServer(latency=0.0, fail_every=5, fail_status=429, retry_after=0) as server:
+        client = HttpClient(backoff_factor=0.01)
+        statuses = [client.get(f"{server.base_url}/jobs-guest/jobs/api/jobPosting/{1000000 + i}").status_code
+                    for i in range(50)]
+        print(f"\nThrottled server: {statuses.count(200)}/{len(statuses)} succeeded, "
+              f"{server.request_count} requests sent")
+        client.print_stats()
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,58 @@
+"""Re-run the same search with no cache, a cold and a warm response cache, and offline replay.
+
+Run from the repository root:
+    python -m benchmarks.bench_http_cache
+"""
+import contextlib
+import io
+import tempfile
+import time
+from benchmarks.stub_server import StubLinkedInServer
+from linkedin_job_tracker import LinkedInJobTracker
+from response_cache import ResponseCache
+
+def scrape(base_url, num_pages, cache):
+    tracker = LinkedInJobTracker(
+        "Python Developer", "Toronto",
+        max_workers=8,
+        requests_per_second=1000,
+        per_host_limit=8,
+        base_url=base_url,
+        page_delay=(0.1, 0.1),
+        response_cache=cache
+    )
+    started = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        jobs = list(tracker.iter_jobs(num_pages))
+    return len(jobs), time.perf_counter() - started
+
+def run(num_pages=4, latency=0.05):
+    print(f"{num_pages} pages, stub latency {1000 * latency:.0f} ms\n")
+    print(f"{'mode':>24} {'jobs':>5} {'seconds':>8} {'server hits':>12} {'304s':>5}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        with StubLinkedInServer(latency=latency, total_jobs=num_pages * 25) as server:
+            base_url = server.base_url
+            for label, cache in (
+                ("no cache", None),
+                ("cold cache", ResponseCache(tmp)),
+                ("warm cache, revalidate", ResponseCache(tmp)),
+            ):
+                requests_before, not_modified_before = server.request_count, server.not_modified
+                jobs, seconds = scrape(base_url, num_pages, cache)
+                print(f"{label:>24} {jobs:>5} {seconds:>8.2f} {server.request_count - requests_before:>12} "
+                      f"{server.not_modified - not_modified_before:>5}")
+
+        # The server is gone now; everything has to come from the cache
+        cache = ResponseCache(tmp, offline=True)
+        jobs, seconds = scrape(base_url, num_pages, cache)
+        print(f"{'offline replay':>24} {jobs:>5} {seconds:>8.2f} {0:>12} {0:>5}")
+        cache.print_stats()
+
+        # A tight size cap keeps only the most recently used pages
+        capped = ResponseCache(tmp, max_bytes=20000)
+        print(f"\nwith a 20 kB cap: {capped.count()} pages kept ({capped.total_bytes} bytes), "
+              f"{capped.stats['evicted']} evicted")
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,107 @@
+"""Compare rebuilding the whole job list on each filter change with the virtualized job list.
+
+Run from the repository root:
+    python -m benchmarks.bench_job_list
+
+Without a display only the Python side of each path is timed (building row values for the
+legacy rebuild, computing the visible window for the virtual list); with a display both
+paths also drive a real Treeview.
+"""
+import os
+import random
+import tempfile
+import time
+from job_list_view import VirtualJobList
+from job_model import JobModel
+from job_store import JobStore
+
+COLUMNS = ('job_id', 'company', 'job_title', 'status', 'date_applied', 'deadline', 'type',
+           'contact_person', 'email', 'application_link')
+STATUSES = ['Not Applied', 'Applied', 'Interview Scheduled', 'Rejected', 'Offer Received']
+FILTERS = ['All', 'Applied', 'Not Applied', 'Rejected', 'All']
+
+def make_jobs(count, seed=11):
+    rng = random.Random(seed)
+    return [{
+        'job_id': str(4000000000 + i),
+        'company': f"Company {rng.randint(1, 2000)}",
+        'job_title': rng.choice(['Data Analyst', 'Data Scientist', 'ML Engineer', 'BI Developer']),
+        'status': rng.choice(STATUSES),
+        'type': 'Full-time',
+        'email': f"jobs{i}@example.com",
+        'posting_date': f"2025-{rng.randint(1, 6):02d}-{rng.randint(1, 28):02d}",
+    } for i in range(count)]
+
+def legacy_rows(df):
+    """The per-row, per-column value building populate_tree used to do"""
+    rows = []
+    for _, row in df.iterrows():
+        rows.append([row[col] if col in row and row[col] == row[col] and row[col] is not None else ""
+                     for col in COLUMNS])
+    return rows
+
+def open_tree():
+    """A Treeview in a hidden window, or None without a display"""
+    try:
+        import tkinter as tk
+        from tkinter import ttk
+        root = tk.Tk()
+    except Exception:
+        return None, None
+    root.withdraw()
+    tree = ttk.Treeview(root, columns=COLUMNS, show='headings')
+    return root, (tree, ttk.Scrollbar(root))
+
+def run(sizes=(10000, 100000)):
+    root, widgets = open_tree()
+    print("Treeview: " + ("real (hidden window)" if widgets else "not available, timing the Python side only") + "\n")
+    print(f"{'jobs':>7} {'path':>22} {'first load ms':>14} {'per filter ms':>14}")
+
+    for size in sizes:
+        with tempfile.TemporaryDirectory() as tmp:
+            store = JobStore(os.path.join(tmp, "jobs.db"))
+            store.upsert_jobs(make_jobs(size))
+            model = JobModel(store)
+            df = model.dataframe
+
+            # Legacy: filter the DataFrame and rebuild every row
+            def legacy(status):
+                subset = df if status == 'All' else df[df['status'] == status]
+                rows = legacy_rows(subset)
+                if widgets:
+                    tree = widgets[0]
+                    for item in tree.get_children():
+                        tree.delete(item)
+                    for values in rows:
+                        tree.insert('', 'end', values=values)
+
+            # Virtual: cached tuples, status index, only the visible window in the tree
+            job_list = VirtualJobList(*widgets) if widgets else None
+            def virtual(status):
+                ids, rows = model.display_rows(COLUMNS)
+                positions = model.positions(None if status == 'All' else status)
+                if job_list:
+                    job_list.show(ids, rows, positions)
+                else:
+                    visible = range(len(rows)) if positions is None else positions
+                    [rows[pos] for pos in visible[:40]]
+
+            for name, func in (("legacy rebuild", legacy), ("virtual list", virtual)):
+                if widgets:
+                    widgets[0].delete(*widgets[0].get_children())
+                started = time.perf_counter()
+                func('All')
+                first = time.perf_counter() - started
+
+                started = time.perf_counter()
+                for status in FILTERS:
+                    func(status)
+                per_filter = (time.perf_counter() - started) / len(FILTERS)
+                print(f"{size:>7} {name:>22} {1000 * first:>14.1f} {1000 * per_filter:>14.2f}")
+            store.close()
+
+    if root:
+        root.destroy()
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,65 @@
+"""Tokens and time of rerunning LLM extraction with a cold, warm and undersized response cache.
+
+Runs against the local stub chat model, so no API key or network access is needed.
+
+Run from the repository root:
+    python -m benchmarks.bench_llm_cache
+"""
+import os
+import statistics
+import tempfile
+import time
+from benchmarks.bench_descriptions import make_jobs
+from benchmarks.stub_llm import StubChatModel
+from job_extraction import ExtractionPipeline, build_prompt
+from job_store import JobStore
+from llm_cache import CachedLLM, LLMCache
+
+def extract(store, jobs, cache):
+    pipeline = ExtractionPipeline(StubChatModel(), store, max_in_flight=8, cache=cache)
+    pipeline.run(jobs, refresh=True)
+    stats = pipeline.stats
+    return stats['seconds'], stats['prompt_tokens'] + stats['completion_tokens'], stats['cached']
+
+def run(count=300):
+    jobs = make_jobs(count)
+    with tempfile.TemporaryDirectory() as tmp:
+        store = JobStore(os.path.join(tmp, "jobs.db"))
+        store.upsert_jobs(jobs)
+        print(f"Extracting {count} postings, 8 in flight\n")
+        print(f"{'run':>38} {'s':>7} {'API tokens':>11} {'from cache':>11} {'hit rate':>9}")
+
+        seconds, tokens, _ = extract(store, jobs, None)
+        print(f"{'no cache':>38} {seconds:>7.2f} {tokens:>11} {0:>11} {'':>9}")
+
+        cache = LLMCache(os.path.join(tmp, "llm_cache.db"))
+        for label in ("cold cache", "warm cache (rerun)"):
+            cache.stats.update(hits=0, misses=0)
+            seconds, tokens, cached = extract(store, jobs, cache)
+            print(f"{label:>38} {seconds:>7.2f} {tokens:>11} {cached:>11} {cache.hit_rate():>9.0%}")
+        size = cache.total_bytes
+
+        small = LLMCache(os.path.join(tmp, "small_cache.db"), max_bytes=size // 2)
+        extract(store, jobs, small)
+        small.stats.update(hits=0, misses=0)
+        seconds, tokens, cached = extract(store, jobs, small)
+        label = f"rerun, cache capped at {size // 2 // 1000} of {size // 1000} kB"
+        print(f"{label:>38} {seconds:>7.2f} {tokens:>11} {cached:>11} {small.hit_rate():>9.0%}")
+
+        # One notebook-style call: an API round trip vs. a cache hit
+        llm = CachedLLM(StubChatModel(), cache, prompt_version="bench")
+        prompt = build_prompt(jobs[0], jobs[0]['description'])
+        started = time.perf_counter()
+        llm.invoke(prompt)
+        miss_ms = 1000 * (time.perf_counter() - started)
+        hits = []
+        for _ in range(50):
+            started = time.perf_counter()
+            llm.invoke(prompt)
+            hits.append(1000 * (time.perf_counter() - started))
+        print(f"\nCachedLLM.invoke: {miss_ms:.1f} ms on a miss, {statistics.median(hits):.2f} ms median on a hit")
+        small.print_stats()
+        store.close()
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,69 @@
+"""Compare the notebook's one invoke per posting with the concurrent, rate-limited extraction pipeline.
+
+Runs against a local stub chat model, so no API key or network access is needed. Rate limits
+are scaled from per minute to per second to keep the run short.
+
+Run from the repository root:
+    python -m benchmarks.bench_llm_extraction
+"""
+import asyncio
+import os
+import tempfile
+import time
+from benchmarks.bench_descriptions import make_jobs
+from benchmarks.stub_llm import StubChatModel
+from job_extraction import ExtractionPipeline, build_prompt, parse_extraction
+from job_store import JobStore
+
+def row(method, jobs, seconds, failed, retries):
+    print(f"{method:>40} {jobs:>5} {seconds:>7.2f} {jobs / seconds:>7.1f} {failed:>7} {retries:>8}")
+
+def sequential(llm, jobs):
+    """The notebook cell: one blocking invoke per posting"""
+    started = time.perf_counter()
+    for job in jobs:
+        parse_extraction(llm.invoke(build_prompt(job, job['description'])).content)
+    return time.perf_counter() - started
+
+def naive_abatch(llm, jobs, concurrency):
+    """llm.abatch with max_concurrency and no rate limiting; rejected requests are lost"""
+    prompts = [build_prompt(job, job['description']) for job in jobs]
+    started = time.perf_counter()
+    results = asyncio.run(llm.abatch(prompts, config={'max_concurrency': concurrency}, return_exceptions=True))
+    return time.perf_counter() - started, sum(isinstance(result, Exception) for result in results)
+
+def pipeline_run(llm, store, jobs, **options):
+    pipeline = ExtractionPipeline(llm, store, max_retries=5, retry_backoff=0.25, rate_period=1.0, **options)
+    pipeline.run(jobs, refresh=True)
+    return pipeline.stats
+
+def run(count=200, sequential_jobs=40, limit_per_second=20):
+    jobs = make_jobs(count)
+    with tempfile.TemporaryDirectory() as tmp:
+        store = JobStore(os.path.join(tmp, "jobs.db"))
+        store.upsert_jobs(jobs)
+        print(f"{count} stored postings, stub model with ~0.1-0.2s per request\n")
+        print(f"{'method':>40} {'jobs':>5} {'s':>7} {'jobs/s':>7} {'failed':>7} {'retries':>8}")
+
+        row("invoke per posting (notebook)", sequential_jobs, sequential(StubChatModel(), jobs[:sequential_jobs]), 0, 0)
+        for in_flight in (1, 4, 16, 64):
+            stats = pipeline_run(StubChatModel(), store, jobs, max_in_flight=in_flight)
+            row(f"pipeline, {in_flight} in flight", count, stats['seconds'], stats['failed'], stats['retries'])
+
+        print(f"\nServer limit of {limit_per_second} requests/s:")
+        seconds, failed = naive_abatch(StubChatModel(requests_per_minute=limit_per_second, period=1.0), jobs, 16)
+        row("abatch, max_concurrency=16", count, seconds, failed, 0)
+        stats = pipeline_run(StubChatModel(requests_per_minute=limit_per_second, period=1.0), store, jobs,
+                             max_in_flight=16)
+        row("pipeline, 16 in flight, retries only", count, stats['seconds'], stats['failed'], stats['retries'])
+        stats = pipeline_run(StubChatModel(requests_per_minute=limit_per_second, period=1.0), store, jobs,
+                             max_in_flight=16, requests_per_minute=limit_per_second)
+        row("pipeline, 16 in flight, rate limited", count, stats['seconds'], stats['failed'], stats['retries'])
+
+        extracted = store.load_extractions()
+        print(f"\n{len(extracted)} extractions in the store; first: "
+              f"{extracted.iloc[0][['role', 'experience', 'skills']].to_dict()}")
+        store.close()
+
+if __name__ == "__main__":
+    run()
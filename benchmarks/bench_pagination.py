@@ -0,0 +1,66 @@
+"""Compare fixed pagination with adaptive pagination, and sequential with parallel multi-query searches.
+
+Run from the repository root:
+    python -m benchmarks.bench_pagination
+"""
+import contextlib
+import io
+import time
+from urllib.parse import urlencode
+from benchmarks.stub_server import StubLinkedInServer
+from http_client import HttpClient, RequestBudget
+from batch_search import BatchSearch
+from linkedin_job_tracker import LinkedInJobTracker
+
+PAGE_DELAY = (0.2, 0.2)
+
+def fixed_pages(base_url, num_pages):
+    """What search_jobs used to do: request every page, sleeping between them"""
+    http = HttpClient()
+    for page in range(num_pages):
+        params = {'keywords': "Python Developer", 'location': "Toronto", 'start': page * 25}
+        http.get(f"{base_url}/jobs-guest/jobs/api/seeMoreJobPostings/search?{urlencode(params)}")
+        if page < num_pages - 1:
+            time.sleep(PAGE_DELAY[0])
+
+def adaptive_pages(base_url, num_pages):
+    tracker = LinkedInJobTracker("Python Developer", "Toronto", base_url=base_url, page_delay=PAGE_DELAY)
+    with contextlib.redirect_stdout(io.StringIO()):
+        return tracker.search_jobs(num_pages)
+
+def search_ids(titles, locations, num_pages, max_parallel, **tracker_kwargs):
+    """Job IDs of every title x location search, run max_parallel at a time"""
+    batch = BatchSearch(titles, locations, max_parallel_searches=max_parallel, **tracker_kwargs)
+    return [job_id for _, page_ids in batch.iter_search_pages(num_pages) for job_id in page_ids]
+
+def timed(server, func, *args):
+    requests_before = server.request_count
+    started = time.perf_counter()
+    result = func(*args)
+    return result, server.request_count - requests_before, time.perf_counter() - started
+
+def run(num_pages=10, total_jobs=60):
+    print(f"Search for up to {num_pages} pages when only {total_jobs} results exist\n")
+    print(f"{'end of results':>16} {'pagination':>11} {'requests':>9} {'seconds':>8}")
+    for label, repeat in (("empty page", False), ("repeated page", True)):
+        with StubLinkedInServer(latency=0.02, total_jobs=total_jobs, repeat_last_page=repeat) as server:
+            _, requests, seconds = timed(server, fixed_pages, server.base_url, num_pages)
+            print(f"{label:>16} {'fixed':>11} {requests:>9} {seconds:>8.2f}")
+            _, requests, seconds = timed(server, adaptive_pages, server.base_url, num_pages)
+            print(f"{label:>16} {'adaptive':>11} {requests:>9} {seconds:>8.2f}")
+
+    titles, locations = ("Python Developer", "Data Analyst", "ML Engineer"), ("Toronto", "Vancouver")
+    queries = len(titles) * len(locations)
+    print(f"\n{queries} keyword/location searches, up to {num_pages} pages each\n")
+    print(f"{'mode':>26} {'job IDs':>8} {'requests':>9} {'seconds':>8}")
+    with StubLinkedInServer(latency=0.02, total_jobs=100, vary_by_query=True) as server:
+        for label, max_parallel, budget in (("sequential", 1, None), ("parallel", queries, None),
+                                            ("parallel, budget of 15", queries, RequestBudget(15))):
+            with contextlib.redirect_stdout(io.StringIO()):
+                found, requests, seconds = timed(
+                    server, lambda: search_ids(titles, locations, num_pages, max_parallel, request_budget=budget,
+                                               base_url=server.base_url, page_delay=PAGE_DELAY))
+            print(f"{label:>26} {len(found):>8} {requests:>9} {seconds:>8.2f}")
+
+if __name__ == "__main__":
+    run()
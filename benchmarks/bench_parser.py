@@ -0,0 +1,78 @@
+"""Compare the single-pass posting parser backends with the previous BeautifulSoup code path.
+
+Run from the repository root:
+    python -m benchmarks.bench_parser
+"""
+import glob
+import os
+import re
+import time
+from bs4 import BeautifulSoup
+from posting_parser import BACKENDS, parse_job_posting
+
+FIXTURE_DIR = os.path.join(os.path.dirname(__file__), "fixtures")
+
+def load_fixtures():
+    """Read the saved job posting pages"""
+    fixtures = []
+    for path in sorted(glob.glob(os.path.join(FIXTURE_DIR, "job_posting_*.html"))):
+        with open(path, encoding="utf-8") as f:
+            fixtures.append(f.read())
+    return fixtures
+
+def legacy_parse(html):
+    """The field lookups extract_job_details used to run on every page"""
+    soup = BeautifulSoup(html, "html.parser")
+    job = {}
+
+    job_type = None
+    for criteria in soup.find_all("li", {"class": "description__job-criteria-item"}):
+        header = criteria.find("h3", {"class": "description__job-criteria-subheader"})
+        if header and "Employment type" in header.text:
+            job_type = criteria.find("span", {"class": "description__job-criteria-text"}).text.strip()
+            break
+    if not job_type:
+        description = soup.find("div", {"class": "show-more-less-html__markup"})
+        if description:
+            description.text.lower()
+    job["type"] = job_type
+
+    description = soup.find("div", {"class": "show-more-less-html__markup"})
+    if description:
+        re.findall(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', description.text)
+
+    for key, tag, fragment in (
+        ("job_title", "h2", "topcard__title"),
+        ("company", "a", "topcard__org-name-link"),
+        ("location", "span", "topcard__flavor--bullet"),
+        ("time_posted", "span", "posted-time-ago__text"),
+        ("num_applicants", "span", "num-applicants__caption"),
+    ):
+        element = soup.find(tag, {"class": lambda c, fragment=fragment: c and fragment in c})
+        job[key] = element.text.strip() if element else None
+
+    description = soup.find("div", {"class": "show-more-less-html__markup"})
+    job["description"] = description.text.strip() if description else None
+    return job
+
+def time_it(func, pages, repeat):
+    started = time.perf_counter()
+    for _ in range(repeat):
+        for html in pages:
+            func(html)
+    return (time.perf_counter() - started) / (repeat * len(pages))
+
+def run(repeat=200):
+    pages = load_fixtures()
+    print(f"{len(pages)} fixtures x {repeat} repetitions\n")
+    print(f"{'parser':>30} {'ms/page':>9} {'speedup':>8}")
+
+    baseline = time_it(legacy_parse, pages, repeat)
+    print(f"{'BeautifulSoup (legacy)':>30} {1000 * baseline:>9.3f} {1.0:>7.1f}x")
+
+    for backend in BACKENDS:
+        seconds = time_it(lambda html: parse_job_posting(html, backend=backend), pages, repeat)
+        print(f"{'parse_job_posting/' + backend:>30} {1000 * seconds:>9.3f} {baseline / seconds:>7.1f}x")
+
+if __name__ == "__main__":
+    run()
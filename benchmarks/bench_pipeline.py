@@ -0,0 +1,44 @@
+"""Compare time-to-first-job and total time of the two-phase batch and the streaming pipeline.
+
+Run from the repository root:
+    python -m benchmarks.bench_pipeline
+"""
+import time
+from benchmarks.stub_server import StubLinkedInServer
+from linkedin_job_tracker import LinkedInJobTracker
+
+def make_tracker(server):
+    return LinkedInJobTracker(
+        "Python Developer", "Toronto",
+        max_workers=8,
+        requests_per_second=1000,
+        per_host_limit=8,
+        base_url=server.base_url,
+        page_delay=(0.5, 0.5)
+    )
+
+def run(num_pages=4, latency=0.05):
+    with StubLinkedInServer(latency=latency, total_jobs=num_pages * 25) as server:
+        tracker = make_tracker(server)
+        started = time.perf_counter()
+        job_ids = tracker.search_jobs(num_pages)
+        tracker.extract_job_details(job_ids[:1])
+        batch_first = time.perf_counter() - started
+        tracker.extract_job_details(job_ids[1:])
+        batch_total = time.perf_counter() - started
+
+        tracker = make_tracker(server)
+        started = time.perf_counter()
+        pipeline_first = None
+        for _ in tracker.iter_jobs(num_pages):
+            if pipeline_first is None:
+                pipeline_first = time.perf_counter() - started
+        pipeline_total = time.perf_counter() - started
+
+    print(f"\n{num_pages} pages, {len(tracker.job_list)} jobs")
+    print(f"{'mode':>10} {'first job (s)':>14} {'total (s)':>10}")
+    print(f"{'batch':>10} {batch_first:>14.2f} {batch_total:>10.2f}")
+    print(f"{'pipeline':>10} {pipeline_first:>14.2f} {pipeline_total:>10.2f}")
+
+if __name__ == "__main__":
+    run()
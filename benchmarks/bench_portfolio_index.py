@@ -0,0 +1,77 @@
+"""Compare the notebook's per-row portfolio ingestion with batched content-hash upserts.
+
+Run from the repository root:
+    python -m benchmarks.bench_portfolio_index
+"""
+import random
+import time
+import uuid
+import chromadb
+import pandas as pd
+from benchmarks.stub_embeddings import StubEmbeddingFunction
+from portfolio_index import PortfolioIndexer
+
+TECHNOLOGIES = ['React', 'Angular', 'Vue.js', 'Node.js', 'Django', 'Flask', 'Spring Boot', 'Kotlin', 'Swift',
+                'Flutter', 'PostgreSQL', 'MySQL', 'MongoDB', 'Redis', 'Docker', 'Kubernetes', 'AWS', 'Azure',
+                'TensorFlow', 'PyTorch', 'GraphQL', 'TypeScript', 'Go', 'Rust', 'Airflow', 'Spark']
+
+def make_portfolio(count, seed=11):
+    rng = random.Random(seed)
+    return pd.DataFrame({
+        'Techstack': [", ".join(rng.sample(TECHNOLOGIES, rng.randint(2, 5))) for _ in range(count)],
+        'Links': [f"https://portfolio-{i}.example.com" for i in range(count)],
+    })
+
+def edit(df, fraction, seed=12):
+    """Change the links of some rows and drop a few others"""
+    rng = random.Random(seed)
+    df = df.copy()
+    changed = rng.sample(range(len(df)), int(len(df) * fraction))
+    df.loc[changed, 'Links'] = df.loc[changed, 'Links'] + "/v2"
+    return df.drop(index=rng.sample(range(len(df)), int(len(df) * fraction / 2))).reset_index(drop=True)
+
+def new_collection(client, name, embedding):
+    return client.get_or_create_collection(name=name, embedding_function=embedding)
+
+def legacy_ingest(collection, df):
+    """The notebook cell: skip if anything is stored, otherwise one add (and one embedding call) per row"""
+    if collection.count():
+        return
+    for _, row in df.iterrows():
+        collection.add(documents=row["Techstack"], metadatas={"links": row["Links"]}, ids=[str(uuid.uuid4())])
+
+def stale_rows(collection, df):
+    stored = collection.get(include=['documents', 'metadatas'])
+    stored = set(zip(stored['documents'], [metadata['links'] for metadata in stored['metadatas']]))
+    return len(set(zip(df['Techstack'], df['Links'])) ^ stored)
+
+def run(count=2000, batch_sizes=(16, 64, 256), edit_fraction=0.02):
+    df = make_portfolio(count)
+    edited = edit(df, edit_fraction)
+    client = chromadb.EphemeralClient()
+    print(f"{count} portfolio rows, then {edit_fraction:.0%} edited and {edit_fraction / 2:.0%} removed\n")
+    print(f"{'method':>26} {'phase':>14} {'s':>7} {'docs/s':>8} {'embed calls':>12} {'stale rows':>11}")
+
+    embedding = StubEmbeddingFunction()
+    collection = new_collection(client, "legacy", embedding)
+    for phase, frame in (("initial", df), ("after edits", edited)):
+        calls, started = embedding.calls, time.perf_counter()
+        legacy_ingest(collection, frame)
+        seconds = time.perf_counter() - started
+        rate = count / seconds if phase == "initial" else 0.0
+        print(f"{'per-row add, uuid4 IDs':>26} {phase:>14} {seconds:>7.2f} {rate:>8.0f} "
+              f"{embedding.calls - calls:>12} {stale_rows(collection, frame):>11}")
+
+    for batch_size in batch_sizes:
+        embedding = StubEmbeddingFunction()
+        collection = new_collection(client, f"batched-{batch_size}", embedding)
+        indexer = PortfolioIndexer(collection, batch_size=batch_size)
+        for phase, frame in (("initial", df), ("unchanged", df), ("after edits", edited)):
+            calls = embedding.calls
+            stats = indexer.sync(frame)
+            rate = stats['added'] / stats['seconds'] if stats['added'] else 0.0
+            print(f"{'sync, batch ' + str(batch_size):>26} {phase:>14} {stats['seconds']:>7.2f} {rate:>8.0f} "
+                  f"{embedding.calls - calls:>12} {stale_rows(collection, frame):>11}")
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,63 @@
+"""Compare the notebook's one-query-per-skill portfolio lookup with batched matching of whole job batches.
+
+Run from the repository root:
+    python -m benchmarks.bench_portfolio_match
+"""
+import tempfile
+import time
+import chromadb
+from benchmarks.bench_embedding_cache import make_job_skills
+from benchmarks.bench_portfolio_index import make_portfolio
+from benchmarks.stub_embeddings import StubEmbeddingFunction
+from embedding_cache import EmbeddingCache
+from portfolio_index import PortfolioIndexer
+from portfolio_match import PortfolioMatcher
+
+def notebook_match(collection, job_skills, top_k=3, per_skill=2):
+    """collection.query per skill, then the cosine similarities of each job's closest distinct links"""
+    results = []
+    for skills in job_skills:
+        best = {}
+        for skill in skills:
+            found = collection.query(query_texts=[skill], n_results=per_skill)
+            for metadata, distance in zip(found['metadatas'][0], found['distances'][0]):
+                best[metadata['links']] = min(distance, best.get(metadata['links'], distance))
+        # Chroma's L2 space reports squared distances; on unit vectors that is 2 - 2 * cosine
+        results.append(sorted(1 - distance / 2 for distance in best.values())[::-1][:top_k])
+    return results
+
+def run(portfolio_sizes=(20, 2000), sample_jobs=100, batch_sizes=(100, 1000, 5000)):
+    job_skills = make_job_skills(max(batch_sizes), seed=31)
+    client = chromadb.EphemeralClient()
+    print(f"{'portfolio':>9} {'method':>34} {'jobs':>6} {'s':>8} {'jobs/s':>9} {'same best':>11}")
+
+    for size in portfolio_sizes:
+        portfolio = make_portfolio(size)
+        model = StubEmbeddingFunction()
+        collection = client.get_or_create_collection(name=f"portfolio-{size}", embedding_function=model)
+        PortfolioIndexer(collection, batch_size=256).sync(portfolio)
+
+        sample = job_skills[:sample_jobs]
+        started = time.perf_counter()
+        expected = notebook_match(collection, sample)
+        seconds = time.perf_counter() - started
+        print(f"{size:>9} {'collection.query per skill':>34} {sample_jobs:>6} {seconds:>8.2f} "
+              f"{sample_jobs / seconds:>9.0f} {'':>11}")
+
+        with tempfile.TemporaryDirectory() as tmp:
+            for jobs in batch_sizes:
+                # A fresh cache each time, so every batch pays for embedding its distinct skills
+                matcher = PortfolioMatcher.from_collection(collection, EmbeddingCache(StubEmbeddingFunction(),
+                                                                                    directory=f"{tmp}/{jobs}"))
+                started = time.perf_counter()
+                matches = matcher.match(job_skills[:jobs])
+                seconds = time.perf_counter() - started
+                # Many stub vectors tie, so which tied links fill the lower ranks is arbitrary;
+                # compare the score of each job's best link instead
+                same = sum(abs(got[0]['score'] - want[0]) < 1e-4
+                           for got, want in zip(matches, expected)) / len(expected)
+                print(f"{size:>9} {'PortfolioMatcher.match':>34} {jobs:>6} {seconds:>8.2f} "
+                      f"{jobs / seconds:>9.0f} {same:>11.0%}")
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,89 @@
+"""Hit rate and latency of vector, keyword (BM25) and hybrid portfolio retrieval on a labeled query set.
+
+Queries that share no term with any tech stack are reported separately: keyword retrieval can only
+return them in file order, so they are where the embedding half of hybrid retrieval has to help.
+
+Run from the repository root:
+    python -m benchmarks.bench_portfolio_search
+"""
+import json
+import os
+import tempfile
+import time
+from benchmarks.stub_embeddings import StubEmbeddingFunction
+from embedding_cache import EmbeddingCache, default_embedding_function
+from portfolio_search import MODES, HybridRetriever
+
+EVAL_SET = os.path.join(os.path.dirname(__file__), "fixtures", "portfolio_eval.json")
+
+def embedding_model():
+    """Chroma's default model when it can be loaded, otherwise the stub with subword-like n-grams"""
+    try:
+        model = default_embedding_function()
+        model(["warm up"])
+        return model, "all-MiniLM-L6-v2"
+    except Exception:
+        return StubEmbeddingFunction(call_latency=0, text_latency=0, char_ngrams=3), "stub (hashed tokens + 3-grams)"
+
+def evaluate(retriever, cases, mode, k=3):
+    queries = [case['query'] for case in cases]
+    started = time.perf_counter()
+    found = retriever.query(queries, n_results=k, mode=mode)['metadatas']
+    batch_ms = 1000 * (time.perf_counter() - started)
+
+    started = time.perf_counter()
+    for query in queries:
+        retriever.query(query, n_results=k, mode=mode)
+    single_ms = 1000 * (time.perf_counter() - started) / len(queries)
+
+    hits1 = hits3 = reciprocal = 0.0
+    misses = []
+    firsts = []
+    for case, results in zip(cases, found):
+        links = [metadata['links'] for metadata in results]
+        ranks = [rank for rank, link in enumerate(links) if link in case['relevant']]
+        hits1 += bool(ranks) and ranks[0] == 0
+        hits3 += bool(ranks)
+        reciprocal += 1 / (ranks[0] + 1) if ranks else 0.0
+        firsts.append(bool(ranks) and ranks[0] == 0)
+        if not ranks or ranks[0] > 0:
+            misses.append(case['query'])
+    count = len(cases)
+    return hits1 / count, hits3 / count, reciprocal / count, batch_ms, single_ms, misses, firsts
+
+def run():
+    with open(EVAL_SET) as f:
+        cases = json.load(f)
+    model, name = embedding_model()
+    print(f"{len(cases)} labeled queries, embeddings from {name} (cached, so latency is retrieval only)\n")
+    print(f"{'mode':>8} {'hit@1':>6} {'hit@3':>6} {'MRR':>6} {'batch ms':>9} {'ms/query':>9} "
+          f"{'hit@1 keyword match':>20} {'hit@1 no match':>15}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        embeddings = EmbeddingCache(model, model=name, directory=tmp)
+        retriever = HybridRetriever.from_csv(embedding_function=embeddings)
+        embeddings.embed([case['query'] for case in cases])
+        matched = retriever.keywords.scores([case['query'] for case in cases]).max(axis=1) > 0
+        report = {}
+        for mode in MODES:
+            hit1, hit3, mrr, batch_ms, single_ms, misses, firsts = evaluate(retriever, cases, mode)
+            report[mode] = misses
+            split = [sum(hit for hit, match in zip(firsts, matched) if match == side) / max(1, sum(matched == side))
+                     for side in (True, False)]
+            print(f"{mode:>8} {hit1:>6.2f} {hit3:>6.2f} {mrr:>6.2f} {batch_ms:>9.2f} {single_ms:>9.3f} "
+                  f"{split[0]:>20.2f} {split[1]:>15.2f}")
+        print(f"({matched.sum()} queries share a term with some tech stack, {(~matched).sum()} don't)")
+
+        sweep = []
+        for weight in (1.0, 1.5, 2.0, 3.0):
+            retriever.keyword_weight = weight
+            hit1, _, mrr, *_ = evaluate(retriever, cases, 'hybrid')
+            sweep.append(f"{weight:g}: {hit1:.2f} / {mrr:.2f}")
+        print(f"\nhybrid hit@1 / MRR by keyword weight (rrf_k {retriever.rrf_k}, depth {retriever.depth}): "
+              + ", ".join(sweep))
+
+    for mode in MODES:
+        print(f"\n{mode} misses at rank 1: {', '.join(report[mode]) or 'none'}")
+
+if __name__ == "__main__":
+    run()
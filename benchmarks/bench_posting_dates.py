@@ -0,0 +1,93 @@
+"""Compare the per-row posting-date loop filter_by_age used with the vectorized parser.
+
+Run from the repository root:
+    python -m benchmarks.bench_posting_dates
+"""
+import os
+import random
+import re
+import tempfile
+import time
+from datetime import datetime
+import pandas as pd
+from posting_dates import parse_posting_date, parse_posting_dates, posting_ages
+
+UNITS = ['minute', 'hour', 'day', 'week', 'month']
+
+def legacy_parse(time_posted_text):
+    """LinkedInJobTracker._parse_posting_date as it was"""
+    if not time_posted_text:
+        return None
+    today = datetime.now().date()
+    if 'hour' in time_posted_text or 'minute' in time_posted_text:
+        return today
+    elif 'day' in time_posted_text:
+        return today - pd.Timedelta(days=int(re.search(r'(\d+)', time_posted_text).group(1)))
+    elif 'week' in time_posted_text:
+        return today - pd.Timedelta(weeks=int(re.search(r'(\d+)', time_posted_text).group(1)))
+    elif 'month' in time_posted_text:
+        return today - pd.Timedelta(days=30 * int(re.search(r'(\d+)', time_posted_text).group(1)))
+    elif 'year' in time_posted_text:
+        return today - pd.Timedelta(days=365 * int(re.search(r'(\d+)', time_posted_text).group(1)))
+    return None
+
+def legacy_ages(df, workdir):
+    """The iterrows loop, including the two os.makedirs calls each temporary tracker made"""
+    df = df.copy()
+    for idx, row in df[df['posting_date'].isna()].iterrows():
+        if pd.notna(row['time_posted']):
+            os.makedirs(os.path.join(workdir, 'job_tracker'), exist_ok=True)
+            os.makedirs(os.path.join(workdir, 'job_tracker/data'), exist_ok=True)
+            date = legacy_parse(row['time_posted'])
+            if date:
+                df.at[idx, 'posting_date'] = date
+    df['posting_date'] = pd.to_datetime(df['posting_date'])
+    return (pd.Timestamp(datetime.now().date()) - df['posting_date']).dt.days
+
+def make_frame(count, seed=9):
+    rng = random.Random(seed)
+    texts = []
+    for _ in range(count):
+        number, unit = rng.randint(1, 11), rng.choice(UNITS)
+        texts.append(f"{'Reposted ' if rng.random() < 0.2 else ''}{number} {unit}{'s' if number > 1 else ''} ago")
+    return pd.DataFrame({'job_id': [str(i) for i in range(count)], 'time_posted': texts,
+                         'posting_date': pd.Series([None] * count, dtype=object)})
+
+# LinkedIn texts and their age in days, checked on both the scalar and the vectorized parser
+EXPECTED_AGES = {"30+ days ago": 30, "Reposted 2 weeks ago": 14, "1 hour ago": 0, "a month ago": 30,
+                 "3 months ago": 90}
+
+def check_parsers(today="2024-06-30"):
+    texts = list(EXPECTED_AGES)
+    vectorized = parse_posting_dates(texts, today=today)
+    for text, date in zip(texts, vectorized):
+        want = pd.Timestamp(today) - pd.Timedelta(days=EXPECTED_AGES[text])
+        assert pd.Timestamp(parse_posting_date(text, today=today)) == want, text
+        assert date == want, text
+
+def run(sizes=(10000, 100000)):
+    check_parsers()
+    print(f"{'rows':>7} {'method':>28} {'ms':>9}")
+    with tempfile.TemporaryDirectory() as workdir:
+        for size in sizes:
+            df = make_frame(size)
+
+            started = time.perf_counter()
+            legacy = legacy_ages(df, workdir)
+            legacy_time = time.perf_counter() - started
+
+            started = time.perf_counter()
+            [parse_posting_date(text) for text in df['time_posted']]
+            scalar_time = time.perf_counter() - started
+
+            started = time.perf_counter()
+            vectorized = posting_ages(df)
+            vector_time = time.perf_counter() - started
+
+            assert (legacy == vectorized).all()
+            print(f"{size:>7} {'iterrows + per-row tracker':>28} {1000 * legacy_time:>9.1f}")
+            print(f"{size:>7} {'parse_posting_date per row':>28} {1000 * scalar_time:>9.1f}")
+            print(f"{size:>7} {'posting_ages (vectorized)':>28} {1000 * vector_time:>9.1f}")
+
+if __name__ == "__main__":
+    run()
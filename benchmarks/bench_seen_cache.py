@@ -0,0 +1,48 @@
+"""Count the HTTP requests the seen-ID cache saves on repeated searches.
+
+Run from the repository root:
+    python -m benchmarks.bench_seen_cache
+"""
+import contextlib
+import io
+import os
+import tempfile
+import time
+from benchmarks.stub_server import StubLinkedInServer
+from job_store import JobStore
+from linkedin_job_tracker import LinkedInJobTracker
+
+def scrape(server, store, num_pages, refresh_after_days):
+    tracker = LinkedInJobTracker(
+        "Python Developer", "Toronto",
+        max_workers=8,
+        requests_per_second=1000,
+        per_host_limit=8,
+        base_url=server.base_url,
+        page_delay=(0.1, 0.1),
+        refresh_after_days=refresh_after_days
+    )
+    requests_before = server.request_count
+    started = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        tracker.run(num_pages=num_pages, store=store)
+    return tracker.seen_stats, server.request_count - requests_before, time.perf_counter() - started
+
+def run(latency=0.05, page_overlap=3):
+    # Later runs search more pages, so part of each run is new and part was seen before
+    runs = [("first search", 4), ("same search again", 4), ("two more pages", 6)]
+
+    print(f"Stub search pages repeat the previous page's last {page_overlap} cards\n")
+    print(f"{'cache':>9} {'run':>18} {'hits':>5} {'misses':>7} {'dupes':>6} {'requests':>9} {'seconds':>8}")
+    for label, ttl in (("off", 0), ("7 days", 7)):
+        with tempfile.TemporaryDirectory() as tmp, \
+                StubLinkedInServer(latency=latency, total_jobs=500, page_overlap=page_overlap) as server:
+            store = JobStore(os.path.join(tmp, "jobs.db"))
+            for name, pages in runs:
+                stats, requests, seconds = scrape(server, store, pages, ttl)
+                print(f"{label:>9} {name:>18} {stats['hits']:>5} {stats['misses']:>7} {stats['duplicates']:>6} "
+                      f"{requests:>9} {seconds:>8.2f}")
+            store.close()
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,70 @@
+"""Compare status updates on a 100k-job history: CSV rewrite vs. keyed updates in the job store.
+
+Run from the repository root:
+    python -m benchmarks.bench_status_updates
+"""
+import os
+import random
+import tempfile
+import time
+import pandas as pd
+from job_store import JobStore
+
+def make_jobs(count):
+    """Generate tracker rows that look like real scrapes"""
+    rng = random.Random(3)
+    companies = [f"Company {i}" for i in range(2000)]
+    return [{
+        'job_id': str(4000000000 + i),
+        'company': rng.choice(companies),
+        'job_title': rng.choice(["Python Developer", "ML Engineer", "Data Scientist", "Backend Engineer"]),
+        'status': 'Not Applied',
+        'type': 'Full-time',
+        'location': 'Toronto, Ontario, Canada',
+        'time_posted': f"{rng.randint(1, 30)} days ago",
+        'posting_date': f"2025-05-{rng.randint(1, 28):02d}",
+        'num_applicants': f"{rng.randint(1, 200)} applicants",
+        'application_link': f"https://www.linkedin.com/jobs/view/{4000000000 + i}",
+    } for i in range(count)]
+
+def legacy_csv_update(path, job_id, status):
+    """What update_job_status used to do for a single job"""
+    df = pd.read_csv(path, low_memory=False)
+    df.loc[df['job_id'] == job_id, 'status'] = status
+    df.loc[df['job_id'] == job_id, 'date_applied'] = "2025-06-01"
+    df.to_csv(path, index=False)
+
+def run(sizes=(10000, 100000), batch_size=50):
+    print(f"{'rows':>8} {'CSV rewrite (ms)':>17} {'store single (ms)':>18} {f'store batch of {batch_size} (ms)':>24}")
+
+    for size in sizes:
+        jobs = make_jobs(size)
+        with tempfile.TemporaryDirectory() as tmp:
+            csv_path = os.path.join(tmp, "jobs.csv")
+            pd.DataFrame(jobs).to_csv(csv_path, index=False)
+
+            store = JobStore(os.path.join(tmp, "jobs.db"))
+            store.upsert_jobs(jobs)
+
+            rng = random.Random(size)
+            sample = [job['job_id'] for job in rng.sample(jobs, 200)]
+
+            started = time.perf_counter()
+            for job_id in sample[:3]:
+                legacy_csv_update(csv_path, int(job_id), 'Applied')
+            csv_ms = 1000 * (time.perf_counter() - started) / 3
+
+            started = time.perf_counter()
+            for job_id in sample[:100]:
+                store.update_job(job_id, status='Applied', date_applied="2025-06-01")
+            single_ms = 1000 * (time.perf_counter() - started) / 100
+
+            started = time.perf_counter()
+            store.update_jobs(sample[100:100 + batch_size], status='Applied', date_applied="2025-06-01")
+            batch_ms = 1000 * (time.perf_counter() - started)
+            store.close()
+
+        print(f"{size:>8} {csv_ms:>17.1f} {single_ms:>18.2f} {batch_ms:>24.2f}")
+
+if __name__ == "__main__":
+    run()
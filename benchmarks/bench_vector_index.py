@@ -0,0 +1,100 @@
+"""Recall and latency of the in-process vector index backends against ChromaDB.
+
+Run from the repository root:
+    python -m benchmarks.bench_vector_index
+"""
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import numpy as np
+from vector_index import VectorIndex, hnswlib
+
+try:
+    import chromadb
+except ImportError:
+    chromadb = None
+
+DIM = 384  # all-MiniLM-L6-v2
+
+def make_embeddings(count, queries, seed=41):
+    """Unit vectors scattered around topic centers (one per hundred vectors), shaped like sentence embeddings"""
+    rng = np.random.default_rng(seed)
+    centers = rng.standard_normal((max(4, count // 100), DIM)).astype(np.float32)
+    def sample(n):
+        points = centers[rng.integers(0, len(centers), n)] + 0.8 * rng.standard_normal((n, DIM)).astype(np.float32)
+        return points / np.linalg.norm(points, axis=1, keepdims=True)
+    return sample(count), sample(queries)
+
+def import_seconds(module):
+    """Fresh-interpreter import time of a module"""
+    started = time.perf_counter()
+    subprocess.run([sys.executable, "-c", f"import {module}"], check=True, capture_output=True)
+    return time.perf_counter() - started
+
+def measure(collection, queries, k):
+    started = time.perf_counter()
+    found = collection.query(query_embeddings=queries, n_results=k, include=['distances'])['ids']
+    batch_ms = 1000 * (time.perf_counter() - started) / len(queries)
+    single = []
+    for query in queries[:50]:
+        started = time.perf_counter()
+        collection.query(query_embeddings=query[None, :], n_results=k, include=['distances'])
+        single.append(1000 * (time.perf_counter() - started))
+    return found, batch_ms, statistics.median(single)
+
+def run(sizes=(20, 10000, 100000), queries=200, k=10, chroma_limit=10000):
+    print("Fresh-process import time: vector_index "
+          f"{import_seconds('vector_index'):.2f}s"
+          + (f", chromadb {import_seconds('chromadb'):.2f}s" if chromadb else ""))
+    print(f"\n{'vectors':>8} {'backend':>16} {'build s':>8} {'open s':>7} {'batch ms/q':>11} "
+          f"{'single ms':>10} {'recall@' + str(k):>10}")
+
+    configs = [("exact", {}), ("ivf nprobe=4", {'nprobe': 4}), ("ivf nprobe=16", {'nprobe': 16})]
+    if hnswlib is not None:
+        configs.append(("hnsw", {}))
+
+    for size in sizes:
+        vectors, query_vectors = make_embeddings(size, queries)
+        ids = [str(i) for i in range(size)]
+        kk = min(k, size)
+        truth = None
+        with tempfile.TemporaryDirectory() as tmp:
+            for label, options in configs:
+                backend = label.split()[0]
+                path = os.path.join(tmp, label.replace(" ", "_"))
+                started = time.perf_counter()
+                index = VectorIndex(path, backend=backend, **options)
+                for start in range(0, size, 5000):
+                    index.upsert(ids[start:start + 5000], vectors[start:start + 5000])
+                index.persist()
+                build = time.perf_counter() - started
+
+                started = time.perf_counter()
+                index = VectorIndex(path, backend=backend, **options)
+                opened = time.perf_counter() - started
+                found, batch_ms, single_ms = measure(index, query_vectors, kk)
+                truth = truth or found
+                recall = np.mean([len(set(a) & set(b)) / kk for a, b in zip(found, truth)])
+                print(f"{size:>8} {label:>16} {build:>8.2f} {opened:>7.3f} {batch_ms:>11.3f} "
+                      f"{single_ms:>10.3f} {recall:>10.3f}")
+
+            if chromadb is not None and size <= chroma_limit:
+                started = time.perf_counter()
+                client = chromadb.PersistentClient(os.path.join(tmp, "chroma"))
+                collection = client.create_collection(f"bench-{size}", embedding_function=None)
+                for start in range(0, size, 5000):
+                    collection.add(ids=ids[start:start + 5000], embeddings=vectors[start:start + 5000])
+                build = time.perf_counter() - started
+                started = time.perf_counter()
+                collection = chromadb.PersistentClient(os.path.join(tmp, "chroma")).get_collection(f"bench-{size}")
+                opened = time.perf_counter() - started
+                found, batch_ms, single_ms = measure(collection, query_vectors, kk)
+                recall = np.mean([len(set(a) & set(b)) / kk for a, b in zip(found, truth)])
+                print(f"{size:>8} {'chromadb':>16} {build:>8.2f} {opened:>7.3f} {batch_ms:>11.3f} "
+                      f"{single_ms:>10.3f} {recall:>10.3f}")
+
+if __name__ == "__main__":
+    run()
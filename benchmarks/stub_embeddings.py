@@ -0,0 +1,54 @@
+import re
+import time
+import zlib
+import numpy as np
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9.+#]+")
+
+class StubEmbeddingFunction:
+    """Stand-in for a sentence embedding model: hashed bag-of-tokens vectors with an artificial latency
+
+    Texts sharing tokens get similar vectors, so similarity search behaves sensibly, and each
+    call costs a fixed overhead plus a per-text time, like running a small model in batches.
+    """
+    def __init__(self, dim=384, call_latency=0.005, text_latency=0.0005, model_name="stub-hashing-384", char_ngrams=0):
+        self.dim = dim
+        # Also hash character n-grams of each token, which makes "Java" and "JavaScript" look
+        # alike the way subword models do
+        self.char_ngrams = char_ngrams
+        self.call_latency = call_latency
+        self.text_latency = text_latency
+        self.model_name = model_name
+        self.calls = 0
+        self.texts = 0
+
+    @staticmethod
+    def name():
+        return "stub-hashing"
+
+    def _embed(self, text):
+        vector = np.zeros(self.dim, dtype=np.float32)
+        for token in TOKEN_PATTERN.findall(text.lower()):
+            features = [token]
+            if self.char_ngrams:
+                padded = f"<{token}>"
+                features += [padded[i:i + self.char_ngrams] for i in range(len(padded) - self.char_ngrams + 1)]
+            for feature in features:
+                digest = zlib.crc32(feature.encode('utf-8'))
+                vector[digest % self.dim] += 1.0 if digest & 0x80000000 else -1.0
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def __call__(self, input):
+        texts = [input] if isinstance(input, str) else list(input)
+        self.calls += 1
+        self.texts += len(texts)
+        time.sleep(self.call_latency + self.text_latency * len(texts))
+        return [self._embed(text) for text in texts]
+
+    # Chroma embeds query texts through these
+    def embed_query(self, input):
+        return self(input)
+
+    def embed_documents(self, input):
+        return self(input)
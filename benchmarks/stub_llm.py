@@ -0,0 +1,92 @@
+import asyncio
+import json
+import random
+import re
+import threading
+import time
+from collections import deque
+from benchmarks.bench_portfolio_index import TECHNOLOGIES
+
+SKILLS = TECHNOLOGIES + ['Python', 'SQL', 'Java', 'Pandas', 'Tableau', 'Excel', 'Machine Learning', 'Statistics']
+SKILL_PATTERNS = [(skill, re.compile(rf"(?<![\w.+#]){re.escape(skill)}(?![\w+#])", re.IGNORECASE)) for skill in SKILLS]
+EXPERIENCE_PATTERN = re.compile(r"\d+\+?\s*(?:-\s*\d+\s*)?years?", re.IGNORECASE)
+PAGE_DATA = re.compile(r"### SCRAPED TEXT FROM WEBSITE:\s*(.*?)\s*### INSTRUCTION", re.DOTALL)
+
+class StubRateLimitError(Exception):
+    """What the stub raises past its request limit, shaped like groq.RateLimitError"""
+    status_code = 429
+
+class StubMessage:
+    def __init__(self, content, prompt_tokens, completion_tokens):
+        self.content = content
+        self.response_metadata = {'token_usage': {'prompt_tokens': prompt_tokens,
+                                                  'completion_tokens': completion_tokens}}
+
+class StubChatModel:
+    """Stand-in for ChatGroq: answers the extraction prompt locally with an artificial latency
+
+    Each call costs a fixed overhead plus time per prompt and completion token, and the reply is
+    JSON built from the posting (role from the title line, skills from a keyword list, the first
+    "N years" phrase as experience). Like the hosted API, it rejects requests past
+    requests_per_minute within the period with a 429, and can fail a fraction of calls at random.
+    """
+    def __init__(self, latency=0.1, seconds_per_1k_prompt_tokens=0.05, seconds_per_1k_completion_tokens=0.5,
+                 requests_per_minute=None, period=60.0, failure_rate=0.0, seed=0, model_name="stub-llm"):
+        self.latency = latency
+        self.prompt_rate = seconds_per_1k_prompt_tokens / 1000
+        self.completion_rate = seconds_per_1k_completion_tokens / 1000
+        self.requests_per_minute = requests_per_minute
+        self.period = period
+        self.failure_rate = failure_rate
+        self.random = random.Random(seed)
+        self.model_name = model_name
+        self.accepted = deque()
+        self.lock = threading.Lock()
+        self.calls = 0
+        self.rejected = 0
+
+    def _admit(self):
+        with self.lock:
+            self.calls += 1
+            now = time.monotonic()
+            while self.accepted and self.accepted[0] <= now - self.period:
+                self.accepted.popleft()
+            if self.requests_per_minute and len(self.accepted) >= self.requests_per_minute:
+                self.rejected += 1
+                raise StubRateLimitError("Rate limit reached for requests per minute")
+            self.accepted.append(now)
+            if self.failure_rate and self.random.random() < self.failure_rate:
+                raise ConnectionError("Stub connection reset")
+
+    def _reply(self, prompt):
+        prompt = getattr(prompt, 'text', prompt)
+        match = PAGE_DATA.search(prompt)
+        page = match.group(1) if match else prompt
+        experience = EXPERIENCE_PATTERN.search(page)
+        content = json.dumps({
+            'role': page.split(" | ")[0].strip()[:80],
+            'experience': experience.group(0) if experience else None,
+            'skills': [skill for skill, pattern in SKILL_PATTERNS if pattern.search(page)],
+        })
+        prompt_tokens, completion_tokens = len(prompt) // 4, len(content) // 4
+        delay = self.latency + self.prompt_rate * prompt_tokens + self.completion_rate * completion_tokens
+        return StubMessage(content, prompt_tokens, completion_tokens), delay
+
+    def invoke(self, input, config=None):
+        self._admit()
+        message, delay = self._reply(input)
+        time.sleep(delay)
+        return message
+
+    async def ainvoke(self, input, config=None):
+        self._admit()
+        message, delay = self._reply(input)
+        await asyncio.sleep(delay)
+        return message
+
+    async def abatch(self, inputs, config=None, return_exceptions=False):
+        slots = asyncio.Semaphore((config or {}).get('max_concurrency') or len(inputs) or 1)
+        async def call(prompt):
+            async with slots:
+                return await self.ainvoke(prompt)
+        return await asyncio.gather(*(call(prompt) for prompt in inputs), return_exceptions=return_exceptions)
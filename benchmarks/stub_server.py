@@ -0,0 +1,145 @@
+import hashlib
+import threading
+import zlib
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+JOB_PAGE_TEMPLATE = """<html><body>
+<section class="top-card-layout">
+  <h2 class="top-card-layout__title topcard__title">Python Developer {job_id}</h2>
+  <a class="topcard__org-name-link topcard__flavor--black-link" href="#">Stub Company {company}</a>
+  <span class="topcard__flavor topcard__flavor--bullet">Toronto, Ontario, Canada</span>
+  <span class="posted-time-ago__text topcard__flavor--metadata">{days} days ago</span>
+  <span class="num-applicants__caption topcard__flavor--metadata">{applicants} applicants</span>
+</section>
+<div class="description__text">
+  <div class="show-more-less-html__markup">
+    We are hiring a Python Developer to build data pipelines. This is a full-time, hybrid role.
+    Salary: $90,000 - $110,000 per year. Application deadline: June 30, 2025.
+    Please contact Jane Smith at jobs{job_id}@example.com with your resume.
+  </div>
+</div>
+<ul class="description__job-criteria-list">
+  <li class="description__job-criteria-item">
+    <h3 class="description__job-criteria-subheader">Seniority level</h3>
+    <span class="description__job-criteria-text">Mid-Senior level</span>
+  </li>
+  <li class="description__job-criteria-item">
+    <h3 class="description__job-criteria-subheader">Employment type</h3>
+    <span class="description__job-criteria-text">Full-time</span>
+  </li>
+</ul>
+</body></html>"""
+
+SEARCH_CARD_TEMPLATE = """<li><div class="base-card" data-entity-urn="urn:li:jobPosting:{job_id}"></div></li>"""
+
+class StubLinkedInHandler(BaseHTTPRequestHandler):
+    """Serve canned LinkedIn guest API pages with an artificial latency"""
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        server = self.server
+        with server.stats_lock:
+            server.request_count += 1
+            request_number = server.request_count
+        time.sleep(server.latency)
+
+        # Inject throttling/server errors to exercise client retries
+        if server.fail_every and request_number % server.fail_every == 0:
+            self.send_response(server.fail_status)
+            if server.retry_after is not None:
+                self.send_header("Retry-After", str(server.retry_after))
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        url = urlparse(self.path)
+        if url.path.startswith("/jobs-guest/jobs/api/jobPosting/"):
+            job_id = url.path.rsplit("/", 1)[-1]
+            body = JOB_PAGE_TEMPLATE.format(
+                job_id=job_id,
+                company=int(job_id) % 50,
+                days=int(job_id) % 30 + 1,
+                applicants=int(job_id) % 200
+            )
+        elif url.path.startswith("/jobs-guest/jobs/api/seeMoreJobPostings/search"):
+            query = parse_qs(url.query)
+            start = int(query.get("start", ["0"])[0])
+            if server.repeat_last_page and start >= server.total_jobs:
+                # Some searches keep serving the final page instead of an empty one
+                start = max(0, (server.total_jobs - 1) // 25 * 25)
+            end = min(start + 25, server.total_jobs)
+            offset = 0
+            if server.vary_by_query:
+                search = f"{query.get('keywords', [''])[0]}|{query.get('location', [''])[0]}"
+                offset = zlib.crc32(search.encode("utf-8")) % 1000 * 10000
+            # Like LinkedIn, optionally repeat the last few cards of the previous page
+            first = max(0, start - server.page_overlap) if start < end else start
+            body = "".join(SEARCH_CARD_TEMPLATE.format(job_id=1000000 + offset + i) for i in range(first, end))
+        else:
+            self.send_error(404)
+            return
+
+        data = body.encode("utf-8")
+        etag = '"' + hashlib.md5(data).hexdigest() + '"'
+        if self.headers.get("If-None-Match") == etag:
+            with server.stats_lock:
+                server.not_modified += 1
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        self.send_response(200)
+        self.send_header("ETag", etag)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass
+
+class StubLinkedInServer(ThreadingHTTPServer):
+    """Local stand-in for linkedin.com used by the benchmarks"""
+    daemon_threads = True
+    request_queue_size = 128
+
+    def __init__(self, latency=0.05, total_jobs=250, port=0, fail_every=0, fail_status=429, retry_after=None,
+                 page_overlap=0, repeat_last_page=False, vary_by_query=False):
+        super().__init__(("127.0.0.1", port), StubLinkedInHandler)
+        self.latency = latency
+        self.total_jobs = total_jobs
+        self.fail_every = fail_every
+        self.fail_status = fail_status
+        self.retry_after = retry_after
+        self.page_overlap = page_overlap
+        self.repeat_last_page = repeat_last_page
+        self.vary_by_query = vary_by_query
+        self.request_count = 0
+        self.not_modified = 0
+        self.stats_lock = threading.Lock()
+        self.thread = None
+
+    @property
+    def base_url(self):
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+    def start(self):
+        """Serve requests on a background thread"""
+        self.thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
@@ -0,0 +1,213 @@
+import re
+from dataclasses import dataclass, field
+from html.parser import HTMLParser
+from typing import List
+from posting_parser import BLOCK_TAGS, FIELD_RULES, parse_job_posting
+
+# Enough for the responsibilities and requirements of a typical posting
+DEFAULT_TOKEN_BUDGET = 600
+
+# The element the scraper reads descriptions from
+DESCRIPTION_CLASS = next(fragment for name, _, fragment in FIELD_RULES if name == 'description')
+KEPT_CRITERIA = ('Seniority level', 'Employment type')
+
+# Flattened page text (WebBaseLoader): the posting ends where the page's own UI starts again
+# and begins after the last piece of top card, sign-in prompt or button text before that
+PAGE_END = re.compile(r"\bShow more\b|\bSeniority level\b|\bReferrals increase your chances\b"
+                      r"|\bSimilar jobs\b|\bPeople also viewed\b")
+PAGE_START = re.compile(r"\bReport this job\b|\bApply\s+Save\b|\bEasy Apply\b|\bSign in\b|\bJoin now\b"
+                        r"|\bapply directly on company website\.?|\b(?:Over )?\d+ applicants\b"
+                        r"|\bBe among the first \d+ applicants\b|\b\d+\s+(?:minute|hour|day|week|month)s?\s+ago\b")
+PAGE_CRITERIA = re.compile(r"\b(Seniority level|Employment type)\s+(.+?)(?=\s+(?:Employment type|Job function"
+                           r"|Industries|Similar jobs|People also viewed|Referrals increase|Show less)\b|$)")
+
+# Section headings, by how much they matter for role, experience and skills (lower is kept first);
+# None marks sections that are dropped outright
+SECTIONS = (
+    (0, ("Qualifications", "Minimum qualifications", "Basic qualifications", "Preferred qualifications",
+         "Requirements", "What you bring", "What you'll bring", "What you will bring", "What we're looking for",
+         "What we are looking for", "Who you are", "About you", "Skills", "Required skills", "Must have", "Must-haves",
+         "Nice to have", "Nice-to-haves", "Bonus points", "Experience")),
+    (1, ("Responsibilities", "Key responsibilities", "What you'll do", "What you will do", "Your role",
+         "The role", "About the role", "About the job", "About this role", "About the position", "About the team", "Role overview",
+         "Job summary", "Duties", "Day to day", "In this role", "The opportunity")),
+    (None, ("About us", "About the company", "Who we are", "Our company", "Company overview", "Benefits", "Perks",
+            "What we offer", "Why join us", "Compensation", "Salary", "Pay range", "Equal opportunity",
+            "Equal employment opportunity", "EEO", "Diversity", "Accommodations", "Accommodation", "How to apply",
+            "Privacy", "Disclaimer")),
+)
+SECTION_PRIORITY = {phrase.lower(): priority for priority, phrases in SECTIONS for phrase in phrases}
+INTRO_PRIORITY = 2
+
+# A heading starts a line or a sentence, is capitalized, and is followed by a colon, a line
+# break or the capitalized start of its content; "About <Company>" is the company blurb, but
+# "About You", "About The Team" and the like are the posting's own sections, not a company
+_phrases = sorted(SECTION_PRIORITY, key=len, reverse=True)
+HEADING = re.compile(
+    r"(?:^|(?<=[.!?:)\]] ))(?P<heading>" + "|".join(f"{re.escape(p[0].upper())}(?i:{re.escape(p[1:])})" for p in _phrases)
+    + r"|About (?!(?:You|Your|The|This|Our|Us|We)\b)[A-Z][\w&.'-]*(?: [A-Z][\w&.'-]*)?)(?=\s*:|[ \t]*$|\s+[A-Z0-9(•*-])",
+    re.MULTILINE)
+
+# Sentences dropped wherever they appear
+BOILERPLATE = re.compile(r"\b(?:equal opportunity employer|regardless of (?:race|colou?r|religion|gender|age)"
+                         r"|reasonable accommodations?)\b", re.IGNORECASE)
+
+def estimate_tokens(text):
+    """Rough token count for English text and code (about four characters per token)"""
+    return (len(text) + 3) // 4
+
+def _clean(text):
+    """Collapse runs of spaces and blank lines, keeping line breaks"""
+    lines = (re.sub(r"\s+", " ", line).strip() for line in text.splitlines())
+    return "\n".join(line for line in lines if line)
+
+class _PageText(HTMLParser):
+    """Visible text of a page, or only of the elements whose class contains class_fragment,
+    with line breaks at block elements and list items marked with a dash
+    """
+    BLOCKS = BLOCK_TAGS
+
+    def __init__(self, class_fragment=None):
+        super().__init__(convert_charrefs=True)
+        self.class_fragment = class_fragment
+        self.depth = 0 if class_fragment else 1  # > 0 while inside a captured element
+        self.tag = None
+        self.skip = 0
+        self.parts = []
+
+    def handle_starttag(self, tag, attrs):
+        if tag in ('script', 'style'):
+            self.skip += 1
+        if self.class_fragment:
+            if self.depth and tag == self.tag:
+                self.depth += 1
+            elif not self.depth and self.class_fragment in (dict(attrs).get('class') or ''):
+                self.tag, self.depth = tag, 1
+        if self.depth and tag in self.BLOCKS:
+            self.parts.append("\n- " if tag == 'li' else "\n")
+
+    def handle_endtag(self, tag):
+        if tag in ('script', 'style'):
+            self.skip = max(0, self.skip - 1)
+        if self.depth and tag in self.BLOCKS:
+            self.parts.append("\n")
+        if self.class_fragment and self.depth and tag == self.tag:
+            self.depth -= 1
+
+    def handle_data(self, data):
+        if self.depth and not self.skip:
+            self.parts.append(data)
+
+    def text(self):
+        return _clean("".join(self.parts))
+
+def _html_text(html, class_fragment=None):
+    parser = _PageText(class_fragment)
+    parser.feed(html)
+    parser.close()
+    return parser.text()
+
+def is_html(text):
+    return re.search(r"<(?:html|body|div|section|p|ul)\b", text[:5000], re.IGNORECASE) is not None
+
+def posting_text(text, page=False):
+    """The posting body of a LinkedIn job page: its show-more-less-html__markup description plus
+    seniority and employment type, from raw HTML or, when page is True, from flattened page text.
+    Other text (such as a description from the job store) is only cleaned up: phrases like
+    "Sign in" or "3 days ago" can be part of a real posting, so the page markers aren't applied.
+    """
+    if is_html(text):
+        description = _html_text(text, DESCRIPTION_CLASS)
+        if not description:
+            return posting_text(_html_text(text), page=True)
+        criteria = parse_job_posting(text).criteria
+        lines = [f"{name}: {value}" for name, value in criteria.items() if name in KEPT_CRITERIA]
+        return "\n".join([description] + lines)
+
+    end = PAGE_END.search(text) if page else None
+    if not end:
+        return _clean(text)
+    start = max((match.end() for match in PAGE_START.finditer(text, 0, end.start())), default=0)
+    criteria = [f"{name}: {value.rstrip(' -')}" for name, value in PAGE_CRITERIA.findall(text[end.start():])]
+    return "\n".join([_clean(text[start:end.start()])] + criteria)
+
+@dataclass
+class TrimmedDescription:
+    """A posting cut down for an LLM prompt, with its size before and after"""
+    text: str
+    tokens_before: int
+    tokens_after: int
+    kept: List[str] = field(default_factory=list)
+    dropped: List[str] = field(default_factory=list)
+    truncated: bool = False
+
+def _sections(text):
+    """(heading, priority, text) of each section in order; text before the first heading is the intro"""
+    sections = []
+    matches = list(HEADING.finditer(text))
+    if not matches or matches[0].start() > 0:
+        sections.append(("intro", INTRO_PRIORITY, text[:matches[0].start() if matches else len(text)]))
+    for match, following in zip(matches, matches[1:] + [None]):
+        heading = match.group('heading')
+        priority = SECTION_PRIORITY.get(heading.lower())
+        sections.append((heading, priority, text[match.start():following.start() if following else len(text)]))
+    return sections
+
+def _strip_boilerplate(text):
+    if not BOILERPLATE.search(text):
+        return text
+    lines = (" ".join(sentence for sentence in re.split(r"(?<=[.!?]) ", line) if not BOILERPLATE.search(sentence))
+             for line in text.splitlines())
+    return "\n".join(line for line in lines if line)
+
+def _cut(text, tokens):
+    """The longest prefix of text within the token count that ends at a line or sentence break"""
+    limit = tokens * 4
+    if len(text) <= limit:
+        return text
+    head = text[:limit]
+    end = max(head.rfind("\n"), head.rfind(". "))
+    return head[:end + 1].rstrip() if end > 0 else ""
+
+def trim_description(text, token_budget=DEFAULT_TOKEN_BUDGET, page=False):
+    """Cut a job page or description down to the parts an extraction prompt needs
+
+    Pass page=True for flattened page text (what WebBaseLoader returns); HTML is always read as
+    a page. Page chrome goes first (see posting_text), then company blurbs, benefits,
+    compensation and EEO sections. If what's left is still over token_budget, requirements are
+    kept before responsibilities before the intro, and the last section that fits is cut at a
+    sentence break.
+    tokens_before counts the whitespace-collapsed visible text of the input.
+    """
+    visible = _html_text(text) if is_html(text) else text
+    tokens_before = estimate_tokens(re.sub(r"\s+", " ", visible).strip())
+    result = TrimmedDescription("", tokens_before, 0)
+
+    body = posting_text(text, page)
+    criteria = [line for line in body.splitlines() if line.split(":")[0] in KEPT_CRITERIA]
+    body = "\n".join(line for line in body.splitlines() if line not in criteria)
+    budget = token_budget - estimate_tokens("\n".join(criteria)) if token_budget else None
+
+    chosen = {}
+    sections = _sections(body)
+    for index, (heading, priority, text) in sorted(enumerate(sections), key=lambda item: (
+            item[1][1] is None, item[1][1] or 0, item[0])):
+        text = _strip_boilerplate(text).strip()
+        if priority is None or not text:
+            result.dropped.append(heading)
+            continue
+        if budget is not None:
+            tokens = estimate_tokens(text)
+            if tokens > budget:
+                text = _cut(text, budget)
+                result.truncated = True
+                if len(text) <= len(heading) + 1:
+                    result.dropped.append(heading)
+                    continue
+            budget -= estimate_tokens(text) + 1
+        chosen[index] = text
+        result.kept.append(heading)
+
+    result.text = _clean("\n".join([chosen[index] for index in sorted(chosen)] + criteria))
+    result.tokens_after = estimate_tokens(result.text)
+    return result
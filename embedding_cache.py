@@ -0,0 +1,144 @@
+import hashlib
+import json
+import os
+import re
+import threading
+import unicodedata
+import numpy as np
+
+EMBEDDING_CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "job_tracker", "embedding_cache")
+
+# Chroma's default embedding model, which the portfolio collection was built with
+DEFAULT_MODEL = "all-MiniLM-L6-v2"
+
+KEY_BYTES = 16
+
+def normalize_text(text):
+    """Unicode-normalize and collapse whitespace, so trivially different copies of a text share an embedding"""
+    return " ".join(unicodedata.normalize('NFKC', str(text)).split())
+
+def text_key(normalized_text):
+    return hashlib.blake2b(normalized_text.encode('utf-8'), digest_size=KEY_BYTES).digest()
+
+def model_name(embedding_function):
+    """Best-effort model name of an embedding function, used to keep each model's vectors apart"""
+    return (getattr(embedding_function, 'model_name', None) or getattr(embedding_function, 'MODEL_NAME', None)
+            or type(embedding_function).__name__)
+
+def default_embedding_function():
+    """Chroma's default sentence embedding model"""
+    try:
+        from chromadb.utils.embedding_functions import DefaultEmbeddingFunction
+    except ImportError:
+        raise RuntimeError("The default embedding model needs chromadb: pip install chromadb")
+    return DefaultEmbeddingFunction()
+
+class EmbeddingCache:
+    """Persistent embeddings keyed by (model, normalized text hash)
+
+    Each model gets a directory holding a float32 matrix (vectors.f32, memory-mapped on load) and
+    an index file (keys.bin) of 16-byte text hashes, one per matrix row. Both files are only ever
+    appended to, vectors first, so a crash mid-write leaves at worst a few unindexed rows.
+
+    The cache is itself an embedding function: pass it wherever one is accepted and only texts it
+    has never seen reach the model, in batches.
+    """
+    def __init__(self, embedding_function=None, model=None, directory=EMBEDDING_CACHE_PATH, batch_size=256):
+        if embedding_function is None:
+            embedding_function, model = default_embedding_function(), model or DEFAULT_MODEL
+        self.embedding_function = embedding_function
+        self.model = model or model_name(embedding_function)
+        self.batch_size = max(1, batch_size)
+        self.directory = os.path.join(directory, re.sub(r'[^A-Za-z0-9._-]+', '_', self.model))
+        os.makedirs(self.directory, exist_ok=True)
+        self.lock = threading.Lock()
+        self.stats = {'hits': 0, 'misses': 0, 'model_calls': 0}  # misses count distinct texts sent to the model
+        self._load()
+
+    def _path(self, name):
+        return os.path.join(self.directory, name)
+
+    def _load(self):
+        """Read the index and memory-map the vectors it covers"""
+        self.dim = None
+        self.index = {}
+        self._vectors = None
+        if not os.path.exists(self._path("meta.json")):
+            return
+        with open(self._path("meta.json")) as f:
+            self.dim = json.load(f)['dim']
+        with open(self._path("keys.bin"), 'rb') as f:
+            keys = f.read()
+        rows = min(len(keys) // KEY_BYTES, os.path.getsize(self._path("vectors.f32")) // (4 * self.dim))
+        self.index = {keys[row * KEY_BYTES:(row + 1) * KEY_BYTES]: row for row in range(rows)}
+        self._map(rows)
+
+    def _map(self, rows):
+        self._vectors = (np.memmap(self._path("vectors.f32"), dtype=np.float32, mode='r', shape=(rows, self.dim))
+                         if rows else None)
+
+    def _append(self, keys, vectors):
+        if self.dim is None:
+            self.dim = vectors.shape[1]
+            with open(self._path("meta.json"), 'w') as f:
+                json.dump({'model': self.model, 'dim': self.dim}, f)
+        elif vectors.shape[1] != self.dim:
+            raise ValueError(f"{self.model} returned {vectors.shape[1]}-dimensional vectors, cache holds {self.dim}")
+
+        # Rows that outlived their keys after an interrupted write are overwritten, not indexed
+        start = len(self.index)
+        self._vectors = None
+        with open(self._path("vectors.f32"), 'r+b' if os.path.exists(self._path("vectors.f32")) else 'wb') as f:
+            f.seek(start * 4 * self.dim)
+            f.write(np.ascontiguousarray(vectors, dtype=np.float32).tobytes())
+            f.truncate()
+        with open(self._path("keys.bin"), 'r+b' if os.path.exists(self._path("keys.bin")) else 'wb') as f:
+            f.seek(start * KEY_BYTES)
+            f.write(b"".join(keys))
+            f.truncate()
+        for offset, key in enumerate(keys):
+            self.index[key] = start + offset
+        self._map(len(self.index))
+
+    def embed(self, texts):
+        """Embeddings of texts as an (n, dim) float32 array, calling the model only for unseen texts"""
+        normalized = [normalize_text(text) for text in texts]
+        keys = [text_key(text) for text in normalized]
+        with self.lock:
+            missing = {}
+            for key, text in zip(keys, normalized):
+                if key not in self.index:
+                    missing.setdefault(key, text)
+            self.stats['misses'] += len(missing)
+            self.stats['hits'] += len(keys) - len(missing)
+
+            missing = list(missing.items())
+            for start in range(0, len(missing), self.batch_size):
+                batch = missing[start:start + self.batch_size]
+                vectors = np.asarray(self.embedding_function([text for _, text in batch]), dtype=np.float32)
+                self.stats['model_calls'] += 1
+                self._append([key for key, _ in batch], vectors)
+
+            if not keys:
+                return np.empty((0, self.dim or 0), dtype=np.float32)
+            return np.array(self._vectors[[self.index[key] for key in keys]])
+
+    # Embedding-function interface, so the cache can stand in for the model it wraps
+    def __call__(self, input):
+        return list(self.embed([input] if isinstance(input, str) else input))
+
+    def embed_query(self, input):
+        return self(input)
+
+    def embed_documents(self, input):
+        return self(input)
+
+    def __len__(self):
+        return len(self.index)
+
+    def print_stats(self):
+        stats = self.stats
+        lookups = stats['hits'] + stats['misses']
+        rate = stats['hits'] / lookups if lookups else 0.0
+        print(f"Embedding cache ({self.model}): {stats['hits']} hits, {stats['misses']} misses ({rate:.0%} hit rate), "
+              f"{stats['model_calls']} model calls, {len(self)} texts cached")
@@ -0,0 +1,189 @@
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+import requests
+from requests.adapters import HTTPAdapter
+from response_cache import OfflineCacheMiss
+
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+class RequestBudgetExhausted(requests.RequestException):
+    """Raised instead of sending a request once the shared budget is used up"""
+
+class RequestBudget:
+    """Thread-safe cap on the number of HTTP requests several searches may send together"""
+    def __init__(self, limit):
+        self.limit = limit
+        self.used = 0
+        self._lock = threading.Lock()
+
+    def take(self):
+        """Reserve one request, returning False when none are left"""
+        with self._lock:
+            if self.used >= self.limit:
+                return False
+            self.used += 1
+            return True
+
+    @property
+    def remaining(self):
+        return max(0, self.limit - self.used)
+
+class HttpClient:
+    """Shared requests session with connection pooling, retries with backoff and latency stats"""
+    def __init__(self, headers=None, pool_size=10, max_retries=3, backoff_factor=1.0,
+                 max_backoff=60.0, timeout=30, cache=None, budget=None, cancel_event=None):
+        self.cache = cache  # Optional ResponseCache consulted before every GET
+        self.budget = budget  # Optional RequestBudget charged for every request sent, retries included
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.timeout = timeout
+        # Setting cancel_event cuts retry waits short: the last error or response is returned instead
+        self.cancel_event = cancel_event or threading.Event()
+
+        # Keep-alive connections are reused across requests and worker threads
+        self.session = requests.Session()
+        if headers:
+            self.session.headers.update(headers)
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=0)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+        self.latencies = []
+        self.retries = 0
+        self.failures = 0
+        self._stats_lock = threading.Lock()
+
+    def get(self, url, **kwargs):
+        """GET a URL through the response cache, if there is one"""
+        if self.cache is None:
+            return self._get(url, **kwargs)
+
+        cache_url = requests.Request('GET', url, params=kwargs.get('params')).prepare().url
+        entry = self.cache.lookup(cache_url)
+        if entry and (self.cache.offline or self.cache.is_fresh(entry)):
+            response = self.cache.response(entry)
+            if response is not None:
+                return response
+        if self.cache.offline:
+            raise OfflineCacheMiss(f"{cache_url} is not in the response cache")
+
+        if entry:
+            # Revalidate: a 304 means the cached body is still current
+            headers = dict(kwargs.get('headers') or {})
+            headers.update(self.cache.conditional_headers(entry))
+            response = self._get(url, **dict(kwargs, headers=headers))
+            if response.status_code == 304:
+                cached = self.cache.response(entry, revalidated=True)
+                if cached is not None:
+                    return cached
+                response = self._get(url, **kwargs)
+        else:
+            response = self._get(url, **kwargs)
+
+        self.cache.record_miss()
+        if response.status_code == 200:
+            self.cache.store(cache_url, response)
+        return response
+
+    def _get(self, url, **kwargs):
+        """GET a URL, retrying on connection errors and 429/5xx responses"""
+        kwargs.setdefault("timeout", self.timeout)
+
+        for attempt in range(self.max_retries + 1):
+            if self.budget is not None and not self.budget.take():
+                raise RequestBudgetExhausted(f"Request budget of {self.budget.limit} used up before {url}")
+            started = time.perf_counter()
+            try:
+                response = self.session.get(url, **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                self._record(time.perf_counter() - started)
+                if attempt == self.max_retries:
+                    with self._stats_lock:
+                        self.failures += 1
+                    raise
+                delay = self._backoff(attempt)
+                print(f"Request to {url} failed ({e}), retrying in {delay:.1f}s")
+                if not self._wait(delay):
+                    raise
+                continue
+
+            self._record(time.perf_counter() - started)
+            if response.status_code in RETRY_STATUSES and attempt < self.max_retries:
+                delay = self._retry_after(response)
+                if delay is None:
+                    delay = self._backoff(attempt)
+                print(f"Got status {response.status_code} from {url}, retrying in {delay:.1f}s")
+                if self._wait(delay):
+                    response.close()
+                    continue
+
+            if response.status_code in RETRY_STATUSES:
+                with self._stats_lock:
+                    self.failures += 1
+            return response
+
+    def _backoff(self, attempt):
+        """Exponential backoff with full jitter"""
+        return random.uniform(0, min(self.max_backoff, self.backoff_factor * (2 ** attempt)))
+
+    def _retry_after(self, response):
+        """Read the Retry-After header as seconds, if the server sent one"""
+        value = response.headers.get("Retry-After")
+        if not value:
+            return None
+
+        try:
+            delay = float(value)
+        except ValueError:
+            try:
+                retry_at = parsedate_to_datetime(value)
+                delay = (retry_at - datetime.now(timezone.utc)).total_seconds()
+            except (TypeError, ValueError):
+                return None
+        return min(self.max_backoff, max(0.0, delay))
+
+    def _wait(self, delay):
+        """Sleep before a retry, returning False if cancel_event was set meanwhile"""
+        with self._stats_lock:
+            self.retries += 1
+        return not self.cancel_event.wait(delay)
+
+    def _record(self, seconds):
+        with self._stats_lock:
+            self.latencies.append(seconds)
+
+    def latency_stats(self):
+        """Summarize per-request latency in milliseconds"""
+        with self._stats_lock:
+            latencies = sorted(self.latencies)
+            retries = self.retries
+            failures = self.failures
+
+        stats = {'requests': len(latencies), 'retries': retries, 'failures': failures}
+        if latencies:
+            stats.update({
+                'mean_ms': 1000 * sum(latencies) / len(latencies),
+                'p50_ms': 1000 * latencies[len(latencies) // 2],
+                'p95_ms': 1000 * latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))],
+                'max_ms': 1000 * latencies[-1]
+            })
+        return stats
+
+    def print_stats(self):
+        """Print a one-line latency report"""
+        stats = self.latency_stats()
+        if not stats['requests']:
+            print("HTTP: no requests made")
+        else:
+            print(f"HTTP: {stats['requests']} requests, {stats['retries']} retries, {stats['failures']} failures, "
+                  f"mean {stats['mean_ms']:.0f} ms, p50 {stats['p50_ms']:.0f} ms, "
+                  f"p95 {stats['p95_ms']:.0f} ms, max {stats['max_ms']:.0f} ms")
+        if self.cache is not None:
+            self.cache.print_stats()
+
+    def close(self):
+        self.session.close()
@@ -0,0 +1,69 @@
+import os
+import pandas as pd
+from job_store import open_store
+
+# pyarrow is optional; only the Parquet export and loader need it
+try:
+    import pyarrow.parquet as pq
+except ImportError:
+    pq = None
+
+ARCHIVE_PATH = "job_tracker/jobs.parquet"
+
+CATEGORY_COLUMNS = ['status', 'type', 'company', 'work_mode', 'location']
+DATE_COLUMNS = ['posting_date', 'date_applied']
+TIMESTAMP_COLUMNS = ['first_seen', 'last_scraped']
+
+# Small enough that posting-date and status filters can skip most of a year of history
+ROW_GROUP_SIZE = 8192
+
+def _require_pyarrow():
+    if pq is None:
+        raise RuntimeError("Parquet support needs pyarrow: pip install pyarrow")
+
+def typed_jobs_frame(df):
+    """Give job columns real types: categoricals for repeated labels, datetimes for dates"""
+    df = df.copy()
+    for col in CATEGORY_COLUMNS:
+        if col in df.columns:
+            df[col] = df[col].astype('category')
+    for col in DATE_COLUMNS:
+        if col in df.columns:
+            df[col] = pd.to_datetime(df[col], format="%Y-%m-%d", errors='coerce')
+    for col in TIMESTAMP_COLUMNS:
+        if col in df.columns:
+            df[col] = pd.to_datetime(df[col], errors='coerce')
+    return df
+
+def export_parquet(store=None, path=ARCHIVE_PATH, compression='zstd'):
+    """Write every job in the store to a Parquet file sorted by posting date"""
+    _require_pyarrow()
+    store = store or open_store()
+    df = typed_jobs_frame(store.load_dataframe())
+    df = df.sort_values(['posting_date', 'job_id'], na_position='first', ignore_index=True)
+
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    df.to_parquet(path, engine='pyarrow', index=False, compression=compression, row_group_size=ROW_GROUP_SIZE)
+    print(f"Exported {len(df)} jobs to {path} ({os.path.getsize(path) / 1e6:.1f} MB)")
+    return path
+
+def load_parquet(path=ARCHIVE_PATH, columns=None, status=None, posted_since=None):
+    """Load jobs from a Parquet export, reading only the requested columns and matching row groups
+
+    The file is memory-mapped, and the status and posting-date filters are pushed down to
+    the reader, so row groups that cannot match are never decoded.
+    """
+    _require_pyarrow()
+    filters = []
+    if status:
+        filters.append(('status', '==', status))
+    if posted_since is not None:
+        filters.append(('posting_date', '>=', pd.Timestamp(posted_since)))
+
+    table = pq.read_table(path, columns=columns, filters=filters or None, memory_map=True)
+    return table.to_pandas()
+
+if __name__ == "__main__":
+    export_parquet()
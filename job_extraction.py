@@ -0,0 +1,301 @@
+import argparse
+import asyncio
+import json
+import os
+import re
+import time
+from collections import deque
+from description_trim import DEFAULT_TOKEN_BUDGET, estimate_tokens, trim_description
+from job_store import open_store
+from llm_cache import LLMCache
+
+# The chat model is optional: only needed when the pipeline is given no llm of its own
+try:
+    from langchain_groq import ChatGroq
+except ImportError:
+    ChatGroq = None
+
+DEFAULT_MODEL = "llama-3.1-8b-instant"
+
+# Bump when the prompt changes so stored extractions from the old prompt are redone
+# (2: descriptions are trimmed to the posting body and a token budget)
+PROMPT_VERSION = 2
+
+EXTRACTION_PROMPT = """
+### SCRAPED TEXT FROM WEBSITE:
+{page_data}
+
+### INSTRUCTION:
+The scraped text is from a LinkedIn job posting page.
+Your job is to extract the job details and return them in JSON format containing the
+following keys:
+- `role`: The job title
+- `experience`: Required experience level
+- `skills`: List of required skills
+
+Only return the valid JSON without any additional text or explanation.
+
+### VALID JSON (NO PREAMBLE):
+"""
+
+JSON_OBJECT = re.compile(r"\{.*\}", re.DOTALL)
+
+def build_prompt(job, description):
+    """The extraction prompt for one job record, led by the metadata the scraper already has"""
+    header = " | ".join(str(job[key]) for key in ('job_title', 'company', 'location') if job.get(key))
+    page_data = re.sub(r"\s+", " ", f"{header}\n{description}").strip()
+    return EXTRACTION_PROMPT.format(page_data=page_data)
+
+def parse_extraction(content):
+    """Pull role, experience and skills out of a model reply, tolerating code fences and preambles"""
+    match = JSON_OBJECT.search(content)
+    if not match:
+        raise ValueError("No JSON object in the model reply")
+    data = json.loads(match.group(0))
+    skills = data.get('skills') or []
+    if isinstance(skills, str):
+        skills = skills.split(',')
+    skills = list(dict.fromkeys(str(skill).strip() for skill in skills if str(skill).strip()))
+    experience = data.get('experience')
+    if isinstance(experience, (list, dict)):
+        experience = json.dumps(experience)
+    return {'role': data.get('role'), 'experience': experience, 'skills': skills}
+
+def is_rate_limit(error):
+    return getattr(error, 'status_code', None) == 429 or 'rate limit' in str(error).lower()
+
+class RateLimiter:
+    """Request and token limits over a sliding window (a minute, like Groq's), shared by all calls
+
+    acquire() waits until starting one more request of the given size keeps both counts within
+    their limits. A request larger than the whole token budget is let through on an idle window
+    instead of waiting forever.
+    """
+    def __init__(self, requests_per_minute=None, tokens_per_minute=None, period=60.0):
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.period = period
+        self.started = deque()  # (monotonic time, tokens) of requests inside the window
+        self.tokens = 0
+        self.waits = 0
+        self.waited = 0.0
+
+    def _delay(self, tokens, now):
+        while self.started and self.started[0][0] <= now - self.period:
+            self.tokens -= self.started.popleft()[1]
+        delay = 0.0
+        if self.requests_per_minute and len(self.started) >= self.requests_per_minute:
+            delay = self.started[len(self.started) - self.requests_per_minute][0] + self.period - now
+        if self.tokens_per_minute and self.started and self.tokens + tokens > self.tokens_per_minute:
+            # Wait for enough of the oldest requests to leave the window
+            excess = self.tokens + tokens - self.tokens_per_minute
+            for started, size in self.started:
+                excess -= size
+                if excess <= 0:
+                    break
+            delay = max(delay, started + self.period - now)
+        return delay
+
+    async def acquire(self, tokens=0):
+        while True:
+            now = time.monotonic()
+            delay = self._delay(tokens, now)
+            if delay <= 0:
+                self.started.append((now, tokens))
+                self.tokens += tokens
+                return
+            self.waits += 1
+            self.waited += delay
+            await asyncio.sleep(delay)
+
+def default_llm(model=DEFAULT_MODEL, max_output_tokens=256):
+    """ChatGroq at temperature 0, keyed by GROQ_API_KEY; retries are left to the pipeline"""
+    if ChatGroq is None:
+        raise RuntimeError("Job extraction needs langchain-groq: pip install langchain-groq")
+    api_key = os.environ.get("GROQ_API_KEY")
+    if not api_key:
+        raise RuntimeError("Set GROQ_API_KEY to run job extraction against Groq")
+    return ChatGroq(model_name=model, temperature=0, groq_api_key=api_key, max_tokens=max_output_tokens,
+                    max_retries=0)
+
+class ExtractionPipeline:
+    """Extract role, experience and skills from stored job descriptions with a chat model
+
+    Jobs are sent the way Runnable.abatch(config={'max_concurrency': n}) sends them, with at most
+    max_in_flight requests open at once, but each request first waits on the request/token rate
+    limiter, failures are retried with backoff instead of failing the batch, and results are
+    written to the job store every write_batch jobs so an interrupted run keeps its progress.
+    With an LLMCache, prompts answered before (same model, prompt version and text) skip the
+    API, the limiter and the in-flight slots entirely.
+    Descriptions are first cut down to token_budget tokens by trim_description (None keeps
+    them whole apart from boilerplate).
+    The llm only needs an async ainvoke(prompt) returning a message with .content.
+    """
+    def __init__(self, llm=None, store=None, model=None, max_in_flight=4, requests_per_minute=None,
+                 tokens_per_minute=None, max_output_tokens=256, max_retries=3, retry_backoff=1.0,
+                 write_batch=25, rate_period=60.0, cache=None, token_budget=DEFAULT_TOKEN_BUDGET):
+        self.model = model or getattr(llm, 'model_name', None) or DEFAULT_MODEL
+        self.llm = llm if llm is not None else default_llm(self.model, max_output_tokens)
+        self.store = store if store is not None else open_store()
+        self.max_in_flight = max_in_flight
+        self.limiter = RateLimiter(requests_per_minute, tokens_per_minute, rate_period)
+        self.max_output_tokens = max_output_tokens
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        self.write_batch = write_batch
+        self.cache = cache
+        self.token_budget = token_budget
+        self.unsaved = []
+        self.in_flight = 0
+        self.stats = {}
+
+    def pending_jobs(self, refresh=False, limit=None):
+        """Stored jobs with a description that have no extraction from this model and prompt version"""
+        if refresh:
+            job_ids = [job_id for job_id, _ in self.store.iter_descriptions()]
+        else:
+            job_ids = self.store.pending_extractions(self.model, PROMPT_VERSION)
+        jobs = (self.store.get_job(job_id) for job_id in job_ids[:limit])
+        return [job for job in jobs if job]
+
+    def _flush(self):
+        if self.unsaved:
+            self.store.save_extractions(self.unsaved, self.model, PROMPT_VERSION)
+            self.stats['saved'] += len(self.unsaved)
+            self.unsaved = []
+
+    async def _call(self, prompt):
+        tokens = estimate_tokens(prompt)
+        for attempt in range(self.max_retries + 1):
+            await self.limiter.acquire(tokens + self.max_output_tokens)
+            try:
+                message = await self.llm.ainvoke(prompt)
+            except Exception as e:
+                if attempt == self.max_retries:
+                    raise
+                self.stats['retries'] += 1
+                self.stats['rate_limited'] += is_rate_limit(e)
+                await asyncio.sleep(self.retry_backoff * 2 ** attempt)
+                continue
+            usage = (getattr(message, 'response_metadata', None) or {}).get('token_usage') or {}
+            usage = (usage.get('prompt_tokens', tokens), usage.get('completion_tokens', 0))
+            self.stats['prompt_tokens'] += usage[0]
+            self.stats['completion_tokens'] += usage[1]
+            return getattr(message, 'content', message), usage
+
+    def _cached(self, prompt):
+        hit = self.cache.get(self.model, PROMPT_VERSION, prompt) if self.cache is not None else None
+        if hit is None:
+            return None
+        try:
+            result = parse_extraction(hit['content'])
+        except ValueError:
+            return None
+        self.stats['cached'] += 1
+        return result
+
+    async def _extract(self, job, slots):
+        job_id = str(job['job_id'])
+        description = job.get('description') or self.store.get_description(job_id)
+        if not description:
+            self.stats['skipped'] += 1
+            return {'job_id': job_id, 'error': "no description"}
+        trimmed = trim_description(description, self.token_budget)
+        self.stats['description_tokens'] += trimmed.tokens_before
+        self.stats['trimmed_tokens'] += trimmed.tokens_after
+        prompt = build_prompt(job, trimmed.text)
+        result = self._cached(prompt)
+        if result is None:
+            result = await self._request(prompt, slots)
+            if 'error' in result:
+                return dict(result, job_id=job_id)
+        result = dict(result, job_id=job_id)
+        self.stats['extracted'] += 1
+        self.unsaved.append(result)
+        if len(self.unsaved) >= self.write_batch:
+            self._flush()
+        return result
+
+    async def _request(self, prompt, slots):
+        async with slots:
+            self.in_flight += 1
+            self.stats['peak_in_flight'] = max(self.stats['peak_in_flight'], self.in_flight)
+            try:
+                content, usage = await self._call(prompt)
+                result = parse_extraction(content)
+            except Exception as e:
+                self.stats['failed'] += 1
+                return {'error': f"{type(e).__name__}: {e}"}
+            finally:
+                self.in_flight -= 1
+        if self.cache is not None:
+            # Only replies that parsed are cached, so a malformed answer is asked for again next run
+            self.cache.put(self.model, PROMPT_VERSION, prompt, content, *usage)
+        return result
+
+    async def aextract(self, jobs):
+        """Extract a list of job records (dicts with job_id, and a description or one in the store);
+        returns one result per job, with an 'error' key for the jobs that failed
+        """
+        jobs = list(jobs)
+        self.stats = {'jobs': len(jobs), 'extracted': 0, 'cached': 0, 'failed': 0, 'skipped': 0, 'saved': 0,
+                      'retries': 0, 'description_tokens': 0, 'trimmed_tokens': 0,
+                      'rate_limited': 0, 'prompt_tokens': 0, 'completion_tokens': 0, 'peak_in_flight': 0}
+        waits, waited = self.limiter.waits, self.limiter.waited
+        started = time.perf_counter()
+        slots = asyncio.Semaphore(self.max_in_flight)
+        try:
+            results = await asyncio.gather(*(self._extract(job, slots) for job in jobs))
+        finally:
+            self._flush()
+        self.stats['seconds'] = time.perf_counter() - started
+        self.stats['rate_waits'] = self.limiter.waits - waits
+        self.stats['rate_wait_seconds'] = self.limiter.waited - waited
+        return results
+
+    def run(self, jobs=None, refresh=False, limit=None):
+        """Extract the given jobs, or the stored ones still pending; in a notebook await aextract() instead"""
+        if jobs is None:
+            jobs = self.pending_jobs(refresh, limit)
+        return asyncio.run(self.aextract(jobs))
+
+    def print_report(self):
+        s = self.stats
+        if not s:
+            return
+        seconds = max(s['seconds'], 1e-9)
+        print(f"Extracted {s['extracted']}/{s['jobs']} jobs with {self.model} in {s['seconds']:.1f}s "
+              f"({s['extracted'] / seconds:.2f} jobs/s, up to {s['peak_in_flight']} in flight)")
+        print(f"  {s['cached']} from the LLM cache, {s['failed']} failed, {s['skipped']} without a description, "
+              f"{s['saved']} saved to the store")
+        if s['description_tokens']:
+            print(f"  Descriptions trimmed from {s['description_tokens']} to {s['trimmed_tokens']} tokens "
+                  f"({1 - s['trimmed_tokens'] / s['description_tokens']:.0%} less)")
+        print(f"  {s['prompt_tokens']} prompt + {s['completion_tokens']} completion tokens, "
+              f"{s['retries']} retries ({s['rate_limited']} rate limited), "
+              f"{s['rate_waits']} rate-limit waits totalling {s['rate_wait_seconds']:.1f}s")
+
+def main():
+    parser = argparse.ArgumentParser(description="Extract role, experience and skills from stored job descriptions")
+    parser.add_argument("--model", default=DEFAULT_MODEL, help="Groq chat model")
+    parser.add_argument("--limit", type=int, help="Extract at most this many jobs")
+    parser.add_argument("--refresh", action="store_true", help="Redo jobs that already have an extraction")
+    parser.add_argument("--max-in-flight", type=int, default=4, help="Concurrent requests")
+    parser.add_argument("--rpm", type=int, default=30, help="Requests per minute (Groq free tier: 30)")
+    parser.add_argument("--tpm", type=int, default=6000, help="Tokens per minute (Groq free tier: 6000)")
+    parser.add_argument("--token-budget", type=int, default=DEFAULT_TOKEN_BUDGET,
+                        help="Trim each description to about this many tokens (0: only strip boilerplate)")
+    parser.add_argument("--no-cache", action="store_true", help="Always call the model, even for prompts seen before")
+    args = parser.parse_args()
+
+    cache = None if args.no_cache else LLMCache()
+    pipeline = ExtractionPipeline(model=args.model, max_in_flight=args.max_in_flight,
+                                  requests_per_minute=args.rpm, tokens_per_minute=args.tpm, cache=cache,
+                                  token_budget=args.token_budget or None)
+    pipeline.run(refresh=args.refresh, limit=args.limit)
+    pipeline.print_report()
+    if cache is not None:
+        cache.print_stats()
+
+if __name__ == "__main__":
+    main()
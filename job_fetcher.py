@@ -0,0 +1,78 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
+
+class TokenBucket:
+    """Thread-safe token bucket shared by all workers to cap the overall request rate"""
+    def __init__(self, rate, capacity=None):
+        self.rate = float(rate)  # Tokens added per second
+        self.capacity = float(capacity if capacity is not None else max(1.0, rate))
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self, tokens=1, cancel_event=None):
+        """Block until the requested number of tokens is available; False if cancel_event is set first"""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+
+                if self.tokens >= tokens:
+                    self.tokens -= tokens
+                    return True
+
+                wait = (tokens - self.tokens) / self.rate
+            if cancel_event is None:
+                time.sleep(wait)
+            elif cancel_event.wait(wait):
+                return False
+
+class JobFetcher:
+    """Run fetch functions on a bounded thread pool with a global rate limit and per-host politeness"""
+    def __init__(self, max_workers=4, requests_per_second=1.0, burst=None, per_host_limit=2, cancel_event=None):
+        self.max_workers = max_workers
+        # Once set, queued fetches return None instead of waiting for a rate-limit token
+        self.cancel_event = cancel_event or threading.Event()
+        self.per_host_limit = per_host_limit
+        self.bucket = TokenBucket(requests_per_second, burst)
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="job-fetch")
+        self._host_slots = {}
+        self._host_lock = threading.Lock()
+
+    def _host_slot(self, url):
+        """Get the semaphore limiting concurrent requests to the host of url"""
+        host = urlparse(url).netloc
+        with self._host_lock:
+            if host not in self._host_slots:
+                self._host_slots[host] = threading.BoundedSemaphore(self.per_host_limit)
+            return self._host_slots[host]
+
+    def _run(self, func, item, url):
+        """Wait for a rate-limit token and a host slot, then call func(item)"""
+        if self.cancel_event.is_set():
+            return None
+        with self._host_slot(url):
+            if not self.bucket.acquire(cancel_event=self.cancel_event):
+                return None
+            return func(item)
+
+    def submit(self, func, item, url):
+        """Schedule func(item) for a request to url and return its future"""
+        return self.executor.submit(self._run, func, item, url)
+
+    def map(self, func, items, url_for):
+        """Apply func to every item concurrently, returning results in input order"""
+        futures = [self.submit(func, item, url_for(item)) for item in items]
+        return [None if future.cancelled() else future.result() for future in futures]
+
+    def cancel(self):
+        """Drop queued fetches and stop the pool without waiting for running ones"""
+        self.cancel_event.set()
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+    def shutdown(self, wait=True):
+        """Stop the worker threads"""
+        self.executor.shutdown(wait=wait)
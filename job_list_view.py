@@ -0,0 +1,127 @@
+import numpy as np
+
+class VirtualJobList:
+    """Drives a Treeview that only holds the rows currently scrolled into view
+
+    Every job is kept as a pre-built tuple of column values. Filtering swaps in a new array
+    of row positions, and scrolling moves a window over it; each render diffs the wanted
+    job IDs against the Treeview items and only inserts, moves or deletes what changed.
+    """
+    def __init__(self, tree, scrollbar, page_size=40):
+        self.tree = tree
+        self.scrollbar = scrollbar
+        self.page_size = page_size
+        self.ids = []
+        self.rows = []
+        self.visible = np.arange(0)
+        self.offset = 0
+
+        scrollbar.configure(command=self.yview)
+        tree.bind('<MouseWheel>', self._on_mousewheel)
+        tree.bind('<Button-4>', lambda event: self.scroll(-3))
+        tree.bind('<Button-5>', lambda event: self.scroll(3))
+        tree.bind('<Prior>', lambda event: self.scroll(-self.page_size))
+        tree.bind('<Next>', lambda event: self.scroll(self.page_size))
+        tree.bind('<Configure>', self._on_resize)
+
+    def show(self, ids, rows, positions=None):
+        """Display rows[positions] (all rows when positions is None), keeping the scroll position if possible
+
+        Pass the list's own ids and rows to re-filter what it already holds.
+        """
+        if rows is not self.rows:
+            # New data: the values of items already in the tree may be out of date
+            self.tree.delete(*self.tree.get_children())
+            self.ids, self.rows = ids, rows
+        self.visible = np.arange(len(rows)) if positions is None else np.asarray(positions, dtype=int)
+        self.offset = min(self.offset, max(0, len(self.visible) - self.page_size))
+        self.render()
+
+    def reset(self):
+        """Empty the list, ready for rows to be appended"""
+        self.tree.delete(*self.tree.get_children())
+        self.ids, self.rows = [], []
+        self.visible = np.arange(0)
+        self.offset = 0
+        self.render()
+
+    def append(self, ids, rows, visible=None):
+        """Add rows after the ones already held (e.g. jobs streamed in by a running scrape)
+
+        visible is one flag per new row; rows that are False are kept but not displayed
+        until the next show(). The Treeview is only touched if a new row lands in the window.
+        """
+        start = len(self.rows)
+        self.ids.extend(ids)
+        self.rows.extend(rows)
+        positions = np.arange(start, len(self.rows))
+        if visible is not None:
+            positions = positions[np.asarray(visible, dtype=bool)]
+        if not len(positions):
+            return
+        in_window = len(self.visible) < self.offset + self.page_size
+        self.visible = np.concatenate([self.visible, positions])
+        if in_window:
+            self.render()
+        else:
+            self._update_scrollbar()
+
+    def __len__(self):
+        return len(self.visible)
+
+    def render(self):
+        """Make the Treeview hold exactly the rows in the current window, in order"""
+        window = self.visible[self.offset:self.offset + self.page_size]
+        wanted = [self.ids[pos] for pos in window]
+
+        current = self.tree.get_children()
+        wanted_set = set(wanted)
+        stale = [iid for iid in current if iid not in wanted_set]
+        if stale:
+            self.tree.delete(*stale)
+
+        existing = set(current).difference(stale)
+        for index, (iid, pos) in enumerate(zip(wanted, window)):
+            if iid in existing:
+                self.tree.move(iid, '', index)
+            else:
+                self.tree.insert('', index, iid=iid, values=self.rows[pos])
+
+        self._update_scrollbar()
+
+    def scroll(self, rows):
+        """Move the window by a number of rows"""
+        self._move_to(self.offset + rows)
+        return "break"
+
+    def yview(self, *args):
+        """Scrollbar command: ('moveto', fraction) or ('scroll', n, 'units'|'pages')"""
+        if args[0] == 'moveto':
+            self._move_to(int(float(args[1]) * len(self.visible)))
+        elif args[0] == 'scroll':
+            step = self.page_size if args[2] == 'pages' else 1
+            self._move_to(self.offset + int(args[1]) * step)
+
+    def _move_to(self, offset):
+        offset = max(0, min(offset, len(self.visible) - self.page_size))
+        if offset != self.offset:
+            self.offset = offset
+            self.render()
+
+    def _update_scrollbar(self):
+        total = len(self.visible)
+        if total <= self.page_size:
+            self.scrollbar.set(0.0, 1.0)
+        else:
+            self.scrollbar.set(self.offset / total, (self.offset + self.page_size) / total)
+
+    def _on_mousewheel(self, event):
+        return self.scroll(-3 if event.delta > 0 else 3)
+
+    def _on_resize(self, event):
+        # Header row plus one line per job; 20px is the default Treeview row height
+        page_size = max(1, (event.height - 25) // 20)
+        if page_size != self.page_size:
+            self.page_size = page_size
+            self.offset = min(self.offset, max(0, len(self.visible) - page_size))
+            self.render()
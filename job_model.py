@@ -0,0 +1,122 @@
+import os
+import pandas as pd
+
+class JobModel:
+    """In-memory copy of the job store for the GUI, indexed by job ID
+
+    The table is loaded once and reused until the database files change on disk
+    (another process wrote to them) or this model writes through the store.
+    """
+    def __init__(self, store):
+        self.store = store
+        self._df = None
+        self._positions = {}
+        self._rows = {}
+        self._display = {}
+        self._status_positions = {}
+        self._signature = None
+
+    def _file_signature(self):
+        """Modification time and size of the database and its write-ahead log"""
+        signature = []
+        for path in (self.store.path, self.store.path + "-wal"):
+            try:
+                stat = os.stat(path)
+                signature.append((stat.st_mtime_ns, stat.st_size))
+            except OSError:
+                signature.append(None)
+        return tuple(signature)
+
+    def invalidate(self):
+        """Drop the cached table so the next read reloads it"""
+        self._df = None
+
+    def _ensure_loaded(self):
+        signature = self._file_signature()
+        if self._df is not None and signature == self._signature:
+            return
+
+        df = self.store.load_dataframe()
+        self._df = df
+        self._signature = signature
+        self._positions = {job_id: pos for pos, job_id in enumerate(df['job_id'])}
+        self._rows = {}
+        self._display = {}
+        self._status_positions = df.groupby('status', sort=False).indices if len(df) else {}
+
+    @property
+    def dataframe(self):
+        """All jobs, newest postings first"""
+        self._ensure_loaded()
+        return self._df
+
+    def filter(self, status=None):
+        """Jobs with the given status, or all jobs when status is None"""
+        positions = self.positions(status)
+        return self._df if positions is None else self._df.iloc[positions]
+
+    def positions(self, status=None):
+        """Row positions of jobs with the given status, or None for all jobs"""
+        self._ensure_loaded()
+        if not status:
+            return None
+        return self._status_positions.get(status, [])
+
+    def display_rows(self, columns):
+        """Job IDs and a tuple of display strings per job, built once per load"""
+        self._ensure_loaded()
+        columns = tuple(columns)
+        if columns not in self._display:
+            values = self._df.reindex(columns=list(columns)).fillna('').astype(str)
+            rows = list(zip(*(values[col].tolist() for col in columns)))
+            self._display[columns] = (self._df['job_id'].tolist(), rows)
+        return self._display[columns]
+
+    def get(self, job_id):
+        """Return one job as a dict, or None if it isn't stored"""
+        self._ensure_loaded()
+        job_id = str(job_id)
+        if job_id not in self._rows:
+            pos = self._positions.get(job_id)
+            if pos is None:
+                return None
+            row = self._df.iloc[pos]
+            self._rows[job_id] = {col: (None if pd.isna(value) else value) for col, value in row.items()}
+        return dict(self._rows[job_id])
+
+    def __len__(self):
+        return len(self.dataframe)
+
+    def description(self, job_id):
+        """Read a job's description from the store only when it is asked for"""
+        return self.store.get_description(job_id)
+
+    def status_history(self, job_id):
+        return self.store.status_history(job_id)
+
+    # Writes go through the store, then the cached table is dropped
+
+    def update_job(self, job_id, **fields):
+        result = self.store.update_job(job_id, **fields)
+        self.invalidate()
+        return result
+
+    def update_jobs(self, job_ids, **fields):
+        result = self.store.update_jobs(job_ids, **fields)
+        self.invalidate()
+        return result
+
+    def upsert_jobs(self, jobs, source="scrape"):
+        result = self.store.upsert_jobs(jobs, source=source)
+        self.invalidate()
+        return result
+
+    def delete_jobs(self, job_ids):
+        result = self.store.delete_jobs(job_ids)
+        self.invalidate()
+        return result
+
+    def import_csv(self, path):
+        result = self.store.import_csv(path)
+        self.invalidate()
+        return result
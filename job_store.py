@@ -0,0 +1,405 @@
+import glob
+import json
+import math
+import os
+import re
+import sqlite3
+import threading
+import zlib
+from datetime import date, datetime, timedelta
+import pandas as pd
+
+# zstd compresses descriptions smaller and faster than zlib when the package is installed
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+DEFAULT_DB_PATH = "job_tracker/jobs.db"
+DATA_DIR = "job_tracker/data"
+
+# Columns filled in by the scraper; a re-scrape refreshes them
+SCRAPED_COLUMNS = [
+    'company', 'job_title', 'type', 'contact_person', 'email', 'location',
+    'time_posted', 'posting_date', 'num_applicants', 'salary', 'work_mode'
+]
+
+# Columns the user manages; a re-scrape only fills them in when they are empty
+TRACKING_COLUMNS = ['status', 'date_applied', 'deadline', 'application_link', 'resume_link', 'notes']
+
+JOB_COLUMNS = ['job_id'] + SCRAPED_COLUMNS + TRACKING_COLUMNS + ['first_seen', 'last_scraped']
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    job_id TEXT PRIMARY KEY,
+    company TEXT,
+    job_title TEXT,
+    type TEXT,
+    contact_person TEXT,
+    email TEXT,
+    location TEXT,
+    time_posted TEXT,
+    posting_date TEXT,
+    num_applicants TEXT,
+    salary TEXT,
+    work_mode TEXT,
+    status TEXT NOT NULL DEFAULT 'Not Applied',
+    date_applied TEXT,
+    deadline TEXT,
+    application_link TEXT,
+    resume_link TEXT,
+    notes TEXT,
+    first_seen TEXT,
+    last_scraped TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs(status);
+CREATE INDEX IF NOT EXISTS idx_jobs_company ON jobs(company);
+CREATE INDEX IF NOT EXISTS idx_jobs_posting_date ON jobs(posting_date);
+
+CREATE TABLE IF NOT EXISTS status_history (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    job_id TEXT NOT NULL,
+    status TEXT NOT NULL,
+    changed_at TEXT NOT NULL,
+    source TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_status_history_job ON status_history(job_id);
+
+-- Descriptions live apart from the jobs table so metadata reads never touch them
+CREATE TABLE IF NOT EXISTS descriptions (
+    job_id TEXT PRIMARY KEY,
+    codec TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    body BLOB NOT NULL
+);
+
+-- Structured fields an LLM extracted from each description; skills is a JSON list
+CREATE TABLE IF NOT EXISTS extractions (
+    job_id TEXT PRIMARY KEY,
+    role TEXT,
+    experience TEXT,
+    skills TEXT,
+    model TEXT NOT NULL,
+    prompt_version INTEGER NOT NULL,
+    extracted_at TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS imported_files (
+    path TEXT PRIMARY KEY,
+    mtime REAL NOT NULL,
+    rows INTEGER NOT NULL,
+    imported_at TEXT NOT NULL
+);
+"""
+
+def _now():
+    return datetime.now().isoformat(timespec='seconds')
+
+def _db_value(value):
+    """Convert pandas/datetime values into something SQLite stores cleanly"""
+    if value is None or value is pd.NaT:
+        return None
+    if isinstance(value, float) and math.isnan(value):
+        return None
+    if isinstance(value, (datetime, date)):
+        return value.strftime("%Y-%m-%d")
+    if isinstance(value, str):
+        value = value.strip()
+        return value or None
+    return str(value)
+
+def _compress(text):
+    """Compress a description, returning (codec, blob)"""
+    data = text.encode('utf-8')
+    if zstandard is not None:
+        return 'zstd', zstandard.ZstdCompressor(level=10).compress(data)
+    return 'zlib', zlib.compress(data, 9)
+
+def _decompress(codec, blob):
+    if codec == 'zstd':
+        if zstandard is None:
+            raise RuntimeError("This description was stored with zstd; install the zstandard package to read it")
+        return zstandard.ZstdDecompressor().decompress(blob).decode('utf-8')
+    return zlib.decompress(blob).decode('utf-8')
+
+class JobStore:
+    """SQLite-backed job store keyed by LinkedIn job ID"""
+    def __init__(self, path=DEFAULT_DB_PATH):
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        # Shared between the GUI thread and scraper threads; writes are serialized by the lock
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.lock = threading.RLock()
+        with self.lock, self.conn:
+            self.conn.executescript(SCHEMA)
+
+    def close(self):
+        self.conn.close()
+
+    def upsert_jobs(self, jobs, source="scrape"):
+        """Insert new jobs and refresh scraped fields of known ones, keeping the user's tracking data"""
+        now = _now()
+        insert_columns = [col for col in JOB_COLUMNS if col != 'status'] + ['status']
+        updates = [f"{col} = COALESCE(excluded.{col}, jobs.{col})" for col in SCRAPED_COLUMNS]
+        updates += [f"{col} = COALESCE(jobs.{col}, excluded.{col})" for col in TRACKING_COLUMNS if col != 'status']
+        updates.append("last_scraped = excluded.last_scraped")
+        sql = (f"INSERT INTO jobs ({', '.join(insert_columns)}) VALUES ({', '.join('?' * len(insert_columns))}) "
+               f"ON CONFLICT(job_id) DO UPDATE SET {', '.join(updates)}")
+
+        rows = []
+        for job in jobs:
+            values = {col: _db_value(job.get(col)) for col in insert_columns}
+            if not values['job_id']:
+                continue
+            values['status'] = values['status'] or 'Not Applied'
+            values['first_seen'] = values['first_seen'] or now
+            values['last_scraped'] = now
+            rows.append(values)
+
+        with self.lock, self.conn:
+            known = set(self._current_statuses([row['job_id'] for row in rows]))
+            self.conn.executemany(sql, [[row[col] for col in insert_columns] for row in rows])
+            self.conn.executemany(
+                "INSERT INTO status_history (job_id, status, changed_at, source) VALUES (?, ?, ?, ?)",
+                [(row['job_id'], row['status'], now, source) for row in rows if row['job_id'] not in known]
+            )
+            self._save_descriptions(jobs)
+
+        new_count = sum(1 for row in rows if row['job_id'] not in known)
+        return {'inserted': new_count, 'updated': len(rows) - new_count}
+
+    def _save_descriptions(self, jobs):
+        rows = []
+        for job in jobs:
+            description = job.get('description')
+            if job.get('job_id') and isinstance(description, str) and description.strip():
+                codec, blob = _compress(description)
+                rows.append((str(job['job_id']), codec, len(description.encode('utf-8')), blob))
+        self.conn.executemany(
+            "INSERT OR REPLACE INTO descriptions (job_id, codec, size, body) VALUES (?, ?, ?, ?)", rows)
+    
+    def get_description(self, job_id):
+        """Return the stored description of a job, or None"""
+        row = self.conn.execute("SELECT codec, body FROM descriptions WHERE job_id = ?", (str(job_id),)).fetchone()
+        return _decompress(row[0], row[1]) if row else None
+    
+    def iter_descriptions(self, job_ids=None):
+        """Yield (job_id, description) for the given jobs, or for every job with a description"""
+        if job_ids is None:
+            cursor = self.conn.execute("SELECT job_id, codec, body FROM descriptions ORDER BY job_id")
+            for job_id, codec, blob in cursor:
+                yield job_id, _decompress(codec, blob)
+            return
+        for job_id in job_ids:
+            description = self.get_description(job_id)
+            if description is not None:
+                yield str(job_id), description
+    
+    def description_stats(self):
+        """Number of stored descriptions with their raw and compressed sizes in bytes"""
+        row = self.conn.execute("SELECT COUNT(*), SUM(size), SUM(LENGTH(body)) FROM descriptions").fetchone()
+        return {'count': row[0], 'raw_bytes': row[1] or 0, 'stored_bytes': row[2] or 0}
+    
+    def save_extractions(self, extractions, model, prompt_version):
+        """Store LLM-extracted role, experience and skills, replacing earlier extractions of the same jobs"""
+        now = _now()
+        rows = [(str(item['job_id']), _db_value(item.get('role')), _db_value(item.get('experience')),
+                 json.dumps(list(item.get('skills') or []), ensure_ascii=False), model, prompt_version, now)
+                for item in extractions if item.get('job_id')]
+        with self.lock, self.conn:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO extractions (job_id, role, experience, skills, model, prompt_version, "
+                "extracted_at) VALUES (?, ?, ?, ?, ?, ?, ?)", rows)
+        return len(rows)
+
+    def get_extraction(self, job_id):
+        """Return the extracted fields of a job with skills as a list, or None"""
+        row = self.conn.execute("SELECT * FROM extractions WHERE job_id = ?", (str(job_id),)).fetchone()
+        if not row:
+            return None
+        extraction = dict(row)
+        extraction['skills'] = json.loads(extraction['skills'] or '[]')
+        return extraction
+
+    def pending_extractions(self, model=None, prompt_version=None):
+        """IDs of jobs with a description but no extraction (or one from another model or prompt version)"""
+        sql = ("SELECT d.job_id FROM descriptions d LEFT JOIN extractions e ON e.job_id = d.job_id "
+               "WHERE e.job_id IS NULL")
+        params = []
+        if model is not None:
+            sql += " OR e.model != ?"
+            params.append(model)
+        if prompt_version is not None:
+            sql += " OR e.prompt_version != ?"
+            params.append(prompt_version)
+        return [row[0] for row in self.conn.execute(sql + " ORDER BY d.job_id", params)]
+
+    def load_extractions(self):
+        """Jobs joined with their extracted fields; skills stays a JSON list string, as in CSV exports"""
+        return pd.read_sql_query(
+            "SELECT j.job_id, j.company, j.job_title, j.location, e.role, e.experience, e.skills "
+            "FROM extractions e JOIN jobs j ON j.job_id = e.job_id ORDER BY j.posting_date DESC, j.job_id",
+            self.conn)
+
+    def update_job(self, job_id, source="manual", **fields):
+        """Update tracking fields of one job, recording status changes in the history"""
+        return self.update_jobs([job_id], source=source, **fields) == 1
+
+    def update_jobs(self, job_ids, source="manual", **fields):
+        """Apply the same field updates to many jobs in one transaction, returning how many matched"""
+        job_ids = [str(job_id) for job_id in dict.fromkeys(job_ids)]
+        unknown = set(fields) - set(JOB_COLUMNS)
+        if unknown:
+            raise ValueError(f"Unknown job fields: {', '.join(sorted(unknown))}")
+        if not job_ids:
+            return 0
+
+        values = [_db_value(value) for value in fields.values()]
+        status = fields.get('status')
+
+        with self.lock, self.conn:
+            current = self._current_statuses(job_ids)
+            found = [job_id for job_id in job_ids if job_id in current]
+
+            # Keyed point updates through the primary key index
+            if fields and found:
+                assignments = ', '.join(f"{col} = ?" for col in fields)
+                self.conn.executemany(f"UPDATE jobs SET {assignments} WHERE job_id = ?",
+                                      [values + [job_id] for job_id in found])
+
+            if status:
+                now = _now()
+                self.conn.executemany(
+                    "INSERT INTO status_history (job_id, status, changed_at, source) VALUES (?, ?, ?, ?)",
+                    [(job_id, status, now, source) for job_id in found if current[job_id] != status]
+                )
+        return len(found)
+
+    def _current_statuses(self, job_ids):
+        statuses = {}
+        # Stay under SQLite's bound-parameter limit
+        for i in range(0, len(job_ids), 500):
+            chunk = job_ids[i:i + 500]
+            cursor = self.conn.execute(
+                f"SELECT job_id, status FROM jobs WHERE job_id IN ({', '.join('?' * len(chunk))})", chunk)
+            statuses.update((row[0], row[1]) for row in cursor)
+        return statuses
+
+    def recently_scraped(self, job_ids, max_age_days):
+        """Return the subset of job_ids scraped within the last max_age_days"""
+        job_ids = [str(job_id) for job_id in job_ids]
+        cutoff = (datetime.now() - timedelta(days=max_age_days)).isoformat(timespec='seconds')
+        fresh = set()
+        with self.lock:
+            for i in range(0, len(job_ids), 500):
+                chunk = job_ids[i:i + 500]
+                cursor = self.conn.execute(
+                    f"SELECT job_id FROM jobs WHERE last_scraped >= ? AND job_id IN ({', '.join('?' * len(chunk))})",
+                    [cutoff] + chunk)
+                fresh.update(row[0] for row in cursor)
+        return fresh
+    
+    def get_job(self, job_id):
+        """Return one job as a dict, or None if it isn't stored"""
+        row = self.conn.execute("SELECT * FROM jobs WHERE job_id = ?", (str(job_id),)).fetchone()
+        return dict(row) if row else None
+
+    def status_history(self, job_id):
+        """Return the status changes of a job, oldest first"""
+        cursor = self.conn.execute(
+            "SELECT status, changed_at, source FROM status_history WHERE job_id = ? ORDER BY id",
+            (str(job_id),)
+        )
+        return [dict(row) for row in cursor]
+
+    def load_dataframe(self, status=None, company=None, columns=None):
+        """Load jobs into a DataFrame, optionally filtered by status and company"""
+        columns = columns or JOB_COLUMNS
+        sql = f"SELECT {', '.join(columns)} FROM jobs"
+        conditions, params = [], []
+        if status:
+            conditions.append("status = ?")
+            params.append(status)
+        if company:
+            conditions.append("company = ?")
+            params.append(company)
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        sql += " ORDER BY posting_date DESC, job_id"
+        return pd.read_sql_query(sql, self.conn, params=params)
+
+    def delete_jobs(self, job_ids):
+        """Remove jobs and their history"""
+        job_ids = [(str(job_id),) for job_id in job_ids]
+        with self.lock, self.conn:
+            self.conn.executemany("DELETE FROM status_history WHERE job_id = ?", job_ids)
+            self.conn.executemany("DELETE FROM descriptions WHERE job_id = ?", job_ids)
+            self.conn.executemany("DELETE FROM extractions WHERE job_id = ?", job_ids)
+            self.conn.executemany("DELETE FROM jobs WHERE job_id = ?", job_ids)
+        return len(job_ids)
+
+    def count(self):
+        return self.conn.execute("SELECT COUNT(*) FROM jobs").fetchone()[0]
+
+    def import_csv(self, path):
+        """Import a tracker CSV, keeping any status progress recorded in it"""
+        df = pd.read_csv(path, dtype=str)
+        if 'job_id' not in df.columns:
+            print(f"Skipping {path}: no job_id column")
+            return 0
+
+        jobs = df.where(df.notna(), None).to_dict('records')
+        self.upsert_jobs(jobs, source=f"import:{os.path.basename(path)}")
+
+        # Apply tracking data from the file where it moves a job past 'Not Applied'
+        for job in jobs:
+            tracking = {col: _db_value(job.get(col)) for col in TRACKING_COLUMNS if _db_value(job.get(col))}
+            if tracking.get('status') == 'Not Applied':
+                del tracking['status']
+            if tracking:
+                self.update_job(job['job_id'], source=f"import:{os.path.basename(path)}", **tracking)
+
+        with self.lock, self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO imported_files (path, mtime, rows, imported_at) VALUES (?, ?, ?, ?)",
+                (os.path.abspath(path), os.path.getmtime(path), len(jobs), _now())
+            )
+        return len(jobs)
+
+    def import_csv_dir(self, data_dir=DATA_DIR):
+        """Import every tracker CSV that is new or changed since the last import"""
+        imported = {row['path']: row['mtime'] for row in self.conn.execute("SELECT path, mtime FROM imported_files")}
+        files = [path for path in glob.glob(os.path.join(data_dir, "*.csv"))
+                 if imported.get(os.path.abspath(path)) != os.path.getmtime(path)]
+
+        # Oldest snapshot first so later status changes win
+        files.sort(key=_snapshot_order)
+        total = 0
+        for path in files:
+            rows = self.import_csv(path)
+            print(f"Imported {rows} jobs from {path}")
+            total += rows
+        return total
+
+def _snapshot_order(path):
+    """Sort key for CSV snapshots: timestamp in the file name, then modification time"""
+    match = re.search(r'(\d{8}_\d{6})\.csv$', path)
+    return (match.group(1) if match else '', os.path.getmtime(path))
+
+def open_store(path=DEFAULT_DB_PATH, data_dir=DATA_DIR):
+    """Open the job store, importing any CSV snapshots it hasn't seen yet"""
+    store = JobStore(path)
+    if os.path.isdir(data_dir):
+        store.import_csv_dir(data_dir)
+    return store
+
+if __name__ == "__main__":
+    # Migrate existing CSV snapshots into the store
+    store = open_store()
+    print(f"Job store {store.path} holds {store.count()} jobs")
@@ -6,12 +6,20 @@ import sys
 from datetime import datetime
 import webbrowser
 from linkedin_job_tracker import LinkedInJobTracker
+from job_store import open_store
+from job_model import JobModel
+from job_list_view import VirtualJobList
+from scrape_worker import ScrapeWorker
+from batch_search import BatchSearch
+from posting_dates import posting_ages
 
 class JobTrackerApp:
     def __init__(self, root):
         self.root = root
         self.root.title("LinkedIn Job Application Tracker")
         self.root.geometry("1200x700")
+        self.scrape_worker = None
+        self.streaming = False  # True while the Track tab lists a scrape's jobs rather than the store's
         
         # Create main frame
         self.main_frame = ttk.Frame(root, padding="10")
@@ -34,9 +42,10 @@ class JobTrackerApp:
         # Setup track tab
         self.setup_track_tab()
         
-        # Load existing data if available
-        self.current_file = None
-        self.load_latest_file()
+        # Open the job store, importing any older CSV snapshots
+        self.store = open_store()
+        self.model = JobModel(self.store)
+        self.load_job_data()
     
     def setup_search_tab(self):
         # Create frame for search options
@@ -52,6 +61,8 @@ class JobTrackerApp:
         ttk.Label(search_frame, text="Location:").grid(row=0, column=2, sticky=tk.W, padx=5, pady=5)
         self.location_var = tk.StringVar(value="Toronto")
         ttk.Entry(search_frame, textvariable=self.location_var, width=30).grid(row=0, column=3, sticky=tk.W, padx=5, pady=5)
+        ttk.Label(search_frame, text="(separate several titles or locations with commas)").grid(
+            row=3, column=0, columnspan=4, sticky=tk.W, padx=5)
     
         # Job type
         ttk.Label(search_frame, text="Job Type:").grid(row=1, column=0, sticky=tk.W, padx=5, pady=5)
@@ -75,8 +86,16 @@ class JobTrackerApp:
         age_filter_combo.grid(row=2, column=1, sticky=tk.W, padx=5, pady=5)
     
         # Search button - FIX: Move to a more visible position and make it more prominent
-        search_button = ttk.Button(search_frame, text="Search Jobs", command=self.search_jobs)
-        search_button.grid(row=2, column=2, columnspan=2, sticky=tk.W, padx=5, pady=5)
+        button_frame = ttk.Frame(search_frame)
+        button_frame.grid(row=2, column=2, columnspan=2, sticky=tk.W, padx=5, pady=5)
+        self.search_button = ttk.Button(button_frame, text="Search Jobs", command=self.search_jobs)
+        self.search_button.pack(side=tk.LEFT)
+        
+        # Pause/Cancel for the background scrape
+        self.pause_button = ttk.Button(button_frame, text="Pause", command=self.toggle_pause, state=tk.DISABLED)
+        self.pause_button.pack(side=tk.LEFT, padx=5)
+        self.cancel_button = ttk.Button(button_frame, text="Cancel", command=self.cancel_search, state=tk.DISABLED)
+        self.cancel_button.pack(side=tk.LEFT)
     
         # Progress bar and status
         self.progress_var = tk.DoubleVar()
@@ -106,8 +125,8 @@ class JobTrackerApp:
         # Refresh button
         ttk.Button(toolbar, text="Refresh", command=self.refresh_job_list).pack(side=tk.LEFT, padx=5)
     
-        # Load file button
-        ttk.Button(toolbar, text="Load File", command=self.load_file).pack(side=tk.LEFT, padx=5)
+        # Import CSV button
+        ttk.Button(toolbar, text="Import CSV", command=self.load_file).pack(side=tk.LEFT, padx=5)
 
         ttk.Button(toolbar, text="Remove Old Jobs", 
           command=lambda: self.filter_by_age(30)).pack(side=tk.LEFT, padx=5)
@@ -140,9 +159,9 @@ class JobTrackerApp:
         self.job_tree.column('email', width=200)
         self.job_tree.column('application_link', width=200)
     
-        # Add scrollbar
-        scrollbar = ttk.Scrollbar(list_frame, orient=tk.VERTICAL, command=self.job_tree.yview)
-        self.job_tree.configure(yscroll=scrollbar.set)
+        # Add scrollbar; the job list only keeps the visible rows in the tree and drives it itself
+        scrollbar = ttk.Scrollbar(list_frame, orient=tk.VERTICAL)
+        self.job_list = VirtualJobList(self.job_tree, scrollbar)
     
         # Add horizontal scrollbar for wide content
         h_scrollbar = ttk.Scrollbar(list_frame, orient=tk.HORIZONTAL, command=self.job_tree.xview)
@@ -159,6 +178,7 @@ class JobTrackerApp:
         # Create right-click menu
         self.context_menu = tk.Menu(self.job_tree, tearoff=0)
         self.context_menu.add_command(label="Update Status", command=self.update_job_status)
+        self.context_menu.add_command(label="Mark Selected as Applied", command=self.mark_selected_applied)
         self.context_menu.add_command(label="Open Application Link", command=self.open_application_link)
         self.context_menu.add_command(label="Copy Email", command=self.copy_email)
         self.job_tree.bind('<Button-3>', self.show_context_menu)
@@ -184,10 +204,13 @@ class JobTrackerApp:
             messagebox.showerror("Error", "Job title and location are required")
             return
         
+        if self.scrape_worker and self.scrape_worker.running:
+            messagebox.showinfo("Info", "A search is already running")
+            return
+        
         # Update status
         self.status_var.set(f"Searching for {job_title} jobs in {location}...")
         self.progress_var.set(10)
-        self.root.update()
         
         try:
             # Create job tracker
@@ -200,71 +223,131 @@ class JobTrackerApp:
             
             job_type_param = job_type_map.get(job_type) if job_type != 'Any' else None
             
-            tracker = LinkedInJobTracker(
-                job_title=job_title,
-                location=location,
-                job_type=job_type_param
-            )
-            
-            # Update status
-            self.status_var.set("Collecting job IDs...")
-            self.progress_var.set(30)
-            self.root.update()
+            # Comma-separated titles or locations run as one batch search with shared dedup
+            titles = [title.strip() for title in job_title.split(',') if title.strip()]
+            locations = [place.strip() for place in location.split(',') if place.strip()]
+            if len(titles) > 1 or len(locations) > 1:
+                tracker = BatchSearch(titles, locations, [job_type_param], store=self.store)
+            else:
+                tracker = LinkedInJobTracker(
+                    job_title=job_title,
+                    location=location,
+                    job_type=job_type_param,
+                    store=self.store
+                )
+            
+            # Show jobs in the Track tab as they are extracted
+            self.job_list.reset()
+            self.streaming = True
+            self.notebook.select(1)
             
-            # Search for jobs
-            job_ids = tracker.search_jobs(num_pages=pages, max_age_days=max_age_days)
+            # Scrape on a background thread; poll_scrape_events picks up its progress
+            self.scrape_worker = ScrapeWorker(tracker, num_pages=pages, max_age_days=max_age_days).start()
+            self.set_search_controls(running=True)
+            self.root.after(100, self.poll_scrape_events)
             
-            # Update status
-            self.status_var.set(f"Found {len(job_ids)} jobs. Extracting details...")
-            self.progress_var.set(60)
-            self.root.update()
-            
-            # Extract job details
-            tracker.extract_job_details(job_ids)
+        except Exception as e:
+            self.status_var.set(f"Error: {str(e)}")
+            messagebox.showerror("Error", f"An error occurred: {str(e)}")
+    
+    def poll_scrape_events(self):
+        """Apply progress events from the background scrape, then check again shortly"""
+        worker = self.scrape_worker
+        jobs = []
+        for event in worker.poll():
+            if event.kind == 'page':
+                self.status_var.set(f"Searched page {event.page} of {event.pages}, found {event.jobs_found} jobs...")
+                self.progress_var.set(max(self.progress_var.get(), 10 + 10 * event.page / event.pages))
+            
+            elif event.kind == 'job':
+                jobs.append(event.job)
+                self.status_var.set(f"Extracted {event.jobs_done} of {event.jobs_found} jobs...")
+                self.progress_var.set(min(89, 20 + 70 * event.jobs_done / max(1, event.jobs_found)))
+            
+            elif event.kind == 'done':
+                self.finish_search(worker, cancelled=bool(event.message))
+                return
             
-            # Save to CSV
+            elif event.kind == 'error':
+                self.show_streamed_jobs(jobs)
+                self.streaming = False
+                self.set_search_controls(running=False)
+                self.status_var.set(f"Error: {event.message}")
+                messagebox.showerror("Error", f"An error occurred: {event.message}")
+                return
+        
+        self.show_streamed_jobs(jobs)
+        self.root.after(100, self.poll_scrape_events)
+    
+    def show_streamed_jobs(self, jobs):
+        """Add jobs from the running scrape to the Track tab, hiding those the status filter excludes"""
+        columns = self.job_tree['columns']
+        status = self.filter_var.get()
+        self.job_list.append([job['job_id'] for job in jobs],
+                             [tuple(str(job.get(col) or "") for col in columns) for job in jobs],
+                             [status == 'All' or job.get('status') == status for job in jobs])
+    
+    def finish_search(self, worker, cancelled=False):
+        """Save the jobs a finished (or cancelled) scrape extracted"""
+        self.streaming = False
+        self.set_search_controls(running=False)
+        try:
+            # Save to the job store
             self.status_var.set("Saving job data...")
             self.progress_var.set(90)
-            self.root.update()
             
-            csv_file = tracker.save_to_csv()
+            result = worker.tracker.save_to_store(self.store)
+            self.model.invalidate()
             
-            # Update status
-            self.status_var.set(f"Completed! Saved {len(tracker.job_list)} jobs to {csv_file}")
-            self.progress_var.set(100)
-            
-            # Load the new file
-            self.current_file = csv_file
+            # Reload the job list from the store
             self.load_job_data()
             
-            # Switch to track tab
-            self.notebook.select(1)
+            # Update status
+            prefix = "Cancelled" if cancelled else "Completed"
+            skipped = worker.tracker.seen_stats['hits']
+            if result:
+                self.status_var.set(f"{prefix}! {result['inserted']} new jobs, {result['updated']} refreshed, "
+                                    f"{skipped} skipped (scraped recently)")
+            elif skipped:
+                self.status_var.set(f"{prefix}! No new jobs; {skipped} skipped (scraped recently)")
+            else:
+                self.status_var.set(f"{prefix}! No jobs found")
+            self.progress_var.set(100)
             
         except Exception as e:
             self.status_var.set(f"Error: {str(e)}")
             messagebox.showerror("Error", f"An error occurred: {str(e)}")
     
-    def load_latest_file(self):
-        """Load the most recent job tracking CSV file"""
-        try:
-            files = os.listdir("job_tracker/data")
-            csv_files = [f for f in files if f.endswith('.csv')]
-            
-            if not csv_files:
-                self.status_var.set("No job tracking files found")
-                return
-            
-            # Sort files by modification time (newest first)
-            csv_files.sort(key=lambda x: os.path.getmtime(os.path.join("job_tracker/data", x)), reverse=True)
-            
-            self.current_file = os.path.join("job_tracker/data", csv_files[0])
-            self.load_job_data()
-            
-        except Exception as e:
-            self.status_var.set(f"Error loading file: {str(e)}")
+    def set_search_controls(self, running):
+        """Enable Pause/Cancel while a scrape runs and Search otherwise"""
+        self.search_button.configure(state=tk.DISABLED if running else tk.NORMAL)
+        self.pause_button.configure(state=tk.NORMAL if running else tk.DISABLED, text="Pause")
+        self.cancel_button.configure(state=tk.NORMAL if running else tk.DISABLED)
+    
+    def toggle_pause(self):
+        """Pause or resume the running scrape"""
+        worker = self.scrape_worker
+        if not worker or not worker.running:
+            return
+        if worker.paused:
+            worker.resume()
+            self.pause_button.configure(text="Pause")
+            self.status_var.set("Resumed")
+        else:
+            worker.pause()
+            self.pause_button.configure(text="Resume")
+            self.status_var.set("Paused (requests already in flight will finish)")
+    
+    def cancel_search(self):
+        """Stop the running scrape; jobs extracted so far are still saved"""
+        if self.scrape_worker and self.scrape_worker.running:
+            self.scrape_worker.cancel()
+            self.cancel_button.configure(state=tk.DISABLED)
+            self.pause_button.configure(state=tk.DISABLED)
+            self.status_var.set("Cancelling...")
     
     def load_file(self):
-        """Open file dialog to load a CSV file"""
+        """Open file dialog to import a job tracking CSV into the store"""
         file_path = filedialog.askopenfilename(
             initialdir="job_tracker/data",
             title="Select Job Tracking File",
@@ -272,70 +355,43 @@ class JobTrackerApp:
         )
         
         if file_path:
-            self.current_file = file_path
-            self.load_job_data()
+            try:
+                rows = self.model.import_csv(file_path)
+                self.load_job_data()
+                self.status_var.set(f"Imported {rows} jobs from {os.path.basename(file_path)}")
+            except Exception as e:
+                messagebox.showerror("Error", f"Error importing file: {str(e)}")
+    
+    def populate_tree(self, status=None):
+        """Show the jobs with the given status, or all jobs; during a scrape, only the jobs it streamed in"""
+        if self.streaming:
+            column = self.job_tree['columns'].index('status')
+            rows = self.job_list.rows
+            positions = None if status is None else [pos for pos, row in enumerate(rows) if row[column] == status]
+            self.job_list.show(self.job_list.ids, rows, positions)
+        else:
+            ids, rows = self.model.display_rows(self.job_tree['columns'])
+            self.job_list.show(ids, rows, None if status is None else self.model.positions(status=status))
     
     def load_job_data(self):
-        """Load job data from the current file"""
-        if not self.current_file or not os.path.exists(self.current_file):
-            return
-        
+        """Load job data from the job store"""
         try:
-            # Clear existing data
-            for item in self.job_tree.get_children():
-                self.job_tree.delete(item)
-            
-            # Load the CSV file
-            df = pd.read_csv(self.current_file)
+            self.populate_tree()
             
             # Update status
-            self.status_var.set(f"Loaded {len(df)} jobs from {os.path.basename(self.current_file)}")
-            
-            # Insert data into treeview
-            for _, row in df.iterrows():
-                values = []
-                for col in self.job_tree['columns']:
-                    if col in row:
-                        values.append(row[col])
-                    else:
-                        values.append("")
-                
-                self.job_tree.insert('', tk.END, values=values)
+            self.status_var.set(f"Loaded {len(self.job_list)} jobs from {os.path.basename(self.store.path)}")
             
         except Exception as e:
             messagebox.showerror("Error", f"Error loading job data: {str(e)}")
     
     def filter_jobs(self, event=None):
         """Filter jobs by status"""
-        if not self.current_file:
-            return
-        
         try:
-            # Clear existing data
-            for item in self.job_tree.get_children():
-                self.job_tree.delete(item)
-            
-            # Load the CSV file
-            df = pd.read_csv(self.current_file)
-            
-            # Filter by status
             status = self.filter_var.get()
-            if status != 'All':
-                df = df[df['status'] == status]
-            
-            # Insert data into treeview
-            for _, row in df.iterrows():
-                values = []
-                for col in self.job_tree['columns']:
-                    if col in row:
-                        values.append(row[col])
-                    else:
-                        values.append("")
-                
-                self.job_tree.insert('', tk.END, values=values)
+            self.populate_tree(None if status == 'All' else status)
             
             # Update status
-            self.status_var.set(f"Showing {len(df)} jobs with status '{status}'")
+            self.status_var.set(f"Showing {len(self.job_list)} jobs with status '{status}'")
             
         except Exception as e:
             messagebox.showerror("Error", f"Error filtering jobs: {str(e)}")
@@ -346,48 +402,32 @@ class JobTrackerApp:
 
     def filter_by_age(self, max_days=30):
         """Filter out jobs older than max_days"""
-        if not self.current_file:
-            messagebox.showinfo("Info", "No job data loaded")
-            return
-        
         try:
-            # Load the CSV file
-            df = pd.read_csv(self.current_file)
-            
-            if 'posting_date' not in df.columns and 'time_posted' in df.columns:
-                # Try to parse posting dates from time_posted
-                df['posting_date'] = None
-                for idx, row in df.iterrows():
-                    if pd.notna(row['time_posted']):
-                        # Create a temporary tracker to use the parsing method
-                        temp_tracker = LinkedInJobTracker("", "")
-                        date = temp_tracker._parse_posting_date(row['time_posted'])
-                        if date:
-                            df.at[idx, 'posting_date'] = date
-            
-            if 'posting_date' not in df.columns:
-                messagebox.showinfo("Info", "Cannot filter by age: posting dates not available")
+            df = self.model.dataframe[['job_id', 'time_posted', 'posting_date']]
+            
+            if df.empty:
+                messagebox.showinfo("Info", "No job data loaded")
                 return
             
-            # Convert posting_date to datetime
-            df['posting_date'] = pd.to_datetime(df['posting_date'])
+            # Age in days, parsing time_posted where the posting date is missing
+            ages = posting_ages(df)
             
-            # Calculate job age in days
-            today = pd.Timestamp(datetime.now().date())
-            df['age_days'] = (today - df['posting_date']).dt.days
+            if ages.isna().all():
+                messagebox.showinfo("Info", "Cannot filter by age: posting dates not available")
+                return
             
             # Filter jobs
-            old_count = len(df[df['age_days'] > max_days])
-            df_filtered = df[df['age_days'] <= max_days]
+            old_ids = df.loc[ages > max_days, 'job_id'].tolist()
+            old_count = len(old_ids)
             
-            if len(df_filtered) == len(df):
+            if not old_count:
                 messagebox.showinfo("Info", f"No jobs older than {max_days} days found")
                 return
             
             # Ask for confirmation
             if messagebox.askyesno("Confirm", f"Remove {old_count} jobs older than {max_days} days?"):
-                # Save the filtered data
-                df_filtered.to_csv(self.current_file, index=False)
+                # Delete the old jobs from the store
+                self.model.delete_jobs(old_ids)
                 messagebox.showinfo("Success", f"Removed {old_count} old job listings")
                 
                 # Refresh the job list
@@ -411,9 +451,10 @@ class JobTrackerApp:
         
         # Load full job data
         try:
-            df = pd.read_csv(self.current_file)
             job_id = job_values[0]
-            job_data = df[df['job_id'] == job_id].iloc[0]
+            job_data = self.model.get(job_id)
+            if job_data is None:
+                raise KeyError(f"job {job_id} is not in the job store")
             
             # Create scrollable frame
             main_frame = ttk.Frame(details_window)
@@ -436,7 +477,7 @@ class JobTrackerApp:
             
             # Add job details
             row = 0
-            for col in df.columns:
+            for col in job_data:
                 if col != 'description':  # Display description separately
                     ttk.Label(scrollable_frame, text=f"{col.replace('_', ' ').title()}:", font=('', 10, 'bold')).grid(
                         row=row, column=0, sticky=tk.W, padx=5, pady=2)
@@ -447,14 +488,25 @@ class JobTrackerApp:
                     
                     row += 1
             
-            # Add description if available
-            if 'description' in df.columns and pd.notna(job_data['description']):
+            # Add status history
+            history = self.model.status_history(job_id)
+            if history:
+                ttk.Label(scrollable_frame, text="Status History:", font=('', 10, 'bold')).grid(
+                    row=row, column=0, sticky=tk.NW, padx=5, pady=2)
+                history_text = "\n".join(f"{entry['changed_at']}  {entry['status']}" for entry in history)
+                ttk.Label(scrollable_frame, text=history_text, justify=tk.LEFT).grid(
+                    row=row, column=1, sticky=tk.W, padx=5, pady=2)
+                row += 1
+            
+            # Add description if available; it is only read from the store when the dialog opens
+            description = self.model.description(job_id)
+            if description:
                 ttk.Label(scrollable_frame, text="Description:", font=('', 10, 'bold')).grid(
                     row=row, column=0, sticky=tk.NW, padx=5, pady=2)
                 
                 description_text = tk.Text(scrollable_frame, wrap=tk.WORD, width=50, height=15)
                 description_text.grid(row=row, column=1, sticky=tk.W, padx=5, pady=2)
-                description_text.insert(tk.END, job_data['description'])
+                description_text.insert(tk.END, description)
                 description_text.config(state=tk.DISABLED)
             
             # Add buttons
@@ -532,24 +584,22 @@ class JobTrackerApp:
         # Save button
         def save_status():
             try:
-                # Load the CSV file
-                df = pd.read_csv(self.current_file)
-            
                 # Update the job information
-                df.loc[df['job_id'] == job_id, 'status'] = status_var.get()
-                df.loc[df['job_id'] == job_id, 'date_applied'] = date_var.get()
-                df.loc[df['job_id'] == job_id, 'deadline'] = deadline_var.get()
-                df.loc[df['job_id'] == job_id, 'application_link'] = link_var.get()
-                df.loc[df['job_id'] == job_id, 'resume_link'] = resume_var.get()
-            
-                # Add notes column if it doesn't exist
-                if 'notes' not in df.columns:
-                    df['notes'] = None
-            
-                df.loc[df['job_id'] == job_id, 'notes'] = notes_text.get("1.0", tk.END).strip()
-            
-                # Save the updated file
-                df.to_csv(self.current_file, index=False)
+                updated = self.model.update_job(
+                    job_id,
+                    status=status_var.get(),
+                    date_applied=date_var.get(),
+                    deadline=deadline_var.get(),
+                    application_link=link_var.get(),
+                    resume_link=resume_var.get(),
+                    notes=notes_text.get("1.0", tk.END).strip()
+                )
+                
+                # Jobs streamed in by a running search aren't stored until it finishes
+                if not updated:
+                    messagebox.showerror("Error", f"Job {job_id} is not in the job store yet. "
+                                                  "Wait for the search to finish, then try again.")
+                    return
             
                 messagebox.showinfo("Success", f"Updated job {job_id} status to '{status_var.get()}'")
                 update_window.destroy()
@@ -564,8 +614,7 @@ class JobTrackerApp:
     
         # Try to load existing values
         try:
-            df = pd.read_csv(self.current_file)
-            job_data = df[df['job_id'] == job_id].iloc[0]
+            job_data = self.model.get(job_id)
         
             status_combo.set(job_data['status'] if pd.notna(job_data['status']) else 'Not Applied')
             date_var.set(job_data['date_applied'] if pd.notna(job_data['date_applied']) else '')
@@ -586,6 +635,23 @@ class JobTrackerApp:
         
      
     
+    def mark_selected_applied(self, event=None):
+        """Mark every selected job as Applied in one batch update"""
+        selection = self.job_tree.selection()
+        if not selection:
+            messagebox.showinfo("Info", "Please select jobs to update")
+            return
+        
+        job_ids = [self.job_tree.item(item, 'values')[0] for item in selection]
+        
+        try:
+            updated = self.model.update_jobs(job_ids, status='Applied',
+                                             date_applied=datetime.now().strftime("%Y-%m-%d"))
+            self.refresh_job_list()
+            self.status_var.set(f"Marked {updated} jobs as Applied")
+        except Exception as e:
+            messagebox.showerror("Error", f"Error updating job status: {str(e)}")
+    
     def open_application_link(self, event=None):
         """Open job application link in browser"""
         selection = self.job_tree.selection()
@@ -597,10 +663,9 @@ class JobTrackerApp:
         job_id = job_values[0]
         
         try:
-            df = pd.read_csv(self.current_file)
-            job_data = df[df['job_id'] == job_id].iloc[0]
+            job_data = self.model.get(job_id)
             
-            if pd.notna(job_data['application_link']):
+            if job_data and pd.notna(job_data['application_link']):
                 webbrowser.open(job_data['application_link'])
             else:
                 messagebox.showinfo("Info", "No application link available for this job")
@@ -615,10 +680,11 @@ class JobTrackerApp:
             return
         
         item = selection[0]
-        job_values = self.job_tree.item(item, 'values')
+        job_id = self.job_tree.item(item, 'values')[0]
+        job_data = self.model.get(job_id)
         
-        if len(job_values) >= 8 and job_values[7]:  # Email is at index 7
-            self.copy_to_clipboard(job_values[7])
+        if job_data and job_data['email']:
+            self.copy_to_clipboard(job_data['email'])
             messagebox.showinfo("Success", "Email copied to clipboard")
         else:
             messagebox.showinfo("Info", "No email available for this job")
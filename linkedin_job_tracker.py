@@ -1,32 +1,133 @@
-import requests
 from bs4 import BeautifulSoup
 import pandas as pd
 import os
-import time
 import random
+import queue
+import threading
 from datetime import datetime
-import re
 from urllib.parse import urlencode
+from job_fetcher import JobFetcher
+from posting_parser import parse_job_posting
+from text_extraction import extract_description_fields
+from posting_dates import parse_posting_date
+from job_store import JobStore, open_store
+from http_client import HttpClient, RequestBudgetExhausted
+
+LINKEDIN_URL = "https://www.linkedin.com"
 
 class LinkedInJobTracker:
-    def __init__(self, job_title, location, job_type=None):
+    def __init__(self, job_title, location, job_type=None, max_workers=4,
+                 requests_per_second=1.0, per_host_limit=2, base_url=LINKEDIN_URL, http_client=None,
+                 page_delay=(2, 5), store=None, refresh_after_days=7, response_cache=None,
+                 request_budget=None):
         """Initialize the LinkedIn job tracker with search parameters"""
         self.job_title = job_title
         self.location = location
         self.job_type = job_type
+        self.base_url = base_url.rstrip('/')
+        self.page_delay = page_delay  # Seconds to wait between search result pages
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         }
         self.job_list = []
         
+        # Postings already in the store and scraped within refresh_after_days are not fetched again
+        self.store = store
+        self.refresh_after_days = refresh_after_days
+        self.seen_stats = {'hits': 0, 'misses': 0, 'duplicates': 0}
+        self._seen_ids = set()
+        
+        # Cancel and pause controls, checked between pages and before each request
+        self._cancelled = threading.Event()
+        self._resumed = threading.Event()
+        self._resumed.set()
+        
+        # Pooled keep-alive session with retries, shared by search and detail requests;
+        # response_cache (a ResponseCache) keeps fetched pages on disk for revalidation and offline replay
+        self.http = http_client or HttpClient(headers=self.headers, pool_size=max(max_workers, per_host_limit),
+                                              cache=response_cache, budget=request_budget,
+                                              cancel_event=self._cancelled)
+        
+        # Shared worker pool and rate limiter for job detail requests
+        self.fetcher = JobFetcher(
+            max_workers=max_workers,
+            requests_per_second=requests_per_second,
+            per_host_limit=per_host_limit,
+            cancel_event=self._cancelled
+        )
+        
         # Create directory structure
         os.makedirs('job_tracker', exist_ok=True)
         os.makedirs('job_tracker/data', exist_ok=True)
         
+    def cancel(self):
+        """Stop searching and fetching; jobs already extracted are kept"""
+        self._cancelled.set()
+        self._resumed.set()
+        self.fetcher.cancel()
+    
+    def pause(self):
+        """Hold new search and detail requests until resume() is called"""
+        self._resumed.clear()
+    
+    def resume(self):
+        self._resumed.set()
+    
+    @property
+    def cancelled(self):
+        return self._cancelled.is_set()
+    
+    @property
+    def paused(self):
+        return not self._resumed.is_set()
+    
+    def _wait_if_paused(self):
+        """Block while paused, returning False once the run has been cancelled"""
+        self._resumed.wait()
+        return not self._cancelled.is_set()
+    
     def search_jobs(self, num_pages=3, max_age_days=None):
         """Search for jobs on LinkedIn and collect job IDs"""
-        print(f"Searching for {self.job_title} jobs in {self.location}...")
         job_ids = []
+        for page_ids in self.iter_search_pages(num_pages, max_age_days):
+            job_ids.extend(page_ids)
+        
+        # The same posting often shows up on more than one results page
+        unique_ids = list(dict.fromkeys(job_ids))
+        self.seen_stats['duplicates'] += len(job_ids) - len(unique_ids)
+        
+        print(f"Total job IDs collected: {len(unique_ids)}")
+        return unique_ids
+    
+    def _new_job_ids(self, job_ids):
+        """Drop IDs already handled in this run or scraped recently, counting cache hits and misses"""
+        unique_ids = []
+        for job_id in job_ids:
+            if job_id in self._seen_ids:
+                self.seen_stats['duplicates'] += 1
+            else:
+                self._seen_ids.add(job_id)
+                unique_ids.append(job_id)
+        
+        fresh = set()
+        if self.store is not None and self.refresh_after_days:
+            fresh = self.store.recently_scraped(unique_ids, self.refresh_after_days)
+        self.seen_stats['hits'] += len(fresh)
+        self.seen_stats['misses'] += len(unique_ids) - len(fresh)
+        return [job_id for job_id in unique_ids if job_id not in fresh]
+    
+    def print_seen_stats(self):
+        stats = self.seen_stats
+        print(f"Seen-ID cache: {stats['hits']} recently scraped (skipped), {stats['misses']} new or stale (fetched), "
+              f"{stats['duplicates']} duplicate IDs across pages and queries")
+    
+    def iter_search_pages(self, num_pages=3, max_age_days=None):
+        """Search for jobs on LinkedIn, yielding the job IDs of each results page as it arrives
+        
+        num_pages is an upper bound: the search stops early once a page comes back empty or
+        only repeats job IDs from earlier pages.
+        """
+        print(f"Searching for {self.job_title} jobs in {self.location}...")
     
         # Add LinkedIn's date filter if max_age_days is specified
         if max_age_days:
@@ -41,7 +142,12 @@ class LinkedInJobTracker:
         else:
             date_filter = None
     
+        seen_ids = set()
         for page in range(num_pages):
+            if not self._wait_if_paused():
+                print("Search cancelled")
+                return
+            
             start = page * 25  # LinkedIn uses 25 jobs per page
         
             # Construct the URL for LinkedIn job search
@@ -57,11 +163,11 @@ class LinkedInJobTracker:
             if date_filter:
                 params['f_TPR'] = date_filter
             
-            list_url = f"https://www.linkedin.com/jobs-guest/jobs/api/seeMoreJobPostings/search?{urlencode(params)}"
+            list_url = f"{self.base_url}/jobs-guest/jobs/api/seeMoreJobPostings/search?{urlencode(params)}"
             
             try:
                 # Send a GET request to the URL and store the response
-                response = requests.get(list_url, headers=self.headers)
+                response = self.http.get(list_url)
                 
                 if response.status_code == 200:
                     # Parse the response and find all list items (job postings)
@@ -69,255 +175,176 @@ class LinkedInJobTracker:
                     page_jobs = list_soup.find_all("li")
                     
                     # Extract job IDs
+                    page_ids = []
                     for job in page_jobs:
                         try:
                             base_card_div = job.find("div", {"class": "base-card"})
                             if base_card_div and base_card_div.get("data-entity-urn"):
                                 job_id = base_card_div.get("data-entity-urn").split(":")[-1]
-                                job_ids.append(job_id)
+                                page_ids.append(job_id)
                         except Exception as e:
                             print(f"Error extracting job ID: {e}")
                     
                     print(f"Found {len(page_jobs)} jobs on page {page+1}")
                     
-                    # Add a random delay to avoid being blocked
-                    time.sleep(random.uniform(2, 5))
+                    # LinkedIn has run out of results once pages are empty or start repeating
+                    if not page_ids:
+                        print(f"Page {page+1} is empty, no more results")
+                        return
+                    if seen_ids.issuperset(page_ids):
+                        print(f"Page {page+1} only repeats earlier results, stopping")
+                        return
+                    seen_ids.update(page_ids)
+                    yield page_ids
+                    
+                    # Add a random delay to avoid being blocked (not needed when the page came from the cache)
+                    if page < num_pages - 1 and not getattr(response, 'from_cache', False):
+                        self._cancelled.wait(random.uniform(*self.page_delay))
                 else:
                     print(f"Failed to fetch page {page+1}: Status code {response.status_code}")
+            except RequestBudgetExhausted:
+                print(f"Request budget used up, stopping search at page {page+1}")
+                return
             except Exception as e:
                 print(f"Error fetching page {page+1}: {e}")
+    
+    def iter_jobs(self, num_pages=3, max_age_days=None, on_page=None, pages=None):
+        """Search and extract in one pipeline, yielding each job as soon as it has been parsed
+        
+        on_page(page, page_ids) is called from the search thread after each results page.
+        pages, an iterable of job-ID lists, replaces this tracker's own search when given.
+        """
+        if pages is None:
+            pages = self.iter_search_pages(num_pages, max_age_days)
+        results = queue.Queue()
+        
+        def submit_search_results():
+            # Runs alongside the detail workers so page delays don't hold back finished jobs
+            submitted = 0
+            try:
+                for page, page_ids in enumerate(pages, start=1):
+                    if on_page:
+                        on_page(page, page_ids)
+                    for job_id in self._new_job_ids(page_ids):
+                        if self._cancelled.is_set():
+                            return
+                        try:
+                            future = self.fetcher.submit(self._fetch_job, job_id, self._job_url(job_id))
+                        except RuntimeError:
+                            # The pool was shut down by cancel() or interpreter exit
+                            return
+                        future.add_done_callback(results.put)
+                        submitted += 1
+            finally:
+                # The total count marks the end of the search phase
+                results.put(submitted)
+        
+        threading.Thread(target=submit_search_results, daemon=True).start()
+        
+        total = None
+        received = 0
+        while total is None or received < total:
+            try:
+                item = results.get(timeout=0.2)
+            except queue.Empty:
+                item = None
+            if self._cancelled.is_set():
+                break
+            if item is None:
+                continue
+            if isinstance(item, int):
+                total = item
+                continue
+            
+            received += 1
+            job_post = item.result()
+            if job_post:
+                self.job_list.append(job_post)
+                yield job_post
         
-        print(f"Total job IDs collected: {len(job_ids)}")
-        return job_ids
+        print(f"Extracted details for {len(self.job_list)} jobs")
     
     def extract_job_details(self, job_ids):
         """Extract detailed information for each job ID"""
         print("Extracting job details...")
         
-        for job_id in job_ids:
-            # Construct the URL for each job using the job ID
-            job_url = f"https://www.linkedin.com/jobs-guest/jobs/api/jobPosting/{job_id}"
-            apply_url = f"https://www.linkedin.com/jobs/view/{job_id}"
-            
-            try:
-                # Send a GET request to the job URL and parse the response
-                job_response = requests.get(job_url, headers=self.headers)
-                
-                if job_response.status_code == 200:
-                    job_soup = BeautifulSoup(job_response.text, "html.parser")
-                    
-                    # Create a dictionary to store job details
-                    job_post = {
-                        'job_id': job_id,
-                        'status': 'Not Applied',
-                        'date_applied': None,
-                        'deadline': None,
-                        'type': self._extract_job_type(job_soup),
-                        'contact_person': None,
-                        'email': self._extract_email(job_soup),
-                        'application_link': apply_url,
-                        'resume_link': None
-                    }
-                    
-                    # Extract job title
-                    try:
-                        job_post["job_title"] = job_soup.find("h2", {"class": lambda c: c and "topcard__title" in c}).text.strip()
-                    except:
-                        job_post["job_title"] = None
-                    
-                    # Extract company name
-                    try:
-                        job_post["company"] = job_soup.find("a", {"class": lambda c: c and "topcard__org-name-link" in c}).text.strip()
-                    except:
-                        try:
-                            job_post["company"] = job_soup.find("span", {"class": lambda c: c and "topcard__org-name" in c}).text.strip()
-                        except:
-                            job_post["company"] = None
-                    
-                    # Extract location
-                    try:
-                        job_post["location"] = job_soup.find("span", {"class": lambda c: c and "topcard__flavor--bullet" in c}).text.strip()
-                    except:
-                        job_post["location"] = None
-                    
-                    # Extract posting date
-                    try:
-                        job_post["time_posted"] = job_soup.find("span", {"class": lambda c: c and "posted-time-ago__text" in c}).text.strip()
-                        job_post["posting_date"] = self._parse_posting_date(job_post["time_posted"])
-                    except:
-                        job_post["time_posted"] = None
-                    
-                    # Extract number of applicants
-                    try:
-                        job_post["num_applicants"] = job_soup.find("span", {"class": lambda c: c and "num-applicants__caption" in c}).text.strip()
-                    except:
-                        job_post["num_applicants"] = None
-                    
-                    # Extract job description for further analysis
-                    try:
-                        job_description = job_soup.find("div", {"class": "show-more-less-html__markup"})
-                        if job_description:
-                            job_post["description"] = job_description.text.strip()
-                            
-                            # Extract application deadline
-                            deadline = self._extract_deadline(None, job_post["description"])
-                            if deadline:
-                                job_post['deadline'] = deadline
-
-                            # Try to extract contact information from description
-                            contact_info = self._extract_contact_info(job_post["description"])
-                            if contact_info.get('contact_person') and not job_post['contact_person']:
-                                job_post['contact_person'] = contact_info.get('contact_person')
-                            if contact_info.get('email') and not job_post['email']:
-                                job_post['email'] = contact_info.get('email')
-                    except:
-                        job_post["time_posted"] = None
-                        job_post["posting_date"] = None
-                        job_post["description"] = None
-                    
-                    # Append the job details to the job_list
-                    self.job_list.append(job_post)
-                    
-                    # Add a random delay to avoid being blocked
-                    time.sleep(random.uniform(1, 3))
-                else:
-                    print(f"Failed to fetch job {job_id}: Status code {job_response.status_code}")
-            except Exception as e:
-                print(f"Error fetching job {job_id}: {e}")
+        # Fetch concurrently; results come back in the same order as job_ids
+        results = self.fetcher.map(self._fetch_job, self._new_job_ids(job_ids), self._job_url)
+        self.job_list.extend(job_post for job_post in results if job_post)
         
         print(f"Extracted details for {len(self.job_list)} jobs")
     
-    def _extract_job_type(self, soup):
-        """Extract job type (Full-time, Contract, Co-op, etc.)"""
-        try:
-            job_criteria_list = soup.find_all("li", {"class": "description__job-criteria-item"})
-            for criteria in job_criteria_list:
-                header = criteria.find("h3", {"class": "description__job-criteria-subheader"})
-                if header and "Employment type" in header.text:
-                    return criteria.find("span", {"class": "description__job-criteria-text"}).text.strip()
-            
-            # If not found in criteria, try to extract from description
-            description = soup.find("div", {"class": "show-more-less-html__markup"})
-            if description:
-                text = description.text.lower()
-                if "full-time" in text or "full time" in text:
-                    return "Full-time"
-                elif "part-time" in text or "part time" in text:
-                    return "Part-time"
-                elif "contract" in text:
-                    return "Contract"
-                elif "co-op" in text or "coop" in text or "internship" in text:
-                    return "Co-op/Internship"
-        except:
-            pass
-        return "Not specified"
-    
-    def _extract_email(self, soup):
-        """Extract email from job posting"""
-        try:
-            # Try to find email in the job description
-            description = soup.find("div", {"class": "show-more-less-html__markup"})
-            if description:
-                text = description.text
-                # Look for email patterns
-                email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-                emails = re.findall(email_pattern, text)
-                if emails:
-                    return emails[0]
-        except:
-            pass
-        return None
-    
-    def _extract_deadline(self, soup, description_text=None):
-        """Extract application deadline from job posting"""
-        deadline = None
+    def _job_url(self, job_id):
+        """Build the guest API URL for a job posting"""
+        return f"{self.base_url}/jobs-guest/jobs/api/jobPosting/{job_id}"
     
+    def _fetch_job(self, job_id):
+        """Fetch and parse a single job posting, returning None on failure"""
+        if not self._wait_if_paused():
+            return None
         try:
-            # Try to find deadline in the job description
-            if not description_text and soup:
-                description = soup.find("div", {"class": "show-more-less-html__markup"})
-                if description:
-                    description_text = description.text
-        
-            if description_text:
-                # Common deadline patterns
-                deadline_patterns = [
-                    r'application deadline[:\s]*([A-Za-z]+\s+\d{1,2}(?:st|nd|rd|th)?[\s,]+\d{4})',
-                    r'apply by[:\s]*([A-Za-z]+\s+\d{1,2}(?:st|nd|rd|th)?[\s,]+\d{4})',
-                    r'closing date[:\s]*([A-Za-z]+\s+\d{1,2}(?:st|nd|rd|th)?[\s,]+\d{4})',
-                    r'applications close[:\s]*([A-Za-z]+\s+\d{1,2}(?:st|nd|rd|th)?[\s,]+\d{4})',
-                    r'deadline[:\s]*([A-Za-z]+\s+\d{1,2}(?:st|nd|rd|th)?[\s,]+\d{4})',
-                    r'applications due[:\s]*([A-Za-z]+\s+\d{1,2}(?:st|nd|rd|th)?[\s,]+\d{4})'
-                ]
+            # Send a GET request to the job URL and parse the response
+            job_response = self.http.get(self._job_url(job_id))
             
-                for pattern in deadline_patterns:
-                    match = re.search(pattern, description_text, re.IGNORECASE)
-                    if match:
-                        deadline = match.group(1)
-                        break
-        except:
+            if job_response.status_code == 200:
+                return self._parse_job_page(job_id, job_response.text)
+            print(f"Failed to fetch job {job_id}: Status code {job_response.status_code}")
+        except RequestBudgetExhausted:
             pass
+        except Exception as e:
+            print(f"Error fetching job {job_id}: {e}")
+        return None
     
-        return deadline
-    
-    def _parse_posting_date(self, time_posted_text):
-        """Convert LinkedIn's relative time (e.g., '2 days ago') to an actual date"""
-        if not time_posted_text:
-            return None
-        
-        today = datetime.now().date()
-    
-        # Handle common LinkedIn time formats
-        if 'hour' in time_posted_text or 'minute' in time_posted_text:
-            return today
-        elif 'day' in time_posted_text:
-            days = int(re.search(r'(\d+)', time_posted_text).group(1))
-            return today - pd.Timedelta(days=days)
-        elif 'week' in time_posted_text:
-            weeks = int(re.search(r'(\d+)', time_posted_text).group(1))
-            return today - pd.Timedelta(weeks=weeks)
-        elif 'month' in time_posted_text:
-            months = int(re.search(r'(\d+)', time_posted_text).group(1))
-            # Approximate a month as 30 days
-            return today - pd.Timedelta(days=30*months)
-        elif 'year' in time_posted_text:
-            years = int(re.search(r'(\d+)', time_posted_text).group(1))
-            # Approximate a year as 365 days
-            return today - pd.Timedelta(days=365*years)
-        else:
-            return None
+    def _parse_job_page(self, job_id, html):
+        """Parse the HTML of a job posting page into a job record"""
+        apply_url = f"https://www.linkedin.com/jobs/view/{job_id}"
+        posting = parse_job_posting(html, job_id)
+        fields = extract_description_fields(posting.description)
+
+        # Create a dictionary to store job details
+        job_post = {
+            'job_id': job_id,
+            'status': 'Not Applied',
+            'date_applied': None,
+            'deadline': fields.deadline,
+            'type': self._extract_job_type(posting),
+            'contact_person': fields.contact_person,
+            'email': fields.email,
+            'application_link': apply_url,
+            'resume_link': None,
+            'job_title': posting.job_title,
+            'company': posting.company,
+            'location': posting.location,
+            'time_posted': posting.time_posted,
+            'posting_date': parse_posting_date(posting.time_posted),
+            'num_applicants': posting.num_applicants,
+            'salary': fields.salary,
+            'work_mode': fields.work_mode,
+            'description': posting.description
+        }
+
+        return job_post
     
-    def _extract_contact_info(self, text):
-        """Extract contact information from text"""
-        result = {'contact_person': None, 'email': None}
-        
-        if not text:
-            return result
-        
-        # Extract email
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        emails = re.findall(email_pattern, text)
-        if emails:
-            result['email'] = emails[0]
-        
-        # Try to extract contact person
-        contact_patterns = [
-            r'contact\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+){1,2})',
-            r'reach out to\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+){1,2})',
-            r'email\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+){1,2})',
-            r'send.*resume.*to\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+){1,2})'
-        ]
-        
-        for pattern in contact_patterns:
-            matches = re.search(pattern, text, re.IGNORECASE)
-            if matches:
-                result['contact_person'] = matches.group(1)
-                break
+    def _extract_job_type(self, posting):
+        """Extract job type (Full-time, Contract, Co-op, etc.)"""
+        if posting.employment_type:
+            return posting.employment_type
         
-        return result
+        # If not found in criteria, try to extract from description
+        if posting.description:
+            text = posting.description.lower()
+            if "full-time" in text or "full time" in text:
+                return "Full-time"
+            elif "part-time" in text or "part time" in text:
+                return "Part-time"
+            elif "contract" in text:
+                return "Contract"
+            elif "co-op" in text or "coop" in text or "internship" in text:
+                return "Co-op/Internship"
+        return "Not specified"
     
-    def save_to_csv(self):
-        """Save job data to CSV file"""
+    def save_to_csv(self, filename=None):
+        """Export the scraped jobs to a timestamped CSV file"""
         if not self.job_list:
             print("No job data to save")
             return
@@ -344,7 +371,7 @@ class LinkedInJobTracker:
         
         # Generate filename with timestamp
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"job_tracker/data/{self.job_title.replace(' ', '_')}_{self.location.replace(' ', '_')}_{timestamp}.csv"
+        filename = filename or f"job_tracker/data/{self.job_title.replace(' ', '_')}_{self.location.replace(' ', '_')}_{timestamp}.csv"
         
         # Save to CSV
         df.to_csv(filename, index=False)
@@ -352,11 +379,26 @@ class LinkedInJobTracker:
         
         return filename
     
-    def run(self, num_pages=3, max_age_days=None):
+    def save_to_store(self, store=None):
+        """Upsert the scraped jobs into the job store"""
+        if not self.job_list:
+            print("No job data to save")
+            return None
+        
+        store = store or JobStore()
+        result = store.upsert_jobs(self.job_list)
+        print(f"Job store updated: {result['inserted']} new jobs, {result['updated']} refreshed ({store.path})")
+        return result
+    
+    def run(self, num_pages=3, max_age_days=None, store=None):
         """Run the complete job tracking process"""
-        job_ids = self.search_jobs(num_pages, max_age_days)
-        self.extract_job_details(job_ids)
-        return self.save_to_csv()
+        if store is not None:
+            self.store = store
+        for _ in self.iter_jobs(num_pages, max_age_days):
+            pass
+        self.http.print_stats()
+        self.print_seen_stats()
+        return self.save_to_store(self.store)
 
 if __name__ == "__main__":
     # Create a job tracker instance
@@ -367,11 +409,13 @@ if __name__ == "__main__":
     )
     
     # Run the tracker with age filter (e.g., only jobs from the past 30 days)
-    csv_file = tracker.run(num_pages=2, max_age_days=30)
+    store = open_store()
+    result = tracker.run(num_pages=2, max_age_days=30, store=store)
     
     # Load the saved data to display sample results
-    if csv_file:
-        df = pd.read_csv(csv_file)
+    if result:
+        df = store.load_dataframe()
+        df = df[df['job_id'].isin([job['job_id'] for job in tracker.job_list])]
         print("\nSample of tracked jobs:")
         print(df[['company', 'job_title', 'status', 'type', 'email', 'application_link']].head())
-        print(f"\nTotal jobs tracked: {len(df)}")
\ No newline at end of file
+        print(f"\nTotal jobs tracked: {store.count()}")
@@ -0,0 +1,151 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+
+LLM_CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "job_tracker", "llm_cache.db")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS completions (
+    key TEXT PRIMARY KEY,
+    model TEXT NOT NULL,
+    prompt_version TEXT NOT NULL,
+    content TEXT NOT NULL,
+    prompt_tokens INTEGER NOT NULL,
+    completion_tokens INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    stored_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_completions_accessed ON completions(accessed_at);
+"""
+
+def input_text(inputs):
+    """The text a prompt is keyed on: strings as is, prompt values rendered, dicts as sorted JSON"""
+    if isinstance(inputs, str):
+        return inputs
+    if hasattr(inputs, 'to_string'):
+        return inputs.to_string()
+    return json.dumps(inputs, sort_keys=True, ensure_ascii=False, default=str)
+
+def cache_key(model, prompt_version, inputs):
+    """SHA-256 of the model name, prompt template version and the hash of the inputs"""
+    digest = hashlib.sha256(input_text(inputs).encode('utf-8')).hexdigest()
+    return hashlib.sha256(f"{model}\x1f{prompt_version}\x1f{digest}".encode('utf-8')).hexdigest()
+
+class LLMCache:
+    """On-disk cache of chat model replies for deterministic (temperature 0) calls
+
+    Replies are stored in SQLite under cache_key(model, prompt_version, inputs), so changing the
+    model or bumping the prompt version misses instead of returning stale answers. When the
+    stored replies exceed max_bytes the least recently used ones are dropped first.
+    """
+    def __init__(self, path=LLM_CACHE_PATH, max_bytes=50 * 1024 * 1024):
+        self.path = path
+        self.max_bytes = max_bytes
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.lock = threading.Lock()
+        self.stats = {'hits': 0, 'misses': 0, 'stored': 0, 'evicted': 0, 'tokens_saved': 0}
+        with self.lock, self.conn:
+            self.conn.executescript(SCHEMA)
+            self.total_bytes = self.conn.execute("SELECT COALESCE(SUM(size), 0) FROM completions").fetchone()[0]
+            self._evict()
+
+    def get(self, model, prompt_version, inputs):
+        """The cached reply as a dict with content and token counts, or None"""
+        key = cache_key(model, prompt_version, inputs)
+        with self.lock, self.conn:
+            row = self.conn.execute(
+                "SELECT content, prompt_tokens, completion_tokens FROM completions WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                self.stats['misses'] += 1
+                return None
+            self.conn.execute("UPDATE completions SET accessed_at = ? WHERE key = ?", (time.time(), key))
+            self.stats['hits'] += 1
+            self.stats['tokens_saved'] += row[1] + row[2]
+        return {'content': row[0], 'prompt_tokens': row[1], 'completion_tokens': row[2]}
+
+    def put(self, model, prompt_version, inputs, content, prompt_tokens=0, completion_tokens=0):
+        key = cache_key(model, prompt_version, inputs)
+        size = len(content.encode('utf-8'))
+        now = time.time()
+        with self.lock, self.conn:
+            old = self.conn.execute("SELECT size FROM completions WHERE key = ?", (key,)).fetchone()
+            self.conn.execute(
+                "INSERT OR REPLACE INTO completions (key, model, prompt_version, content, prompt_tokens, "
+                "completion_tokens, size, stored_at, accessed_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, model, str(prompt_version), content, prompt_tokens, completion_tokens, size, now, now))
+            self.total_bytes += size - (old[0] if old else 0)
+            self.stats['stored'] += 1
+            self._evict()
+
+    def _evict(self):
+        """Drop least recently used replies until the rest fit in max_bytes"""
+        while self.total_bytes > self.max_bytes:
+            rows = self.conn.execute(
+                "SELECT key, size FROM completions ORDER BY accessed_at LIMIT 100").fetchall()
+            if not rows:
+                break
+            for key, size in rows:
+                if self.total_bytes <= self.max_bytes:
+                    break
+                self.conn.execute("DELETE FROM completions WHERE key = ?", (key,))
+                self.total_bytes -= size
+                self.stats['evicted'] += 1
+
+    def hit_rate(self):
+        lookups = self.stats['hits'] + self.stats['misses']
+        return self.stats['hits'] / lookups if lookups else 0.0
+
+    def count(self):
+        with self.lock:
+            return self.conn.execute("SELECT COUNT(*) FROM completions").fetchone()[0]
+
+    def print_stats(self):
+        stats = self.stats
+        print(f"LLM cache: {stats['hits']} hits, {stats['misses']} misses ({self.hit_rate():.0%} hit rate), "
+              f"{stats['tokens_saved']} tokens saved, {stats['stored']} stored, {stats['evicted']} evicted, "
+              f"{self.total_bytes / 1e6:.2f} MB on disk")
+
+    def close(self):
+        self.conn.close()
+
+class CachedMessage:
+    """A cached reply, shaped like the AIMessage it replaces"""
+    def __init__(self, content, prompt_tokens=0, completion_tokens=0):
+        self.content = content
+        self.response_metadata = {'cached': True, 'token_usage': {'prompt_tokens': prompt_tokens,
+                                                                  'completion_tokens': completion_tokens}}
+
+class CachedLLM:
+    """Wrap a chat model so repeated prompts are answered from an LLMCache without an API call
+
+    Use one prompt_version per prompt template and bump it when the template changes.
+    """
+    def __init__(self, llm, cache=None, prompt_version=1, model=None):
+        self.llm = llm
+        self.cache = cache if cache is not None else LLMCache()
+        self.prompt_version = prompt_version
+        self.model_name = model or getattr(llm, 'model_name', None) or type(llm).__name__
+
+    def _cached(self, input):
+        hit = self.cache.get(self.model_name, self.prompt_version, input)
+        return CachedMessage(hit['content'], hit['prompt_tokens'], hit['completion_tokens']) if hit else None
+
+    def _store(self, input, message):
+        usage = (getattr(message, 'response_metadata', None) or {}).get('token_usage') or {}
+        self.cache.put(self.model_name, self.prompt_version, input, message.content,
+                       usage.get('prompt_tokens', 0), usage.get('completion_tokens', 0))
+        return message
+
+    def invoke(self, input, config=None):
+        return self._cached(input) or self._store(input, self.llm.invoke(input))
+
+    async def ainvoke(self, input, config=None):
+        return self._cached(input) or self._store(input, await self.llm.ainvoke(input))
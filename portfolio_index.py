@@ -0,0 +1,159 @@
+import argparse
+import hashlib
+import os
+import time
+import pandas as pd
+from embedding_cache import EmbeddingCache
+from vector_index import BACKENDS, VectorIndex
+
+# chromadb is optional; only the portfolio collection needs it
+try:
+    import chromadb
+except ImportError:
+    chromadb = None
+
+PORTFOLIO_CSV = os.path.join(os.path.dirname(os.path.abspath(__file__)), "ColdEmailGenerator", "portfolio_data.csv")
+VECTORSTORE_PATH = os.path.join(os.path.expanduser("~"), "vectorstore")
+COLLECTION_NAME = "portfolio"
+BATCH_SIZE = 64
+
+# 'chroma' uses ChromaDB; 'exact', 'ivf' or 'hnsw' use the in-process vector_index.VectorIndex
+VECTOR_BACKEND = os.environ.get("PORTFOLIO_VECTOR_BACKEND", "chroma")
+
+# portfolio_data.csv headers -> the names the collection and the notebook use
+CSV_COLUMNS = {'Tech Stack': 'Techstack', 'Portfolio URL': 'Links'}
+
+def _require_chromadb():
+    if chromadb is None:
+        raise RuntimeError("The portfolio collection needs chromadb: pip install chromadb")
+
+def load_portfolio(path=PORTFOLIO_CSV):
+    """Read the portfolio CSV as Techstack/Links rows, dropping blank and repeated rows"""
+    df = pd.read_csv(path).rename(columns=CSV_COLUMNS)
+    df = df.dropna(subset=['Techstack', 'Links'])
+    df['Techstack'] = df['Techstack'].astype(str).str.strip()
+    df['Links'] = df['Links'].astype(str).str.strip()
+    return df.drop_duplicates(['Techstack', 'Links'], ignore_index=True)
+
+def portfolio_id(techstack, links):
+    """Content-hash ID of a portfolio row, so an unchanged row always maps to the same document"""
+    return hashlib.sha256(f"{techstack}\x1f{links}".encode('utf-8')).hexdigest()[:32]
+
+def open_collection(path=VECTORSTORE_PATH, name=COLLECTION_NAME, embedding_function=None, backend=None):
+    """Open (or create) the persistent portfolio collection with the configured backend"""
+    backend = backend or VECTOR_BACKEND
+    if backend in BACKENDS:
+        if embedding_function is None:
+            embedding_function = EmbeddingCache()
+        return VectorIndex(os.path.join(path, name), embedding_function=embedding_function, backend=backend)
+    if backend != 'chroma':
+        raise ValueError(f"Unknown vector backend {backend!r}; expected chroma, {', '.join(BACKENDS)}")
+    _require_chromadb()
+    os.makedirs(path, exist_ok=True)
+    client = chromadb.PersistentClient(path)
+    if embedding_function is None:
+        return client.get_or_create_collection(name=name)
+    return client.get_or_create_collection(name=name, embedding_function=embedding_function)
+
+def query_portfolio(collection, texts, n_results=2, embedding_function=None):
+    """Query the collection for every text in one call, embedding them with embedding_function if given
+
+    Pass an EmbeddingCache so skills that were queried before are not embedded again.
+    """
+    texts = list(texts)
+    if embedding_function is None:
+        return collection.query(query_texts=texts, n_results=n_results)
+    return collection.query(query_embeddings=embedding_function(texts), n_results=n_results)
+
+class PortfolioIndexer:
+    """Keep a Chroma collection in sync with the portfolio CSV
+
+    Document IDs are hashes of the row content, so a sync only embeds rows that are new or
+    were edited, and deletes documents whose rows were edited or removed. Rerunning it on an
+    unchanged CSV writes nothing.
+    """
+    def __init__(self, collection=None, embedding_function=None, batch_size=BATCH_SIZE):
+        self.collection = collection if collection is not None else open_collection()
+        # Without an embedding function (e.g. an EmbeddingCache), the collection embeds each batch itself
+        self.embedding_function = embedding_function
+        self.batch_size = max(1, batch_size)
+        self.last_sync = None
+
+    def documents(self, df):
+        """Map content-hash IDs to (document, metadata) for every portfolio row"""
+        return {portfolio_id(techstack, links): (techstack, {'links': links})
+                for techstack, links in zip(df['Techstack'], df['Links'])}
+
+    def existing_ids(self):
+        return set(self.collection.get(include=[])['ids'])
+
+    def plan(self, df):
+        """Work out the minimal change: documents to upsert, IDs to delete and how many rows are unchanged"""
+        wanted = self.documents(df)
+        existing = self.existing_ids()
+        upserts = {doc_id: doc for doc_id, doc in wanted.items() if doc_id not in existing}
+        deletes = sorted(existing - wanted.keys())
+        return upserts, deletes, len(wanted) - len(upserts)
+
+    def _batches(self, items):
+        for start in range(0, len(items), self.batch_size):
+            yield items[start:start + self.batch_size]
+
+    def sync(self, df=None):
+        """Apply the minimal diff between the CSV and the collection, in batches"""
+        df = load_portfolio() if df is None else df
+        started = time.perf_counter()
+        upserts, deletes, unchanged = self.plan(df)
+        stats = {'added': len(upserts), 'removed': len(deletes), 'unchanged': unchanged,
+                 'batches': 0, 'embed_seconds': 0.0, 'seconds': 0.0}
+
+        for batch in self._batches(deletes):
+            self.collection.delete(ids=batch)
+
+        for batch in self._batches(list(upserts.items())):
+            ids = [doc_id for doc_id, _ in batch]
+            documents = [document for _, (document, _) in batch]
+            metadatas = [metadata for _, (_, metadata) in batch]
+            if self.embedding_function is not None:
+                embed_started = time.perf_counter()
+                embeddings = self.embedding_function(documents)
+                stats['embed_seconds'] += time.perf_counter() - embed_started
+                self.collection.upsert(ids=ids, documents=documents, metadatas=metadatas, embeddings=embeddings)
+            else:
+                self.collection.upsert(ids=ids, documents=documents, metadatas=metadatas)
+            stats['batches'] += 1
+
+        # The local vector index saves its search structure explicitly; Chroma persists on write
+        if hasattr(self.collection, 'persist'):
+            self.collection.persist()
+        stats['seconds'] = time.perf_counter() - started
+        self.last_sync = stats
+        return stats
+
+    def print_report(self, stats=None):
+        """Rows added, removed and unchanged by the last sync, and its embedding throughput"""
+        stats = stats or self.last_sync
+        if not stats:
+            return
+        print(f"Portfolio sync: {stats['added']} added, {stats['removed']} removed, "
+              f"{stats['unchanged']} unchanged in {stats['batches']} batches of up to {self.batch_size}")
+        rate = stats['added'] / stats['seconds'] if stats['seconds'] else 0.0
+        print(f"{stats['seconds']:.2f}s total, {rate:.1f} documents/s"
+              + (f" ({stats['embed_seconds']:.2f}s embedding)" if self.embedding_function is not None else ""))
+        print(f"Total documents in collection: {self.collection.count()}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Sync the portfolio CSV into the portfolio vector collection")
+    parser.add_argument("--csv", default=PORTFOLIO_CSV, help="Portfolio CSV with Tech Stack and Portfolio URL columns")
+    parser.add_argument("--db", default=VECTORSTORE_PATH, help="Vector store directory")
+    parser.add_argument("--backend", default=VECTOR_BACKEND, choices=('chroma',) + BACKENDS,
+                        help="chroma, or the in-process index: exact, ivf or hnsw")
+    parser.add_argument("--batch-size", type=int, default=BATCH_SIZE, help="Documents embedded per upsert")
+    args = parser.parse_args()
+
+    embeddings = EmbeddingCache()
+    collection = open_collection(args.db, embedding_function=embeddings, backend=args.backend)
+    indexer = PortfolioIndexer(collection, embedding_function=embeddings, batch_size=args.batch_size)
+    indexer.sync(load_portfolio(args.csv))
+    indexer.print_report()
+    embeddings.print_stats()
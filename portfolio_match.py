@@ -0,0 +1,168 @@
+import argparse
+import json
+import time
+import numpy as np
+import pandas as pd
+from embedding_cache import EmbeddingCache
+from portfolio_index import PORTFOLIO_CSV, load_portfolio
+
+# Skill rows scored against the portfolio per matmul; bounds memory for very large batches
+SCORE_CHUNK = 4096
+
+def parse_skills(value):
+    """Skills of one job: a list, a JSON list (as stored in CSVs) or a single skill string"""
+    if isinstance(value, (list, tuple, np.ndarray)):
+        return [str(skill) for skill in value if isinstance(skill, str) and skill.strip()]
+    if not isinstance(value, str) or not value.strip():
+        return []
+    if value.lstrip().startswith('['):
+        try:
+            return parse_skills(json.loads(value))
+        except ValueError:
+            pass
+    return [value]
+
+def job_queries(df, skills_column='skills', fallback_column='job_title'):
+    """Query texts for each job: its skills, or its title when no skills were extracted"""
+    skills = df[skills_column] if skills_column in df.columns else pd.Series([None] * len(df), index=df.index)
+    fallback = df[fallback_column] if fallback_column in df.columns else pd.Series([None] * len(df), index=df.index)
+    return [parse_skills(value) or parse_skills(title) for value, title in zip(skills, fallback)]
+
+def _normalize_rows(matrix):
+    matrix = np.asarray(matrix, dtype=np.float32)
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    return matrix / np.where(norms == 0, 1, norms)
+
+class PortfolioMatcher:
+    """Match whole batches of jobs against the portfolio with one embedding pass and one matmul
+
+    Each job's skills are scored against every portfolio entry by cosine similarity (the same
+    ranking as Chroma's L2 distance on normalized vectors). Every skill keeps its per_skill best
+    entries, as the notebook's n_results did, and each job gets its top_k distinct links across
+    all of its skills.
+    """
+    def __init__(self, documents, links, embedding_function=None, embeddings=None, top_k=3, per_skill=2):
+        self.documents = list(documents)
+        self.links = list(links)
+        self.embedding_function = embedding_function if embedding_function is not None else EmbeddingCache()
+        if embeddings is None:
+            embeddings = self.embedding_function(self.documents)
+        self.matrix = _normalize_rows(embeddings)
+        # The same link can back several portfolio entries; results are deduplicated per link
+        self.link_codes, self.unique_links = pd.factorize(pd.Series(self.links, dtype=object))
+        self.top_k = top_k
+        self.per_skill = min(per_skill, len(self.documents))
+        self.last_match = None
+
+    @classmethod
+    def from_csv(cls, path=PORTFOLIO_CSV, embedding_function=None, **kwargs):
+        df = load_portfolio(path)
+        return cls(df['Techstack'], df['Links'], embedding_function, **kwargs)
+
+    @classmethod
+    def from_collection(cls, collection, embedding_function=None, **kwargs):
+        """Use the vectors already stored in a Chroma portfolio collection"""
+        stored = collection.get(include=['embeddings', 'documents', 'metadatas'])
+        links = [metadata['links'] for metadata in stored['metadatas']]
+        return cls(stored['documents'], links, embedding_function, embeddings=stored['embeddings'], **kwargs)
+
+    def _top_entries(self, queries):
+        """Per query row: indexes and scores of the per_skill most similar portfolio entries"""
+        count = self.per_skill
+        entries = np.empty((len(queries), count), dtype=np.int64)
+        scores = np.empty((len(queries), count), dtype=np.float32)
+        for start in range(0, len(queries), SCORE_CHUNK):
+            similarity = queries[start:start + SCORE_CHUNK] @ self.matrix.T
+            if count < similarity.shape[1]:
+                top = np.argpartition(-similarity, count - 1, axis=1)[:, :count]
+            else:
+                top = np.broadcast_to(np.arange(similarity.shape[1]), similarity.shape)
+            entries[start:start + SCORE_CHUNK] = top
+            scores[start:start + SCORE_CHUNK] = np.take_along_axis(similarity, top, axis=1)
+        return entries, scores
+
+    def match(self, job_skills):
+        """Top links for every job in a list of skill lists, as lists of dicts (best first)
+
+        Each match has the link, the portfolio entry's tech stack, the job skill it matched
+        and the cosine similarity.
+        """
+        started = time.perf_counter()
+        job_skills = [parse_skills(skills) for skills in job_skills]
+        owners = np.repeat(np.arange(len(job_skills)), [len(skills) for skills in job_skills])
+        skills = [skill for job in job_skills for skill in job]
+        results = [[] for _ in job_skills]
+        if not skills or not self.documents:
+            return results
+
+        # Every distinct skill in the batch is embedded and scored once
+        skill_codes, unique_skills = pd.factorize(pd.Series(skills, dtype=object))
+        queries = _normalize_rows(self.embedding_function(list(unique_skills)))
+        embedded = time.perf_counter()
+        entries, scores = self._top_entries(queries)
+
+        # One candidate per (skill occurrence, entry); keep each job's best score per link
+        candidate_jobs = np.repeat(owners, self.per_skill)
+        candidate_skills = np.repeat(skill_codes, self.per_skill)
+        candidate_entries = entries[skill_codes].ravel()
+        candidate_scores = scores[skill_codes].ravel()
+        candidate_links = self.link_codes[candidate_entries]
+
+        order = np.lexsort((-candidate_scores, candidate_links, candidate_jobs))
+        pairs = candidate_jobs[order] * len(self.unique_links) + candidate_links[order]
+        best = order[np.r_[True, pairs[1:] != pairs[:-1]]]
+
+        # Rank the surviving links within each job and keep the top_k
+        best = best[np.lexsort((-candidate_scores[best], candidate_jobs[best]))]
+        jobs = candidate_jobs[best]
+        first = np.searchsorted(jobs, jobs, side='left')
+        best = best[np.arange(len(best)) - first < self.top_k]
+
+        for index in best:
+            entry = candidate_entries[index]
+            results[candidate_jobs[index]].append({
+                'link': self.links[entry],
+                'techstack': self.documents[entry],
+                'skill': unique_skills[candidate_skills[index]],
+                'score': float(candidate_scores[index]),
+            })
+        self.last_match = {'jobs': len(job_skills), 'skills': len(skills), 'unique_skills': len(unique_skills),
+                           'embed_seconds': embedded - started, 'seconds': time.perf_counter() - started}
+        return results
+
+    def match_frame(self, df, skills_column='skills', fallback_column='job_title'):
+        """Add portfolio_links (a JSON list of the top links) to a jobs DataFrame"""
+        matches = self.match(job_queries(df, skills_column, fallback_column))
+        df = df.copy()
+        df['portfolio_links'] = [json.dumps([match['link'] for match in job]) for job in matches]
+        return df
+
+    def print_report(self):
+        stats = self.last_match
+        if not stats:
+            return
+        rate = stats['jobs'] / stats['seconds'] if stats['seconds'] else 0.0
+        print(f"Matched {stats['jobs']} jobs ({stats['skills']} skills, {stats['unique_skills']} distinct) against "
+              f"{len(self.documents)} portfolio entries in {stats['seconds']:.2f}s "
+              f"({stats['embed_seconds']:.2f}s embedding, {rate:.0f} jobs/s)")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Match every job in a scraped CSV against the portfolio")
+    parser.add_argument("jobs_csv", help="Jobs CSV with a skills column (JSON lists) or job titles")
+    parser.add_argument("--portfolio", default=PORTFOLIO_CSV)
+    parser.add_argument("--top-k", type=int, default=3, help="Links per job")
+    parser.add_argument("--per-skill", type=int, default=2, help="Portfolio entries considered per skill")
+    parser.add_argument("--output", help="Write the jobs with a portfolio_links column here")
+    args = parser.parse_args()
+
+    embeddings = EmbeddingCache()
+    matcher = PortfolioMatcher.from_csv(args.portfolio, embeddings, top_k=args.top_k, per_skill=args.per_skill)
+    matched = matcher.match_frame(pd.read_csv(args.jobs_csv, dtype={'job_id': str}))
+    matcher.print_report()
+    embeddings.print_stats()
+    if args.output:
+        matched.to_csv(args.output, index=False)
+        print(f"Saved {len(matched)} jobs to {args.output}")
+    else:
+        columns = [col for col in ('job_id', 'job_title', 'portfolio_links') if col in matched.columns]
+        print(matched[columns].head(20).to_string(index=False))
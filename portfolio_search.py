@@ -0,0 +1,145 @@
+import re
+from collections import Counter
+import numpy as np
+from embedding_cache import EmbeddingCache
+from portfolio_index import PORTFOLIO_CSV, load_portfolio, portfolio_id
+
+MODES = ('hybrid', 'vector', 'keyword')
+
+# Technology names keep their punctuation: node.js, .net, c#, c++, ci/cd splits into ci and cd
+TERM_PATTERN = re.compile(r"\.?[a-z0-9#+]+(?:[.\-][a-z0-9#+]+)*")
+
+def tokenize(text):
+    """Keyword terms of a tech stack or query: words, the parts of dotted/hyphenated names,
+    and word pairs within each comma-separated item, so "React Native" is not just "React"
+    """
+    terms = []
+    for item in str(text).lower().split(','):
+        words = TERM_PATTERN.findall(item)
+        terms.extend(words)
+        for word in words:
+            parts = [part for part in re.split(r"[.\-]", word) if part]
+            if len(parts) > 1:
+                terms.extend(parts)
+        terms.extend(f"{first} {second}" for first, second in zip(words, words[1:]))
+    return terms
+
+class KeywordIndex:
+    """BM25 over an inverted index: per term, the documents containing it and their precomputed weights"""
+    def __init__(self, documents, k1=1.2, b=0.75):
+        self.size = len(documents)
+        term_counts = [Counter(tokenize(document)) for document in documents]
+        lengths = np.array([sum(counts.values()) for counts in term_counts], dtype=np.float32)
+        average = lengths.mean() if self.size and lengths.mean() else 1.0
+
+        postings = {}
+        for doc, counts in enumerate(term_counts):
+            for term, tf in counts.items():
+                postings.setdefault(term, ([], []))
+                postings[term][0].append(doc)
+                postings[term][1].append(tf)
+        self.postings = {}
+        for term, (docs, tfs) in postings.items():
+            docs, tfs = np.array(docs), np.array(tfs, dtype=np.float32)
+            idf = np.log(1 + (self.size - len(docs) + 0.5) / (len(docs) + 0.5))
+            weights = idf * tfs * (k1 + 1) / (tfs + k1 * (1 - b + b * lengths[docs] / average))
+            self.postings[term] = (docs, weights.astype(np.float32))
+
+    def scores(self, queries):
+        """(queries x documents) BM25 scores"""
+        scores = np.zeros((len(queries), self.size), dtype=np.float32)
+        for row, query in enumerate(queries):
+            for term in set(tokenize(query)):
+                if term in self.postings:
+                    docs, weights = self.postings[term]
+                    scores[row, docs] += weights
+        return scores
+
+def _ranks(scores, depth, valid=None):
+    """Rank (0 = best) of each document per query row; documents below depth or invalid get -1"""
+    depth = min(depth, scores.shape[1])
+    if depth < scores.shape[1]:
+        top = np.argpartition(-scores, depth - 1, axis=1)[:, :depth]
+    else:
+        top = np.broadcast_to(np.arange(scores.shape[1]), scores.shape)
+    order = np.take_along_axis(top, np.argsort(-np.take_along_axis(scores, top, axis=1), axis=1, kind='stable'), axis=1)
+    ranks = np.full(scores.shape, -1, dtype=np.int64)
+    np.put_along_axis(ranks, order, np.broadcast_to(np.arange(depth), order.shape), axis=1)
+    if valid is not None:
+        ranks[~valid] = -1
+    return ranks
+
+class HybridRetriever:
+    """Portfolio retrieval that fuses embedding similarity with BM25 keyword scores
+
+    Tech stacks are short lists of names, where an embedding can rank "React Native" or
+    "JavaScript" above an exact "React" or "Java". Each query is ranked both ways and the two
+    rankings are combined with reciprocal rank fusion (score = sum of weight / (rrf_k + rank)), so
+    an entry that both methods place near the top wins; queries with no indexed term fall back
+    to the embedding ranking alone. Both rankings weigh 1 (plain RRF) unless keyword_weight is
+    set; pick it with bench_portfolio_search's sweep, run with the embedding model you deploy.
+    All queries are answered in one call.
+    """
+    def __init__(self, ids, documents, metadatas, embedding_function=None, embeddings=None,
+                 rrf_k=60, depth=50, keyword_weight=1.0):
+        self.ids = list(ids)
+        self.documents = list(documents)
+        self.metadatas = list(metadatas)
+        self.embedding_function = embedding_function if embedding_function is not None else EmbeddingCache()
+        if embeddings is None:
+            embeddings = self.embedding_function(self.documents)
+        matrix = np.asarray(embeddings, dtype=np.float32).reshape(len(self.documents), -1)
+        self.matrix = matrix / np.maximum(np.linalg.norm(matrix, axis=1, keepdims=True), 1e-12)
+        self.keywords = KeywordIndex(self.documents)
+        self.rrf_k = rrf_k
+        self.depth = depth  # Only the top `depth` of each ranking contributes to the fused score
+        self.keyword_weight = keyword_weight  # The embedding ranking has weight 1
+
+    @classmethod
+    def from_csv(cls, path=PORTFOLIO_CSV, embedding_function=None, **kwargs):
+        df = load_portfolio(path)
+        ids = [portfolio_id(techstack, links) for techstack, links in zip(df['Techstack'], df['Links'])]
+        return cls(ids, df['Techstack'], [{'links': links} for links in df['Links']], embedding_function, **kwargs)
+
+    @classmethod
+    def from_collection(cls, collection, embedding_function=None, **kwargs):
+        """Index the documents and stored vectors of a Chroma collection or VectorIndex"""
+        stored = collection.get(include=['embeddings', 'documents', 'metadatas'])
+        return cls(stored['ids'], stored['documents'], stored['metadatas'], embedding_function,
+                   embeddings=stored['embeddings'], **kwargs)
+
+    def scores(self, query_texts, mode='hybrid'):
+        """(queries x documents) scores for one of MODES; higher is better"""
+        if mode not in MODES:
+            raise ValueError(f"Unknown retrieval mode {mode!r}; expected one of {', '.join(MODES)}")
+        keyword = self.keywords.scores(query_texts) if mode != 'vector' else None
+        if mode == 'keyword':
+            return keyword
+        queries = np.asarray(self.embedding_function(query_texts), dtype=np.float32)
+        queries /= np.maximum(np.linalg.norm(queries, axis=1, keepdims=True), 1e-12)
+        similarity = queries @ self.matrix.T
+        if mode == 'vector':
+            return similarity
+
+        fused = np.zeros_like(similarity)
+        for weight, ranks in ((1.0, _ranks(similarity, self.depth)),
+                              (self.keyword_weight, _ranks(keyword, self.depth, valid=keyword > 0))):
+            fused += np.where(ranks >= 0, weight / (self.rrf_k + ranks + 1), 0.0)
+        # Ties (e.g. entries neither ranking reached) fall back to embedding similarity
+        return fused + 1e-6 * similarity
+
+    def query(self, query_texts, n_results=3, mode='hybrid'):
+        """The n_results best portfolio entries per query text, shaped like a Chroma query result"""
+        query_texts = [query_texts] if isinstance(query_texts, str) else list(query_texts)
+        result = {'ids': [], 'documents': [], 'metadatas': [], 'scores': []}
+        if not query_texts or not self.documents:
+            return result
+        scores = self.scores(query_texts, mode)
+        n_results = min(n_results, len(self.documents))
+        top = np.argsort(-scores, axis=1, kind='stable')[:, :n_results]
+        for row, entries in enumerate(top):
+            result['ids'].append([self.ids[entry] for entry in entries])
+            result['documents'].append([self.documents[entry] for entry in entries])
+            result['metadatas'].append([self.metadatas[entry] for entry in entries])
+            result['scores'].append([float(scores[row, entry]) for entry in entries])
+        return result
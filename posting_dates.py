@@ -0,0 +1,50 @@
+import re
+from datetime import datetime
+import numpy as np
+import pandas as pd
+
+# Days per unit of LinkedIn's relative times; months and years are approximated as 30 and 365 days
+UNIT_DAYS = {'second': 0, 'minute': 0, 'hour': 0, 'day': 1, 'week': 7, 'month': 30, 'year': 365}
+
+# "2 days ago", "Reposted 3 weeks ago", "1 hour ago", "30+ days ago"; a missing number counts as 1
+RELATIVE_TIME = r'(?:(?P<number>\d+)\+?\s*)?\b(?P<unit>second|minute|hour|day|week|month|year)s?\b'
+RELATIVE_TIME_PATTERN = re.compile(RELATIVE_TIME, re.IGNORECASE)
+
+def _today(today=None):
+    return pd.Timestamp(today if today is not None else datetime.now().date()).normalize()
+
+def parse_posting_date(time_posted_text, today=None):
+    """Convert one LinkedIn relative time (e.g., '2 days ago') to a date, or None"""
+    if not isinstance(time_posted_text, str):
+        return None
+    match = RELATIVE_TIME_PATTERN.search(time_posted_text)
+    if not match:
+        return None
+    days = int(match.group('number') or 1) * UNIT_DAYS[match.group('unit').lower()]
+    return (_today(today) - pd.Timedelta(days=days)).date()
+
+def parse_posting_dates(time_posted, today=None):
+    """Convert a Series of relative times to posting dates in one vectorized pass (NaT if unparseable)"""
+    time_posted = pd.Series(time_posted, dtype=object)
+
+    # Relative times repeat a lot ("1 day ago"), so parse each distinct text once
+    codes, texts = pd.factorize(time_posted)
+    parts = pd.Series(texts, dtype='string').str.extract(RELATIVE_TIME, flags=re.IGNORECASE)
+    numbers = pd.to_numeric(parts['number'], errors='coerce').fillna(1)
+    days = (numbers * parts['unit'].str.lower().map(UNIT_DAYS).astype(float)).to_numpy()
+
+    # Missing values get code -1; append a NaN for them to index
+    days = np.append(days, np.nan)[codes]
+    return pd.Series(_today(today) - pd.to_timedelta(days, unit='D'), index=time_posted.index)
+
+def posting_dates(df, today=None):
+    """Posting dates of a jobs DataFrame, falling back to time_posted where posting_date is missing"""
+    dates = pd.to_datetime(df['posting_date'], format="%Y-%m-%d", errors='coerce')
+    missing = dates.isna()
+    if missing.any() and 'time_posted' in df.columns:
+        dates = dates.mask(missing, parse_posting_dates(df.loc[missing, 'time_posted'], today))
+    return dates
+
+def posting_ages(df, today=None):
+    """Age in days of each job in a jobs DataFrame (NaN where no date is known)"""
+    return (_today(today) - posting_dates(df, today)).dt.days
@@ -0,0 +1,208 @@
+from dataclasses import dataclass, field
+from html.parser import HTMLParser
+from typing import Dict, Optional
+
+# Optional faster parsers, used automatically when installed
+try:
+    from selectolax.lexbor import LexborHTMLParser as SelectolaxParser
+except ImportError:
+    SelectolaxParser = None
+
+try:
+    import lxml.html
+except ImportError:
+    lxml = None
+
+# (field, tag, class fragment) - an element matches when one of its classes contains the fragment
+FIELD_RULES = (
+    ('job_title', 'h2', 'topcard__title'),
+    ('company', 'a', 'topcard__org-name-link'),
+    ('company_name', 'span', 'topcard__org-name'),
+    ('location', 'span', 'topcard__flavor--bullet'),
+    ('time_posted', 'span', 'posted-time-ago__text'),
+    ('num_applicants', 'span', 'num-applicants__caption'),
+    ('description', 'div', 'show-more-less-html__markup'),
+    ('criteria_header', 'h3', 'description__job-criteria-subheader'),
+    ('criteria_text', 'span', 'description__job-criteria-text'),
+)
+
+# Elements that start a new line in the description's text, so headings and list items stay
+# apart even when the markup is minified ("hiring.</p><h3>Responsibilities</h3>")
+BLOCK_TAGS = frozenset({'br', 'p', 'div', 'ul', 'ol', 'li', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'tr', 'section',
+                        'header', 'footer'})
+
+RULES_BY_TAG = {}
+for _field, _tag, _fragment in FIELD_RULES:
+    RULES_BY_TAG.setdefault(_tag, []).append((_field, _fragment))
+
+@dataclass
+class JobPosting:
+    """Fields pulled from a LinkedIn job posting page"""
+    job_id: Optional[str] = None
+    job_title: Optional[str] = None
+    company: Optional[str] = None
+    location: Optional[str] = None
+    time_posted: Optional[str] = None
+    num_applicants: Optional[str] = None
+    description: Optional[str] = None
+    criteria: Dict[str, str] = field(default_factory=dict)
+
+    @property
+    def employment_type(self):
+        """The 'Employment type' entry of the job criteria list, if present"""
+        for header, value in self.criteria.items():
+            if "Employment type" in header:
+                return value
+        return None
+
+def _clean_lines(text):
+    """Collapse runs of spaces within each line and drop blank lines"""
+    lines = (" ".join(line.split()) for line in text.splitlines())
+    return "\n".join(line for line in lines if line)
+
+def _match(tag, class_attr):
+    """Return the fields an element with this tag and class attribute holds"""
+    rules = RULES_BY_TAG.get(tag)
+    if not rules or not class_attr:
+        return ()
+
+    classes = class_attr.split()
+    return tuple(field_name for field_name, fragment in rules
+                 if any(fragment in cls for cls in classes))
+
+class _Collector:
+    """Accumulate matched field text in document order"""
+    def __init__(self, job_id):
+        self.posting = JobPosting(job_id=job_id)
+        self.company_name = None
+        self.pending_header = None
+
+    def add(self, field_name, text):
+        text = _clean_lines(text) if field_name == 'description' else text.strip()
+        posting = self.posting
+
+        if field_name == 'criteria_header':
+            self.pending_header = text
+        elif field_name == 'criteria_text':
+            if self.pending_header is not None:
+                posting.criteria[self.pending_header] = text
+                self.pending_header = None
+        elif field_name == 'company_name':
+            if self.company_name is None:
+                self.company_name = text
+        elif getattr(posting, field_name) is None:
+            # Like BeautifulSoup's find(), the first match wins
+            setattr(posting, field_name, text)
+
+    def result(self):
+        if self.posting.company is None:
+            self.posting.company = self.company_name
+        return self.posting
+
+class _StreamingPostingParser(HTMLParser):
+    """Single-pass parser built on the standard library tokenizer"""
+    def __init__(self, collector):
+        super().__init__(convert_charrefs=True)
+        self.collector = collector
+        self.open_fields = []  # [field, tag, depth, text parts]
+
+    def handle_starttag(self, tag, attrs):
+        for capture in self.open_fields:
+            if capture[1] == tag:
+                capture[2] += 1
+            if tag in BLOCK_TAGS:
+                capture[3].append("\n")
+
+        for field_name in _match(tag, dict(attrs).get('class')):
+            self.open_fields.append([field_name, tag, 1, []])
+
+    def handle_endtag(self, tag):
+        for capture in list(self.open_fields):
+            if tag in BLOCK_TAGS:
+                capture[3].append("\n")
+            if capture[1] != tag:
+                continue
+            capture[2] -= 1
+            if capture[2] == 0:
+                self.open_fields.remove(capture)
+                self.collector.add(capture[0], "".join(capture[3]))
+
+    def handle_data(self, data):
+        for capture in self.open_fields:
+            capture[3].append(data)
+
+def _parse_stdlib(html, job_id):
+    collector = _Collector(job_id)
+    parser = _StreamingPostingParser(collector)
+    parser.feed(html)
+    parser.close()
+    return collector.result()
+
+def _lxml_text(element, parts):
+    """Text of an lxml element with a line break around each block element"""
+    block = element.tag in BLOCK_TAGS
+    if block:
+        parts.append("\n")
+    if isinstance(element.tag, str) and element.text:
+        parts.append(element.text)
+    for child in element:
+        _lxml_text(child, parts)
+        if child.tail:
+            parts.append(child.tail)
+    if block:
+        parts.append("\n")
+    return parts
+
+def _parse_lxml(html, job_id):
+    collector = _Collector(job_id)
+    root = lxml.html.fromstring(html)
+    for element in root.iter():
+        if not isinstance(element.tag, str):
+            continue
+        fields = _match(element.tag, element.get('class'))
+        if fields:
+            text = element.text_content()
+            for field_name in fields:
+                collector.add(field_name, "".join(_lxml_text(element, [])) if field_name == 'description' else text)
+    return collector.result()
+
+def _selectolax_text(node, parts):
+    """Text of a selectolax node with a line break around each block element"""
+    for child in node.iter(include_text=True):
+        if child.tag == '-text':
+            parts.append(child.text_content)
+            continue
+        block = child.tag in BLOCK_TAGS
+        if block:
+            parts.append("\n")
+        _selectolax_text(child, parts)
+        if block:
+            parts.append("\n")
+    return parts
+
+def _parse_selectolax(html, job_id):
+    collector = _Collector(job_id)
+    tree = SelectolaxParser(html)
+    for node in tree.root.traverse():
+        fields = _match(node.tag, node.attributes.get('class'))
+        if fields:
+            text = node.text(deep=True)
+            for field_name in fields:
+                collector.add(field_name, "".join(_selectolax_text(node, [])) if field_name == 'description' else text)
+    return collector.result()
+
+BACKENDS = {'html.parser': _parse_stdlib}
+if lxml is not None:
+    BACKENDS['lxml'] = _parse_lxml
+if SelectolaxParser is not None:
+    BACKENDS['selectolax'] = _parse_selectolax
+
+# Fastest installed backend first
+DEFAULT_BACKEND = next(name for name in ('selectolax', 'lxml', 'html.parser') if name in BACKENDS)
+
+def parse_job_posting(html, job_id=None, backend=None):
+    """Parse a job posting page in a single traversal and return a JobPosting"""
+    backend = backend or DEFAULT_BACKEND
+    if backend not in BACKENDS:
+        raise ValueError(f"Parser backend '{backend}' is not available (installed: {', '.join(BACKENDS)})")
+    return BACKENDS[backend](html, job_id)
@@ -0,0 +1,173 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import requests
+from requests.structures import CaseInsensitiveDict
+
+DEFAULT_CACHE_DIR = "job_tracker/http_cache"
+
+# Response headers worth keeping: validators for revalidation and what's needed to decode the body
+KEPT_HEADERS = ('Content-Type', 'ETag', 'Last-Modified', 'Cache-Control', 'Date')
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    url TEXT PRIMARY KEY,
+    digest TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    headers TEXT NOT NULL,
+    stored_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_responses_digest ON responses(digest);
+CREATE INDEX IF NOT EXISTS idx_responses_accessed ON responses(accessed_at);
+"""
+
+class OfflineCacheMiss(requests.ConnectionError):
+    """Raised in offline mode when a URL has never been cached"""
+
+class ResponseCache:
+    """On-disk cache of successful GET responses
+
+    Bodies are stored once per SHA-256 digest under objects/, so identical pages share a file;
+    an SQLite index maps each URL to its body and validators. When the bodies exceed max_bytes
+    the least recently used URLs are dropped first.
+    """
+    def __init__(self, directory=DEFAULT_CACHE_DIR, max_bytes=200 * 1024 * 1024, fresh_for=0, offline=False):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.fresh_for = fresh_for  # Seconds a cached page is served without asking the server
+        self.offline = offline      # Serve only from the cache, never touch the network
+        os.makedirs(os.path.join(directory, "objects"), exist_ok=True)
+
+        self.conn = sqlite3.connect(os.path.join(directory, "index.db"), check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.lock = threading.Lock()
+        with self.lock, self.conn:
+            self.conn.executescript(SCHEMA)
+        self.total_bytes = self._stored_bytes()
+        self.stats = {'hits': 0, 'revalidated': 0, 'misses': 0, 'stored': 0, 'evicted': 0}
+        with self.lock, self.conn:
+            self._evict()
+
+    def _stored_bytes(self):
+        row = self.conn.execute("SELECT SUM(size) FROM (SELECT DISTINCT digest, size FROM responses)").fetchone()
+        return row[0] or 0
+
+    def _object_path(self, digest):
+        return os.path.join(self.directory, "objects", digest[:2], digest)
+
+    def lookup(self, url):
+        """Return the cache entry for a URL as a dict, or None"""
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT digest, size, headers, stored_at FROM responses WHERE url = ?", (url,)).fetchone()
+        if row is None:
+            return None
+        return {'url': url, 'digest': row[0], 'size': row[1], 'headers': json.loads(row[2]), 'stored_at': row[3]}
+
+    def is_fresh(self, entry):
+        return self.fresh_for > 0 and time.time() - entry['stored_at'] < self.fresh_for
+
+    def conditional_headers(self, entry):
+        """If-None-Match / If-Modified-Since headers for revalidating an entry"""
+        headers = {}
+        if entry['headers'].get('ETag'):
+            headers['If-None-Match'] = entry['headers']['ETag']
+        if entry['headers'].get('Last-Modified'):
+            headers['If-Modified-Since'] = entry['headers']['Last-Modified']
+        return headers
+
+    def response(self, entry, revalidated=False):
+        """Rebuild a requests.Response from a cache entry, or None if its body is gone"""
+        try:
+            with open(self._object_path(entry['digest']), 'rb') as f:
+                content = f.read()
+        except OSError:
+            return None
+
+        with self.lock, self.conn:
+            self.conn.execute("UPDATE responses SET accessed_at = ? WHERE url = ?", (time.time(), entry['url']))
+            self.stats['revalidated' if revalidated else 'hits'] += 1
+
+        response = requests.Response()
+        response.status_code = 200
+        response.reason = 'OK'
+        response.url = entry['url']
+        response.headers = CaseInsensitiveDict(entry['headers'])
+        response._content = content
+        response.encoding = requests.utils.get_encoding_from_headers(response.headers) or 'utf-8'
+        response.from_cache = True
+        return response
+
+    def store(self, url, response):
+        """Save a 200 response body and its validators"""
+        content = response.content
+        digest = hashlib.sha256(content).hexdigest()
+        path = self._object_path(digest)
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            temp_path = f"{path}.{threading.get_ident()}.tmp"
+            with open(temp_path, 'wb') as f:
+                f.write(content)
+            os.replace(temp_path, path)
+
+        headers = {name: response.headers[name] for name in KEPT_HEADERS if name in response.headers}
+        now = time.time()
+        with self.lock, self.conn:
+            old = self.conn.execute("SELECT digest FROM responses WHERE url = ?", (url,)).fetchone()
+            new_object = not self._referenced(digest)
+            self.conn.execute(
+                "INSERT OR REPLACE INTO responses (url, digest, size, headers, stored_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (url, digest, len(content), json.dumps(headers), now, now)
+            )
+            if new_object:
+                self.total_bytes += len(content)
+            if old and old[0] != digest:
+                self._drop_if_unreferenced(old[0])
+            self.stats['stored'] += 1
+            self._evict()
+
+    def _referenced(self, digest):
+        return self.conn.execute("SELECT 1 FROM responses WHERE digest = ? LIMIT 1", (digest,)).fetchone() is not None
+
+    def _drop_if_unreferenced(self, digest):
+        if self._referenced(digest):
+            return
+        path = self._object_path(digest)
+        try:
+            self.total_bytes -= os.path.getsize(path)
+            os.remove(path)
+        except OSError:
+            pass
+
+    def _evict(self):
+        """Drop least recently used URLs until the bodies fit in max_bytes"""
+        while self.total_bytes > self.max_bytes:
+            row = self.conn.execute(
+                "SELECT url, digest FROM responses ORDER BY accessed_at LIMIT 1").fetchone()
+            if row is None:
+                break
+            self.conn.execute("DELETE FROM responses WHERE url = ?", (row[0],))
+            self._drop_if_unreferenced(row[1])
+            self.stats['evicted'] += 1
+
+    def record_miss(self):
+        with self.lock:
+            self.stats['misses'] += 1
+
+    def count(self):
+        with self.lock:
+            return self.conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    def print_stats(self):
+        stats = self.stats
+        print(f"HTTP cache: {stats['hits']} hits, {stats['revalidated']} revalidated (304), "
+              f"{stats['misses']} misses, {stats['stored']} stored, {stats['evicted']} evicted, "
+              f"{self.total_bytes / 1e6:.1f} MB on disk")
+
+    def close(self):
+        self.conn.close()
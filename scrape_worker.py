@@ -0,0 +1,79 @@
+import queue
+import threading
+from dataclasses import dataclass
+from typing import Optional
+
+@dataclass
+class ScrapeEvent:
+    """One progress update from a background scrape"""
+    kind: str  # 'page', 'job', 'done' or 'error'
+    page: int = 0
+    pages: int = 0
+    jobs_found: int = 0
+    jobs_done: int = 0
+    job: Optional[dict] = None
+    message: Optional[str] = None
+
+class ScrapeWorker:
+    """Runs a LinkedInJobTracker or BatchSearch on a background thread
+
+    Progress is reported as ScrapeEvents on a thread-safe queue, so a Tk app can drain it
+    from root.after() without ever blocking its main loop.
+    """
+    def __init__(self, tracker, num_pages=3, max_age_days=None):
+        self.tracker = tracker  # A LinkedInJobTracker or a BatchSearch
+        self.num_pages = num_pages
+        self.total_pages = num_pages * len(getattr(tracker, 'queries', [None]))
+        self.max_age_days = max_age_days
+        self.events = queue.Queue()
+        self.thread = None
+        self.jobs_found = 0
+
+    def start(self):
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+        return self
+
+    def _on_page(self, page, page_ids):
+        self.jobs_found += len(page_ids)
+        self.events.put(ScrapeEvent('page', page=page, pages=self.total_pages, jobs_found=self.jobs_found))
+
+    def _run(self):
+        done = 0
+        try:
+            for job in self.tracker.iter_jobs(self.num_pages, self.max_age_days, on_page=self._on_page):
+                done += 1
+                self.events.put(ScrapeEvent('job', pages=self.total_pages, jobs_found=self.jobs_found,
+                                            jobs_done=done, job=job))
+            message = "Cancelled" if self.tracker.cancelled else None
+            self.events.put(ScrapeEvent('done', pages=self.total_pages, jobs_found=self.jobs_found,
+                                        jobs_done=done, message=message))
+        except Exception as e:
+            self.events.put(ScrapeEvent('error', jobs_done=done, message=str(e)))
+
+    def poll(self, limit=100):
+        """Return up to limit pending events without blocking"""
+        events = []
+        while len(events) < limit:
+            try:
+                events.append(self.events.get_nowait())
+            except queue.Empty:
+                break
+        return events
+
+    @property
+    def running(self):
+        return self.thread is not None and self.thread.is_alive()
+
+    def cancel(self):
+        self.tracker.cancel()
+
+    def pause(self):
+        self.tracker.pause()
+
+    def resume(self):
+        self.tracker.resume()
+
+    @property
+    def paused(self):
+        return self.tracker.paused
@@ -0,0 +1,106 @@
+import re
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+DATE = r'[A-Za-z]+\s+\d{1,2}(?:st|nd|rd|th)?[\s,]+\d{4}'
+# Names stay case-sensitive so "contact us at ..." isn't read as a person
+NAME = r'(?-i:[A-Z][a-z]+(?:[ \t]+[A-Z][a-z]+){1,2})'
+AMOUNT = r'\s?\d{1,3}(?:,\d{3})*(?:\.\d+)?\s?k?'
+
+# One alternation covering every field. The leading character class lets the regex engine
+# skip straight to positions where some field can start; the one-character lookbehind in
+# each branch then checks which field that is. Each branch closes its own named group last,
+# so match.lastgroup says which field matched.
+DESCRIPTION_PATTERN = re.compile(
+    rf'''
+    [@$acdehrsw](?:
+        (?<=@)(?P<email_domain>[A-Za-z0-9.-]+\.[A-Za-z]{{2,}})\b
+      | (?<=\$)(?P<salary>{AMOUNT}(?:\s*(?:-|–|to)\s*\${AMOUNT})?(?:\s*(?:per|/|an?)\s*(?:year|yr|annum|hour|hr))?)
+      | (?<=\b[acd])(?P<deadline_label>pplication\s+deadline|pply\s+by|losing\s+date|pplications\s+close
+            |eadline|pplications\s+due)[:\s]*(?P<deadline>{DATE})
+      | (?<=\b[cers])(?P<contact_trigger>ontact|each\s+out\s+to|mail
+            |end(?=[^.\n]{{0,80}}?\bresume\b)[^.\n]{{0,80}}?\bto)\s+(?P<contact>{NAME})
+      | (?<=\bh)(?P<hybrid>ybrid)\b
+      | (?<=\b[rw])(?P<remote>emote|ork\s+from\s+home|fh)\b
+    )
+    ''',
+    re.IGNORECASE | re.VERBOSE
+)
+
+# The local part of an email address, read backwards from the '@'
+EMAIL_LOCAL_PART = re.compile(r'[A-Za-z0-9._%+-]+\Z')
+
+# Earlier labels win when a description matches several, as the old pattern lists did
+DEADLINE_LABELS = ('application deadline', 'apply by', 'closing date', 'applications close',
+                   'deadline', 'applications due')
+CONTACT_TRIGGERS = ('contact', 'reach out to', 'email', 'send')
+
+@dataclass
+class DescriptionFields:
+    """Everything pulled from one job description"""
+    deadline: Optional[str] = None
+    contact_person: Optional[str] = None
+    emails: List[str] = field(default_factory=list)
+    salary: Optional[str] = None
+    remote: bool = False
+    hybrid: bool = False
+
+    @property
+    def email(self):
+        """The first email address in the description"""
+        return self.emails[0] if self.emails else None
+
+    @property
+    def work_mode(self):
+        """'Hybrid', 'Remote' or None, based on what the description mentions"""
+        if self.hybrid:
+            return 'Hybrid'
+        if self.remote:
+            return 'Remote'
+        return None
+
+def _rank(text, start, end, labels):
+    """Position of the label found at text[start:end] in a priority list"""
+    label = ' '.join(text[start:end].lower().split())
+    for rank, known in enumerate(labels):
+        if label.startswith(known):
+            return rank
+    return len(labels)
+
+def extract_description_fields(text):
+    """Scan a description once and return deadline, contact, emails, salary and work mode"""
+    result = DescriptionFields()
+    if not text:
+        return result
+
+    deadline_rank = contact_rank = None
+    seen_emails = set()
+    for match in DESCRIPTION_PATTERN.finditer(text):
+        kind = match.lastgroup
+
+        if kind == 'email_domain':
+            at = match.start()
+            local = EMAIL_LOCAL_PART.search(text, max(0, at - 64), at)
+            if local:
+                email = local.group().lstrip('._%+-') + '@' + match.group('email_domain')
+                if email.lower() not in seen_emails and not email.startswith('@'):
+                    seen_emails.add(email.lower())
+                    result.emails.append(email)
+        elif kind == 'deadline':
+            # The label's first letter is the character consumed before the branch
+            rank = _rank(text, match.start(), match.end('deadline_label'), DEADLINE_LABELS)
+            if deadline_rank is None or rank < deadline_rank:
+                result.deadline, deadline_rank = match.group('deadline'), rank
+        elif kind == 'contact':
+            rank = _rank(text, match.start(), match.end('contact_trigger'), CONTACT_TRIGGERS)
+            if contact_rank is None or rank < contact_rank:
+                result.contact_person, contact_rank = match.group('contact'), rank
+        elif kind == 'salary':
+            if result.salary is None:
+                result.salary = match.group().strip()
+        elif kind == 'hybrid':
+            result.hybrid = True
+        elif kind == 'remote':
+            result.remote = True
+
+    return result
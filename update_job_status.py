@@ -1,89 +1,66 @@
-import pandas as pd
-import os
-import glob
 from datetime import datetime
+from job_store import open_store
+from posting_dates import posting_ages
 
-def get_latest_job_file():
-    """Get the most recent job tracking CSV file"""
-    files = glob.glob("job_tracker/data/*.csv")
-    if not files:
-        print("No job tracking files found.")
-        return None
-    
-    # Sort files by modification time (newest first)
-    latest_file = max(files, key=os.path.getmtime)
-    return latest_file
-
-def update_job_status(job_id, status, date_applied=None, resume_link=None, notes=None):
-    """Update the status and other information for a specific job"""
-    file_path = get_latest_job_file()
-    if not file_path:
-        return False
+def update_job_status(job_id, status, date_applied=None, resume_link=None, notes=None, store=None):
+    """Update the status and other information for a job, or for a list of jobs at once"""
+    job_ids = [job_id] if isinstance(job_id, (str, int)) else list(job_id)
     
     try:
-        # Load the CSV file
-        df = pd.read_csv(file_path)
-        
-        # Find the job by ID
-        if job_id not in df['job_id'].values:
-            print(f"Job ID {job_id} not found in the file.")
-            return False
+        store = store or open_store()
         
         # Update the job information
-        df.loc[df['job_id'] == job_id, 'status'] = status
+        fields = {'status': status}
         
         if date_applied:
-            df.loc[df['job_id'] == job_id, 'date_applied'] = date_applied
+            fields['date_applied'] = date_applied
         else:
             # If status is 'Applied' and no date is provided, use today's date
             if status == 'Applied':
-                df.loc[df['job_id'] == job_id, 'date_applied'] = datetime.now().strftime("%Y-%m-%d")
+                fields['date_applied'] = datetime.now().strftime("%Y-%m-%d")
         
         if resume_link:
-            df.loc[df['job_id'] == job_id, 'resume_link'] = resume_link
-        
-        # Add notes column if it doesn't exist
-        if notes and 'notes' not in df.columns:
-            df['notes'] = None
+            fields['resume_link'] = resume_link
         
         if notes:
-            df.loc[df['job_id'] == job_id, 'notes'] = notes
+            fields['notes'] = notes
+        
+        updated = store.update_jobs(job_ids, **fields)
+        if not updated:
+            print(f"Job ID {', '.join(map(str, job_ids))} not found in the job store.")
+            return False
         
-        # Save the updated file
-        df.to_csv(file_path, index=False)
-        print(f"Updated job {job_id} status to '{status}'")
+        if len(job_ids) == 1:
+            print(f"Updated job {job_ids[0]} status to '{status}'")
+        else:
+            print(f"Updated {updated} of {len(job_ids)} jobs to status '{status}'")
         return True
     
     except Exception as e:
         print(f"Error updating job status: {e}")
         return False
 
-def list_jobs(status=None):
-    """List jobs, optionally filtered by status"""
-    file_path = get_latest_job_file()
-    if not file_path:
-        return
-    
+def list_jobs(status=None, store=None, max_age_days=None):
+    """List jobs, optionally filtered by status and by how many days ago they were posted"""
     try:
-        # Load the CSV file
-        df = pd.read_csv(file_path)
+        store = store or open_store()
         
         # Filter by status if provided
-        if status:
-            filtered_df = df[df['status'] == status]
-        else:
-            filtered_df = df
+        display_columns = ['job_id', 'company', 'job_title', 'status', 'date_applied', 'type', 'email']
+        filtered_df = store.load_dataframe(status=status, columns=display_columns + ['time_posted', 'posting_date'])
+        
+        # Filter by age if provided
+        if max_age_days is not None:
+            filtered_df = filtered_df[posting_ages(filtered_df) <= max_age_days]
+        filtered_df = filtered_df[display_columns]
         
         if filtered_df.empty:
             print(f"No jobs found{' with status ' + status if status else ''}.")
             return
         
         # Display jobs
-        display_columns = ['job_id', 'company', 'job_title', 'status', 'date_applied', 'type', 'email']
-        display_columns = [col for col in display_columns if col in filtered_df.columns]
-        
         print(f"\nJobs{' with status ' + status if status else ''}:")
-        print(filtered_df[display_columns])
+        print(filtered_df)
         print(f"\nTotal: {len(filtered_df)} jobs")
     
     except Exception as e:
@@ -95,8 +72,9 @@ if __name__ == "__main__":
     print("1. List all jobs")
     print("2. List jobs by status")
     print("3. Update job status")
+    print("4. List jobs posted recently")
     
-    choice = input("Enter your choice (1-3): ")
+    choice = input("Enter your choice (1-4): ")
     
     if choice == '1':
         list_jobs()
@@ -106,7 +84,8 @@ if __name__ == "__main__":
         list_jobs(status)
     
     elif choice == '3':
-        job_id = input("Enter job ID to update: ")
+        job_ids = input("Enter job ID(s) to update (comma-separated for several): ")
+        job_ids = [job_id.strip() for job_id in job_ids.split(',') if job_id.strip()]
         print("\nSelect new status:")
         print("1. Applied")
         print("2. Interview Scheduled")
@@ -132,7 +111,11 @@ if __name__ == "__main__":
         resume_link = input("Enter resume link (optional): ")
         notes = input("Enter any notes (optional): ")
         
-        update_job_status(job_id, status, date_applied, resume_link, notes)
+        update_job_status(job_ids, status, date_applied, resume_link, notes)
+    
+    elif choice == '4':
+        days = input("Show jobs posted within how many days? ")
+        list_jobs(max_age_days=int(days))
     
     else:
         print("Invalid choice.")
\ No newline at end of file
@@ -0,0 +1,489 @@
+import json
+import os
+import threading
+import numpy as np
+
+# hnswlib is optional; only the HNSW backend needs it
+try:
+    import hnswlib
+except ImportError:
+    hnswlib = None
+
+BACKENDS = ('exact', 'ivf', 'hnsw')
+SPACES = ('l2', 'cosine')
+
+# Query rows scored per matrix product in exact search
+QUERY_CHUNK = 1024
+
+def _as_list(value):
+    if value is None:
+        return None
+    if isinstance(value, (str, dict)):
+        return [value]
+    return list(value)
+
+def _extended(buffer, used, rows):
+    """buffer with rows written after its first used rows, reallocated at double the size when
+    full so that a run of appends costs amortized O(1) per row instead of a copy each time
+    """
+    needed = used + len(rows)
+    if needed > len(buffer):
+        grown = np.empty((max(needed, 2 * len(buffer)),) + buffer.shape[1:], dtype=buffer.dtype)
+        grown[:used] = buffer[:used]
+        buffer = grown
+    buffer[used:needed] = rows
+    return buffer
+
+def _top_k(distances, k):
+    """Column indexes of the k smallest distances in each row, nearest first"""
+    k = min(k, distances.shape[1])
+    top = np.argpartition(distances, k - 1, axis=1)[:, :k] if k < distances.shape[1] else \
+        np.broadcast_to(np.arange(distances.shape[1]), distances.shape)
+    order = np.argsort(np.take_along_axis(distances, top, axis=1), axis=1, kind='stable')
+    return np.take_along_axis(top, order, axis=1)
+
+class ExactBackend:
+    """Brute-force search over every live vector: exact, and fast enough for tens of thousands of vectors"""
+    name = 'exact'
+
+    def __init__(self, index):
+        self.index = index
+
+    def add(self, slots):
+        pass
+
+    def remove(self, slots):
+        pass
+
+    def search(self, queries, k):
+        slots, distances = [], []
+        for start in range(0, len(queries), QUERY_CHUNK):
+            chunk = self.index.distances(queries[start:start + QUERY_CHUNK])
+            chunk[:, ~self.index.live] = np.inf
+            top = _top_k(chunk, k)
+            slots.append(top)
+            distances.append(np.take_along_axis(chunk, top, axis=1))
+        return np.vstack(slots), np.vstack(distances)
+
+    def save(self):
+        pass
+
+class IVFBackend:
+    """Inverted-file index: k-means lists, searching only the nprobe lists nearest each query
+
+    Lists are trained on the first search or persist() and new vectors join their nearest list;
+    the index is retrained once the collection has grown fourfold since training.
+    """
+    name = 'ivf'
+
+    def __init__(self, index, nlist=None, nprobe=8, iterations=10):
+        self.index = index
+        self.nlist = nlist
+        self.nprobe = nprobe
+        self.iterations = iterations
+        self.centroids = None
+        self.assignments = np.empty(0, dtype=np.int32)
+        self.trained_size = 0
+        self._lists = None
+        self._load()
+
+    def _path(self):
+        return self.index.path and os.path.join(self.index.path, "ivf.npz")
+
+    def _load(self):
+        if self._path() and os.path.exists(self._path()):
+            with np.load(self._path()) as data:
+                self.centroids = data['centroids']
+                self.assignments = data['assignments'][:self.index.slots]
+                self.trained_size = int(data['trained_size'])
+
+    def _nearest_list(self, vectors):
+        distances = ((vectors ** 2).sum(axis=1, keepdims=True) - 2 * vectors @ self.centroids.T
+                     + (self.centroids ** 2).sum(axis=1))
+        return distances.argmin(axis=1).astype(np.int32)
+
+    def _train(self):
+        live = np.flatnonzero(self.index.live)
+        # 4 * sqrt(n) lists, but at least 39 vectors per list so k-means has something to fit;
+        # a collection as small as the portfolio ends up with one list, i.e. exact search
+        nlist = self.nlist or max(1, min(int(4 * np.sqrt(len(live))), len(live) // 39))
+        nlist = min(nlist, len(live))
+        rng = np.random.default_rng(0)
+        sample = self.index.vectors[rng.choice(live, min(len(live), 256 * nlist), replace=False)]
+        centroids = sample[rng.choice(len(sample), nlist, replace=False)].copy()
+        for _ in range(self.iterations):
+            self.centroids = centroids
+            assigned = self._nearest_list(sample)
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, assigned, sample)
+            counts = np.bincount(assigned, minlength=nlist)[:, None]
+            # Empty lists keep their previous centroid
+            centroids = np.where(counts > 0, sums / np.maximum(counts, 1), centroids).astype(np.float32)
+        self.centroids = centroids
+        self.assignments = self._nearest_list(np.asarray(self.index.vectors))
+        self.trained_size = len(live)
+        self._lists = None
+
+    def add(self, slots):
+        if self.centroids is not None:
+            missing = np.arange(len(self.assignments), self.index.slots)
+            if len(missing):
+                self.assignments = np.concatenate([self.assignments, self._nearest_list(self.index.vectors[missing])])
+            self._lists = None
+
+    def remove(self, slots):
+        pass
+
+    def _inverted_lists(self):
+        if self._lists is None:
+            order = np.argsort(self.assignments, kind='stable')
+            bounds = np.searchsorted(self.assignments[order], np.arange(len(self.centroids) + 1))
+            self._lists = (order, bounds)
+        return self._lists
+
+    def search(self, queries, k):
+        live_count = int(self.index.live.sum())
+        if self.centroids is None or live_count > 4 * self.trained_size:
+            self._train()
+        elif len(self.assignments) < self.index.slots:
+            self.add(None)
+        order, bounds = self._inverted_lists()
+        probes = _top_k(((queries ** 2).sum(axis=1, keepdims=True) - 2 * queries @ self.centroids.T
+                         + (self.centroids ** 2).sum(axis=1)), self.nprobe)
+
+        slots = np.full((len(queries), k), -1, dtype=np.int64)
+        distances = np.full((len(queries), k), np.inf, dtype=np.float32)
+        for row, lists in enumerate(probes):
+            candidates = np.concatenate([order[bounds[i]:bounds[i + 1]] for i in lists])
+            candidates = candidates[self.index.live[candidates]]
+            if not len(candidates):
+                continue
+            found = self.index.distances(queries[row:row + 1], candidates)
+            top = _top_k(found, k)[0]
+            slots[row, :len(top)] = candidates[top]
+            distances[row, :len(top)] = found[0, top]
+        return slots, distances
+
+    def save(self):
+        if self.centroids is None and self.index.live.any():
+            self._train()
+        if self._path() and self.centroids is not None:
+            np.savez(self._path(), centroids=self.centroids, assignments=self.assignments,
+                     trained_size=self.trained_size)
+
+class HNSWBackend:
+    """Approximate search with an hnswlib graph; needs pip install hnswlib"""
+    name = 'hnsw'
+
+    def __init__(self, index, M=16, ef_construction=200, ef_search=64):
+        if hnswlib is None:
+            raise RuntimeError("The HNSW backend needs hnswlib: pip install hnswlib")
+        self.index = index
+        self.M = M
+        self.ef_construction = ef_construction
+        self.ef_search = ef_search
+        self.graph = None
+        self.covered = 0  # Slots already in the graph
+        self._load()
+
+    def _path(self):
+        return self.index.path and os.path.join(self.index.path, "hnsw.bin")
+
+    def _create(self, capacity):
+        self.graph = hnswlib.Index(space='l2' if self.index.space == 'l2' else 'cosine', dim=self.index.dim)
+        self.graph.init_index(max_elements=max(capacity, 1024), ef_construction=self.ef_construction, M=self.M)
+        self.graph.set_ef(self.ef_search)
+
+    def _load(self):
+        if not (self._path() and os.path.exists(self._path()) and self.index.dim):
+            return
+        self.graph = hnswlib.Index(space='l2' if self.index.space == 'l2' else 'cosine', dim=self.index.dim)
+        self.graph.load_index(self._path(), max_elements=max(self.index.slots, 1024))
+        self.graph.set_ef(self.ef_search)
+        self.covered = self.graph.get_current_count()
+        deleted = set(self.graph.get_ids_list()) - set(np.flatnonzero(self.index.live[:self.covered]).tolist())
+        self.remove(deleted)
+
+    def add(self, slots):
+        if self.index.dim is None or self.covered >= self.index.slots:
+            return
+        if self.graph is None:
+            self._create(self.index.slots * 2)
+        elif self.index.slots > self.graph.get_max_elements():
+            self.graph.resize_index(self.index.slots * 2)
+        new = np.arange(self.covered, self.index.slots)
+        self.graph.add_items(np.asarray(self.index.vectors[new]), new)
+        self.covered = self.index.slots
+        self.remove(new[~self.index.live[new]])
+
+    def remove(self, slots):
+        if self.graph is None:
+            return
+        for slot in slots:
+            if slot < self.covered:
+                try:
+                    self.graph.mark_deleted(int(slot))
+                except RuntimeError:
+                    pass  # Already deleted
+
+    def search(self, queries, k):
+        self.add(None)
+        live_count = int(self.index.live.sum())
+        k = min(k, live_count)
+        self.graph.set_ef(max(self.ef_search, k))
+        slots, distances = self.graph.knn_query(queries, k=k)
+        return slots.astype(np.int64), distances
+
+    def save(self):
+        self.add(None)
+        if self._path() and self.graph is not None:
+            self.graph.save_index(self._path())
+
+class VectorIndex:
+    """In-process vector collection with the add/upsert/get/query/delete surface of a Chroma collection
+
+    Vectors live in one float32 matrix (vectors.f32, memory-mapped when loaded) and records in an
+    append-only log (records.jsonl), so writes cost only what they add. Deleted and replaced rows
+    stay in the matrix as dead slots until compact() rewrites both files. Distances follow
+    Chroma: squared L2 by default, or 1 - cosine similarity.
+
+    The search backend is chosen by name: 'exact' (brute force), 'ivf' (inverted lists, pure
+    NumPy) or 'hnsw' (hnswlib). The ANN structures are derived data saved by persist(), and
+    rebuilt or extended on load when missing or behind the log.
+    """
+    def __init__(self, path=None, embedding_function=None, backend='exact', space='l2', **backend_options):
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown vector index backend {backend!r}; expected one of {', '.join(BACKENDS)}")
+        if space not in SPACES:
+            raise ValueError(f"Unknown distance {space!r}; expected one of {', '.join(SPACES)}")
+        self.path = path
+        self.embedding_function = embedding_function
+        self.space = space
+        self.lock = threading.RLock()
+        self.dim = None
+        self.vectors = np.empty((0, 0), dtype=np.float32)
+        self.live = np.empty(0, dtype=bool)
+        self.slot_ids = []      # slot -> ID (kept for dead slots too)
+        self.records = {}       # ID -> (slot, document, metadata)
+        if path:
+            os.makedirs(path, exist_ok=True)
+            self._load()
+        self._norms = (self.vectors ** 2).sum(axis=1) if self.dim else np.empty(0, dtype=np.float32)
+        # vectors, _norms and live are views of the first `slots` rows of these, which have spare
+        # room at the end; a memory-mapped matrix is re-mapped after each write instead
+        self._vector_buffer, self._norm_buffer, self._live_buffer = self.vectors, self._norms, self.live
+        self.backend = {'exact': ExactBackend, 'ivf': IVFBackend, 'hnsw': HNSWBackend}[backend](self, **backend_options)
+
+    @property
+    def slots(self):
+        return len(self.slot_ids)
+
+    def _file(self, name):
+        return os.path.join(self.path, name)
+
+    def _load(self):
+        if os.path.exists(self._file("meta.json")):
+            with open(self._file("meta.json")) as f:
+                meta = json.load(f)
+            self.dim, self.space = meta['dim'], meta['space']
+        if not os.path.exists(self._file("records.jsonl")):
+            return
+        with open(self._file("records.jsonl"), encoding='utf-8') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    break  # A write cut short by a crash; everything before it is intact
+                self._apply(record)
+        rows = len(self.slot_ids)
+        if rows and self.dim:
+            if os.path.getsize(self._file("vectors.f32")) < rows * 4 * self.dim:
+                raise ValueError(f"{self._file('vectors.f32')} is shorter than its record log")
+            self.vectors = self._map_vectors()
+        self.live = np.zeros(rows, dtype=bool)
+        self.live[[slot for slot, _, _ in self.records.values()]] = True
+
+    def _map_vectors(self):
+        """Memory-map the first `slots` rows of vectors.f32"""
+        return np.memmap(self._file("vectors.f32"), dtype=np.float32, mode='r', shape=(self.slots, self.dim))
+
+    def _apply(self, record):
+        if record['op'] == 'put':
+            self.records[record['id']] = (record['slot'], record.get('document'), record.get('metadata'))
+            if record['slot'] == len(self.slot_ids):
+                self.slot_ids.append(record['id'])
+        else:
+            self.records.pop(record['id'], None)
+
+    def _append_log(self, records):
+        if not self.path:
+            return
+        with open(self._file("records.jsonl"), 'a', encoding='utf-8') as f:
+            f.write("".join(json.dumps(record, ensure_ascii=False) + "\n" for record in records))
+
+    def _embed(self, embeddings, documents):
+        if embeddings is not None:
+            # A single flat vector is one row
+            return np.atleast_2d(np.asarray(embeddings, dtype=np.float32))
+        if documents is None or self.embedding_function is None:
+            raise ValueError("Pass embeddings, or documents together with an embedding_function")
+        return np.asarray(self.embedding_function(documents), dtype=np.float32)
+
+    def distances(self, queries, slots=None):
+        """Distances from each query to the given slots (all slots if None)"""
+        vectors = self.vectors if slots is None else self.vectors[slots]
+        norms = self._norms if slots is None else self._norms[slots]
+        if self.space == 'l2':
+            return np.maximum((queries ** 2).sum(axis=1, keepdims=True) - 2 * queries @ vectors.T + norms, 0)
+        query_norms = np.linalg.norm(queries, axis=1, keepdims=True)
+        similarity = (queries @ vectors.T) / np.maximum(query_norms * np.sqrt(norms), 1e-12)
+        return 1 - similarity
+
+    # Chroma-style collection API
+
+    def count(self):
+        return len(self.records)
+
+    def upsert(self, ids, embeddings=None, documents=None, metadatas=None):
+        """Insert or replace records; vectors come from embeddings or from embedding the documents"""
+        ids = _as_list(ids)
+        documents = _as_list(documents)
+        metadatas = _as_list(metadatas)
+        vectors = self._embed(embeddings, documents)
+        if len(vectors) != len(ids):
+            raise ValueError(f"Got {len(ids)} IDs but {len(vectors)} embeddings")
+        with self.lock:
+            if self.dim is None:
+                self.dim = vectors.shape[1]
+                self.vectors = self._vector_buffer = np.empty((0, self.dim), dtype=np.float32)
+                if self.path:
+                    with open(self._file("meta.json"), 'w') as f:
+                        json.dump({'dim': self.dim, 'space': self.space}, f)
+            elif vectors.shape[1] != self.dim:
+                raise ValueError(f"Expected {self.dim}-dimensional embeddings, got {vectors.shape[1]}")
+
+            replaced = [self.records[doc_id][0] for doc_id in ids if doc_id in self.records]
+            start = self.slots
+            log = []
+            for offset, doc_id in enumerate(ids):
+                log.append({'op': 'put', 'id': doc_id, 'slot': start + offset,
+                            'document': documents[offset] if documents else None,
+                            'metadata': metadatas[offset] if metadatas else None})
+
+            # Vectors go to disk before the log entries that point at them
+            if self.path:
+                with open(self._file("vectors.f32"), 'r+b' if os.path.exists(self._file("vectors.f32")) else 'wb') as f:
+                    f.seek(start * 4 * self.dim)
+                    f.write(np.ascontiguousarray(vectors).tobytes())
+                    f.truncate()
+            self._append_log(log)
+
+            for record in log:
+                self._apply(record)
+            if self.path:
+                self.vectors = self._map_vectors()
+            else:
+                self._vector_buffer = _extended(self._vector_buffer, start, vectors)
+                self.vectors = self._vector_buffer[:self.slots]
+            self._norm_buffer = _extended(self._norm_buffer, start, (vectors ** 2).sum(axis=1))
+            self._norms = self._norm_buffer[:self.slots]
+            self._live_buffer = _extended(self._live_buffer, start, np.zeros(len(ids), dtype=bool))
+            self.live = self._live_buffer[:self.slots]
+            self.live[replaced] = False
+            self.live[[self.records[doc_id][0] for doc_id in ids]] = True
+            self.backend.remove(replaced)
+            self.backend.add(np.arange(start, self.slots))
+
+    def add(self, ids, embeddings=None, documents=None, metadatas=None):
+        """Insert new records; IDs that already exist are an error"""
+        existing = [doc_id for doc_id in _as_list(ids) if doc_id in self.records]
+        if existing:
+            raise ValueError(f"IDs already in the index: {', '.join(existing[:5])}")
+        self.upsert(ids, embeddings, documents, metadatas)
+
+    def delete(self, ids):
+        with self.lock:
+            ids = [doc_id for doc_id in _as_list(ids) if doc_id in self.records]
+            slots = [self.records[doc_id][0] for doc_id in ids]
+            self._append_log([{'op': 'delete', 'id': doc_id} for doc_id in ids])
+            for doc_id in ids:
+                del self.records[doc_id]
+            self.live[slots] = False
+            self.backend.remove(slots)
+
+    def get(self, ids=None, include=('documents', 'metadatas')):
+        with self.lock:
+            ids = list(self.records) if ids is None else [doc_id for doc_id in _as_list(ids) if doc_id in self.records]
+            result = {'ids': ids, 'documents': None, 'metadatas': None, 'embeddings': None}
+            if 'documents' in include:
+                result['documents'] = [self.records[doc_id][1] for doc_id in ids]
+            if 'metadatas' in include:
+                result['metadatas'] = [self.records[doc_id][2] for doc_id in ids]
+            if 'embeddings' in include:
+                result['embeddings'] = np.asarray(self.vectors[[self.records[doc_id][0] for doc_id in ids]]) \
+                    if ids else np.empty((0, self.dim or 0), dtype=np.float32)
+            return result
+
+    def query(self, query_embeddings=None, query_texts=None, n_results=10,
+              include=('documents', 'metadatas', 'distances')):
+        """The n_results nearest records for each query, as lists of lists like Chroma's query"""
+        queries = self._embed(query_embeddings, _as_list(query_texts))
+        with self.lock:
+            result = {'ids': [], 'documents': None, 'metadatas': None, 'distances': None}
+            for key in ('documents', 'metadatas', 'distances'):
+                if key in include:
+                    result[key] = []
+            if not self.records:
+                slots = np.empty((len(queries), 0), dtype=np.int64)
+                distances = np.empty((len(queries), 0), dtype=np.float32)
+            else:
+                slots, distances = self.backend.search(queries, min(n_results, len(self.records)))
+            for row_slots, row_distances in zip(slots, distances):
+                found = [(self.slot_ids[slot], distance) for slot, distance in zip(row_slots, row_distances)
+                         if slot >= 0 and np.isfinite(distance)]
+                result['ids'].append([doc_id for doc_id, _ in found])
+                if result['documents'] is not None:
+                    result['documents'].append([self.records[doc_id][1] for doc_id, _ in found])
+                if result['metadatas'] is not None:
+                    result['metadatas'].append([self.records[doc_id][2] for doc_id, _ in found])
+                if result['distances'] is not None:
+                    result['distances'].append([float(distance) for _, distance in found])
+            return result
+
+    # Maintenance
+
+    def persist(self):
+        """Build the backend's search structure if needed and save it next to the vectors"""
+        with self.lock:
+            self.backend.save()
+
+    def compact(self):
+        """Rewrite the matrix and log without dead slots"""
+        with self.lock:
+            ids = list(self.records)
+            slots = [self.records[doc_id][0] for doc_id in ids]
+            vectors = np.asarray(self.vectors[slots]) if ids else np.empty((0, self.dim or 0), dtype=np.float32)
+            records = [(doc_id, self.records[doc_id][1], self.records[doc_id][2]) for doc_id in ids]
+            if self.path:
+                vectors.tofile(self._file("vectors.f32.tmp"))
+                with open(self._file("records.jsonl.tmp"), 'w', encoding='utf-8') as f:
+                    for slot, (doc_id, document, metadata) in enumerate(records):
+                        f.write(json.dumps({'op': 'put', 'id': doc_id, 'slot': slot, 'document': document,
+                                            'metadata': metadata}, ensure_ascii=False) + "\n")
+                os.replace(self._file("vectors.f32.tmp"), self._file("vectors.f32"))
+                os.replace(self._file("records.jsonl.tmp"), self._file("records.jsonl"))
+                for name in ("ivf.npz", "hnsw.bin"):
+                    if os.path.exists(self._file(name)):
+                        os.remove(self._file(name))
+            self.slot_ids = ids
+            self.vectors = self._map_vectors() if self.path and ids else vectors
+            self._norms = (vectors ** 2).sum(axis=1)
+            self.records = {doc_id: (slot, document, metadata)
+                            for slot, (doc_id, document, metadata) in enumerate(records)}
+            self.live = np.ones(len(ids), dtype=bool)
+            self._vector_buffer, self._norm_buffer, self._live_buffer = self.vectors, self._norms, self.live
+            backend = type(self.backend)
+            options = {key: getattr(self.backend, key) for key in ('nlist', 'nprobe', 'iterations', 'M',
+                                                                   'ef_construction', 'ef_search')
+                       if hasattr(self.backend, key)}
+            self.backend = backend(self, **options)